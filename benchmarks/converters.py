@@ -0,0 +1,95 @@
+"""
+Benchmark the template-driven docstring converter against the built-in converters.
+
+Run with ``python benchmarks/converters.py`` after installing the package.
+"""
+
+from __future__ import annotations
+
+import ast
+import tempfile
+import timeit
+from pathlib import Path
+
+from docstringify.converters import (
+    GoogleDocstringConverter,
+    NumpydocDocstringConverter,
+    TemplateDocstringConverter,
+    load_template_converter,
+)
+from docstringify.nodes.base import DocstringNode
+from docstringify.nodes.function import FunctionDocstringNode
+
+SOURCE = '\n'.join(
+    f'def function_{i}(a: int, b: str = "x", *args: float, c: bool = False, '
+    f'**kwargs) -> dict[str, int]:\n    pass\n'
+    for i in range(100)
+)
+
+HOUSE_STYLE = """\
+[function]
+{description}
+
+{parameters}
+
+{returns}
+[parameters_section]
+Args:
+{parameters}
+[parameter]
+    {name} ({type}{category}{default}): {description}
+[default]
+, defaults to {default}
+[returns_section]
+Returns:
+{returns}
+[return]
+    {type}: {description}
+"""
+
+
+def get_function_nodes() -> list[FunctionDocstringNode]:
+    tree = ast.parse(SOURCE)
+    module_node = DocstringNode(tree, 'benchmark', SOURCE)
+    return [
+        FunctionDocstringNode(node, 'benchmark', SOURCE, module_node)
+        for node in tree.body
+    ]
+
+
+def main(repeat: int = 5, number: int = 20) -> None:
+    nodes = get_function_nodes()
+    with tempfile.TemporaryDirectory() as directory:
+        template_file = Path(directory) / 'house_style.txt'
+        template_file.write_text(HOUSE_STYLE)
+        house_style_converter = load_template_converter(template_file)
+
+    converters = {
+        'numpydoc': NumpydocDocstringConverter(quote=True),
+        'google': GoogleDocstringConverter(quote=True),
+        'template (default)': TemplateDocstringConverter(quote=True),
+        'template (house style)': house_style_converter(quote=True),
+    }
+
+    # the default templates reproduce the numpydoc style exactly
+    for node in nodes:
+        assert converters['template (default)'].to_function_docstring(
+            node, indent=4
+        ) == converters['numpydoc'].to_function_docstring(node, indent=4)
+
+    symbols = len(nodes) * number
+    for name, converter in converters.items():
+        best = min(
+            timeit.repeat(
+                lambda converter=converter: [
+                    converter.to_function_docstring(node, indent=4) for node in nodes
+                ],
+                repeat=repeat,
+                number=number,
+            )
+        )
+        print(f'{name:>24}: {best / symbols * 1e6:.2f} µs per function docstring')
+
+
+if __name__ == '__main__':
+    main()
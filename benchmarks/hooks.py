@@ -0,0 +1,88 @@
+"""
+Benchmark the overhead of the hook dispatch on the traversal hot path.
+
+Run with ``python benchmarks/hooks.py`` after installing the package.
+"""
+
+from __future__ import annotations
+
+import gc
+import statistics
+import time
+
+from docstringify.hooks import Hook, HookDispatcher
+from docstringify.traversal import DocstringVisitor
+
+SOURCE = '\n'.join(
+    f'class Class{i}:\n'
+    + ''.join(
+        f'    def method_{j}(self, a: int, b: str = "x") -> int:\n        return a\n'
+        for j in range(10)
+    )
+    for i in range(100)
+)
+
+
+class NoOpHook(Hook):
+    def on_node(self, docstring_node: object) -> None:
+        pass
+
+
+class NoOpNodeAndMissingHook(NoOpHook):
+    def on_missing(self, docstring_node: object) -> None:
+        pass
+
+
+class CountingHook(Hook):
+    def __init__(self) -> None:
+        self.nodes = 0
+
+    def on_node(self, docstring_node: object) -> None:
+        self.nodes += 1
+
+
+def time_traversal(hooks: HookDispatcher | None, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        # parsing happens when the visitor is created, so only the traversal is timed
+        visitor = DocstringVisitor('benchmark.py', source_code=SOURCE, hooks=hooks)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            visitor.visit(visitor.tree)
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return timings
+
+
+def main(repeat: int = 30) -> None:
+    # dispatchers without handlers for the node events resolve them to None, taking
+    # the same path as runs without hooks, so the handlers measure the dispatch
+    scenarios = {
+        'no hooks': None,
+        'no-op on_node': HookDispatcher([NoOpHook()]),
+        'no-op on_node/missing': HookDispatcher([NoOpNodeAndMissingHook()]),
+        'counting on_node': HookDispatcher([CountingHook()]),
+    }
+
+    # interleave the scenarios, so that they are equally affected by any noise
+    timings = {name: [] for name in scenarios}
+    for _ in range(repeat):
+        for name, hooks in scenarios.items():
+            timings[name].extend(time_traversal(hooks, repeat=1))
+
+    nodes = SOURCE.count('def ') + SOURCE.count('class ') + 1
+    baseline = statistics.median(timings['no hooks'])
+    for name, scenario_timings in timings.items():
+        median = statistics.median(scenario_timings)
+        print(
+            f'{name:>22}: {median * 1e3:7.2f} ms per traversal of {nodes} nodes '
+            f'({median / baseline - 1:+.1%}; median of {repeat}, '
+            f'stdev {statistics.stdev(scenario_timings) * 1e3:.2f} ms)'
+        )
+
+
+if __name__ == '__main__':
+    main()
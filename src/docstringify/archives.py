@@ -0,0 +1,114 @@
+"""Reading Python files straight from wheels, sdists, and zip archives."""
+
+from __future__ import annotations
+
+import hashlib
+import tarfile
+import zipfile
+from functools import partial
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING, Callable
+
+from .sources import SourceFile, decode_source, module_name_from_path
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+ZIP_SUFFIXES = ('.whl', '.zip')
+TAR_SUFFIXES = ('.tar.gz', '.tgz')
+
+
+def is_archive(filename: str) -> bool:
+    """
+    Check whether a file is an archive whose Python files should be processed.
+
+    Parameters
+    ----------
+    filename : str
+        The file.
+
+    Returns
+    -------
+    bool
+        Whether the file is a wheel, zip archive, or gzipped tar archive (e.g., an
+        sdist).
+    """
+    return filename.lower().endswith(ZIP_SUFFIXES + TAR_SUFFIXES)
+
+
+def _make_source(
+    archive: str,
+    member: str,
+    module_path: str,
+    load: Callable[[], bytes],
+    content_key: str,
+    size: int,
+) -> SourceFile:
+    module_name = module_name_from_path(module_path)
+    return SourceFile(
+        filename=f'{archive}/{member}',
+        load=lambda: decode_source(load()),
+        module_name=module_name,
+        # the module name is part of the results, so it must be part of the key
+        cache_key=f'{content_key}:{module_name}',
+        size=size,
+    )
+
+
+def _iter_zip_sources(archive: str) -> Iterator[SourceFile]:
+    with zipfile.ZipFile(archive) as zip_file:
+        for info in zip_file.infolist():
+            if info.is_dir() or not info.filename.endswith('.py'):
+                continue
+            # members are only decompressed if their results aren't cached
+            yield _make_source(
+                archive,
+                info.filename,
+                info.filename,
+                partial(zip_file.read, info),
+                content_key=f'crc32:{info.CRC:08x}:{info.file_size}',
+                size=info.file_size,
+            )
+
+
+def _iter_tar_sources(archive: str) -> Iterator[SourceFile]:
+    # stream the members in order, without seeking back through the archive
+    with tarfile.open(archive, mode='r|gz') as tar_file:
+        for member in tar_file:
+            if not member.isfile() or not member.name.endswith('.py'):
+                continue
+            data = tar_file.extractfile(member).read()
+
+            # sdists have a single top-level directory (e.g., pkg-1.0/)
+            module_path = PurePosixPath(*PurePosixPath(member.name).parts[1:])
+            yield _make_source(
+                archive,
+                member.name,
+                str(module_path) if module_path.parts else member.name,
+                lambda data=data: data,
+                content_key=f'sha256:{hashlib.sha256(data).hexdigest()}',
+                size=len(data),
+            )
+
+
+def iter_archive_sources(archive: str) -> Iterator[SourceFile]:
+    """
+    Stream the Python files in an archive, without extracting them to disk.
+
+    Parameters
+    ----------
+    archive : str
+        The path to the wheel, zip archive, or gzipped tar archive.
+
+    Yields
+    ------
+    SourceFile
+        The Python files in the archive, named by their path inside the archive and
+        with module names relative to the archive root. For zip archives, the cache key
+        comes from the CRC stored for each member; otherwise, it is the hash of its
+        contents.
+    """
+    if archive.lower().endswith(ZIP_SUFFIXES):
+        yield from _iter_zip_sources(archive)
+    else:
+        yield from _iter_tar_sources(archive)
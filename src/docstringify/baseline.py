@@ -0,0 +1,240 @@
+"""Baseline of missing docstrings to tolerate, e.g., in legacy code."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+from .exceptions import BaselineFormatError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from os import PathLike
+
+    from .results import FileResult, MissingDocstring
+
+# bumped whenever the entries change, e.g., when they started including the path
+BASELINE_HEADER = '# docstringify baseline v2'
+SIGNATURES_HEADER = f'{BASELINE_HEADER} with signatures'
+PATH_SEPARATOR = '::'
+
+
+class Baseline:
+    """
+    Set of missing docstrings that don't fail the run, which can only shrink as
+    docstrings are added.
+
+    Parameters
+    ----------
+    entries : Iterable[str], default=()
+        The paths to the files containing the symbols whose docstrings may be missing,
+        each followed by ``::`` and the fully-qualified name of the symbol, and then
+        by a space and the hash of the symbol's signature, if ``signatures=True``.
+    signatures : bool, default=False
+        Whether the entries include the hash of the signature, so that symbols
+        whose signatures change are no longer tolerated.
+    get_path : Callable[[str], str] | None, default=None
+        Callable providing the path to record for the name a file was reported under
+        (e.g., without the revision of files read from git), if they differ.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[str] = (),
+        signatures: bool = False,
+        get_path: Callable[[str], str] | None = None,
+    ) -> None:
+        self.entries = set(entries)
+        self.signatures = signatures
+        self.get_path = get_path
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @classmethod
+    def load(
+        cls, path: str | PathLike, get_path: Callable[[str], str] | None = None
+    ) -> Baseline:
+        """
+        Read a baseline that was written with :meth:`save`.
+
+        Parameters
+        ----------
+        path : str | PathLike
+            The baseline file.
+        get_path : Callable[[str], str] | None, default=None
+            Callable providing the path to record for the name a file was reported
+            under, if they differ.
+
+        Returns
+        -------
+        Baseline
+            The baseline.
+        """
+        header, _, body = Path(path).read_text().partition('\n')
+        if header not in (BASELINE_HEADER, SIGNATURES_HEADER):
+            raise BaselineFormatError(str(path))
+
+        entries = set(body.splitlines())
+        entries.discard('')
+        return cls(entries, signatures=header == SIGNATURES_HEADER, get_path=get_path)
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Iterable[FileResult],
+        signatures: bool = False,
+        get_path: Callable[[str], str] | None = None,
+    ) -> Baseline:
+        """
+        Record all the missing docstrings in the results.
+
+        Parameters
+        ----------
+        results : Iterable[FileResult]
+            The results of processing the files.
+        signatures : bool, default=False
+            Whether to record the hash of the signature of each symbol.
+        get_path : Callable[[str], str] | None, default=None
+            Callable providing the path to record for the name a file was reported
+            under, if they differ.
+
+        Returns
+        -------
+        Baseline
+            The baseline.
+        """
+        baseline = cls(signatures=signatures, get_path=get_path)
+        baseline.entries = baseline._keys(results)
+        return baseline
+
+    def get_file_path(self, filename: str) -> str:
+        """
+        Determine the path recorded in the baseline for a file.
+
+        Parameters
+        ----------
+        filename : str
+            The name the file was reported under.
+
+        Returns
+        -------
+        str
+            The path, with forward slashes, so the baseline works across platforms.
+        """
+        return Path(self.get_path(filename) if self.get_path else filename).as_posix()
+
+    def key(self, filename: str, missing: MissingDocstring) -> str:
+        """
+        Describe a missing docstring as an entry in the baseline.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file the symbol is in.
+        missing : MissingDocstring
+            The missing docstring.
+
+        Returns
+        -------
+        str
+            The path to the file and the fully-qualified name of the symbol, followed
+            by the hash of its signature, if the baseline includes signatures. Module
+            names are only the filename without the extension, so the path keeps
+            symbols with the same name in different files apart.
+        """
+        key = f'{self.get_file_path(filename)}{PATH_SEPARATOR}{missing.name}'
+        if self.signatures:
+            return f'{key} {missing.signature_hash}'
+        return key
+
+    def tolerates(self, filename: str, missing: MissingDocstring) -> bool:
+        """
+        Check whether a missing docstring is in the baseline.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file the symbol is in.
+        missing : MissingDocstring
+            The missing docstring.
+
+        Returns
+        -------
+        bool
+            Whether the docstring may be missing.
+        """
+        return self.key(filename, missing) in self.entries
+
+    def _keys(self, results: Iterable[FileResult]) -> set[str]:
+        return {
+            self.key(result.filename, missing)
+            for result in results
+            for missing in result.missing_docstrings
+        }
+
+    def filter(self, results: Iterable[FileResult]) -> list[FileResult]:
+        """
+        Drop the missing docstrings that are in the baseline from the results.
+
+        Parameters
+        ----------
+        results : Iterable[FileResult]
+            The results of processing the files.
+
+        Returns
+        -------
+        list[FileResult]
+            The results, with only the missing docstrings that aren't in the baseline.
+        """
+        return [
+            result._replace(
+                missing_docstrings=tuple(
+                    missing
+                    for missing in result.missing_docstrings
+                    if not self.tolerates(result.filename, missing)
+                )
+            )
+            for result in results
+        ]
+
+    def shrink(self, results: Iterable[FileResult]) -> Baseline:
+        """
+        Drop the entries for the docstrings that are no longer missing in the files
+        that were processed, keeping the entries for all the other files.
+
+        Parameters
+        ----------
+        results : Iterable[FileResult]
+            The results of processing the files.
+
+        Returns
+        -------
+        Baseline
+            The baseline, with only the entries that are still missing docstrings or
+            are for files that weren't processed.
+        """
+        results = list(results)
+        processed = {self.get_file_path(result.filename) for result in results}
+        return Baseline(
+            {
+                entry
+                for entry in self.entries
+                if entry.partition(PATH_SEPARATOR)[0] not in processed
+            }
+            | (self.entries & self._keys(results)),
+            signatures=self.signatures,
+            get_path=self.get_path,
+        )
+
+    def save(self, path: str | PathLike) -> None:
+        """
+        Write the baseline to disk, sorted so that changes are easy to review.
+
+        Parameters
+        ----------
+        path : str | PathLike
+            The baseline file.
+        """
+        header = SIGNATURES_HEADER if self.signatures else BASELINE_HEADER
+        Path(path).write_text('\n'.join([header, *sorted(self.entries)]) + '\n')
@@ -0,0 +1,359 @@
+"""Processing files in batches, isolating any failures to the files causing them."""
+
+from __future__ import annotations
+
+import signal
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+from .archives import is_archive, iter_archive_sources
+from .exceptions import FileTimeoutError, FileTooLargeError, TimeBudgetExceededError
+from .results import FileError, FileResult
+from .sources import STDIN, SourceBuffer, SourceFile, disk_source, stdin_source
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from .cache import ResultCache
+    from .duplicates import DuplicateIndex
+    from .hooks import HookDispatcher
+    from .traversal import DocstringVisitor
+    from .triage import Triage
+
+
+@contextmanager
+def time_limit(seconds: float | None, deadline: float | None = None) -> Iterator[None]:
+    """
+    Interrupt the code in the block, if it takes longer than the time limit.
+
+    The time limit is only enforced on platforms supporting ``SIGALRM`` and only in the
+    main thread; otherwise, the block runs to completion.
+
+    Parameters
+    ----------
+    seconds : float | None
+        The time limit in seconds, or ``None`` for no time limit.
+    deadline : float | None, default=None
+        The time (per :func:`time.monotonic`) at which the time budget of the whole
+        run is exhausted, or ``None`` for no time budget.
+
+    Yields
+    ------
+    None
+        Control to the block.
+
+    Raises
+    ------
+    FileTimeoutError
+        If the block takes longer than the time limit.
+    TimeBudgetExceededError
+        If the time budget is exhausted first, including before the block starts.
+    """
+    error: Exception | None = FileTimeoutError(seconds) if seconds else None
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeBudgetExceededError
+        # the file is interrupted by whichever limit comes first
+        if not seconds or remaining < seconds:
+            seconds, error = remaining, TimeBudgetExceededError()
+
+    if (
+        not seconds
+        or not hasattr(signal, 'setitimer')
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def handle_alarm(signum: int, frame: object) -> None:
+        raise error
+
+    previous_handler = signal.signal(signal.SIGALRM, handle_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def check_size(
+    source: SourceFile, size_limit: int, source_code: str | None = None
+) -> None:
+    """
+    Check that a source file doesn't exceed the size limit.
+
+    Parameters
+    ----------
+    source : SourceFile
+        The source file to check.
+    size_limit : int
+        The maximum size of the file in bytes.
+    source_code : str | None, default=None
+        The source code, if it was already loaded.
+    """
+    if source.size is not None:
+        size = source.size
+    elif source_code is not None:
+        size = len(source_code.encode())
+    else:
+        size = Path(source.filename).stat().st_size
+
+    if size > size_limit:
+        raise FileTooLargeError(size, size_limit)
+
+
+def iter_sources(
+    filename: str, stdin_filename: str | None = None
+) -> Iterator[SourceFile]:
+    """
+    Yield the Python source files contained in a file provided on the command line.
+
+    Parameters
+    ----------
+    filename : str
+        A Python file, an archive (see :func:`.is_archive`), or ``-`` for standard
+        input.
+    stdin_filename : str | None, default=None
+        The name to report the code from standard input under.
+
+    Yields
+    ------
+    SourceFile
+        The sources to process.
+    """
+    if filename == STDIN:
+        yield stdin_source(stdin_filename)
+    elif is_archive(filename):
+        yield from iter_archive_sources(filename)
+    else:
+        yield disk_source(filename)
+
+
+def _record_error(filename: str, error: Exception) -> FileError:
+    file_error = FileError.from_exception(filename, error)
+    print(f'Failed to process {file_error}', file=sys.stderr)
+    return file_error
+
+
+def process_source(
+    source: SourceFile,
+    get_docstring_processor: Callable[..., DocstringVisitor],
+    keep_going: bool = False,
+    time_limit_seconds: float | None = None,
+    size_limit: int | None = None,
+    cache: ResultCache | None = None,
+    triage: Triage | None = None,
+    deadline: float | None = None,
+    duplicates: DuplicateIndex | None = None,
+) -> FileResult | FileError:
+    """
+    Process a single source file, optionally recording any error instead of raising it.
+
+    Parameters
+    ----------
+    source : SourceFile
+        The source file to process.
+    get_docstring_processor : Callable[..., DocstringVisitor]
+        Callable creating the visitor (or transformer) for the file from its name,
+        along with the ``source_code``, ``module_name``, and ``source_buffer``
+        keyword arguments.
+    keep_going : bool, default=False
+        Whether to record errors (including exceeding the limits) as a
+        :class:`.FileError` instead of raising them.
+    time_limit_seconds : float | None, default=None
+        The maximum number of seconds that parsing and traversing the file may take.
+        Any changes are written after the time limit no longer applies, so files are
+        never partially written.
+    size_limit : int | None, default=None
+        The maximum size of the file in bytes.
+    cache : ResultCache | None, default=None
+        The cache to look up and store the result in. This must only be provided when
+        the processor doesn't produce anything beyond the result.
+    triage : Triage | None, default=None
+        The fast paths to check the file with before parsing it. Like the cache, this
+        must only be provided when the processor doesn't produce anything beyond the
+        result.
+    deadline : float | None, default=None
+        The time (per :func:`time.monotonic`) at which the time budget of the run is
+        exhausted. Exceeding it raises :class:`.TimeBudgetExceededError`, even if
+        ``keep_going=True``.
+    duplicates : DuplicateIndex | None, default=None
+        The results of the distinct contents processed so far in the run, which the
+        file reuses (along with any changes, which are written to it as well), if it
+        has the same contents as one of them.
+
+    Returns
+    -------
+    FileResult | FileError
+        The result of processing the file or, if ``keep_going=True``, the error that
+        occurred.
+    """
+    if (
+        cache is not None
+        and source.cache_key
+        and (result := cache.get(source.cache_key, source.filename))
+    ):
+        result.report()
+        return result
+
+    source_buffer = None
+    try:
+        source_code = source.load() if source.load else None
+        if size_limit is not None:
+            check_size(source, size_limit, source_code)
+
+        # the contents are hashed as they are read, and then parsed from the same bytes
+        content_key = duplicate = None
+        if source.load_bytes is not None:
+            source_buffer = SourceBuffer(source.load_bytes())
+        if duplicates is not None:
+            if source_buffer is None and source_code is None:
+                source_buffer = SourceBuffer.read(Path(source.filename).expanduser())
+            content_key = duplicates.get_key(
+                source,
+                source_buffer.data
+                if source_buffer is not None
+                else source_code.encode(),
+            )
+            duplicate = duplicates.get(content_key, source.filename)
+
+        if duplicate is not None:
+            result = duplicate.result
+            result.report()
+            if duplicate.write_copy is not None:
+                duplicate.write_copy(source.filename)
+        else:
+            with time_limit(time_limit_seconds, deadline=deadline):
+                if triage is not None and (
+                    result := triage.check(source, source_code, source_buffer)
+                ):
+                    result.report()
+                    if content_key is not None:
+                        duplicates.put(content_key, result)
+                    return result
+
+                processor = get_docstring_processor(
+                    source.filename,
+                    source_code=source_code,
+                    module_name=source.module_name,
+                    source_buffer=source_buffer,
+                )
+                processor.visit(processor.tree)
+
+            processor.finish()
+            result = FileResult.from_processor(source.filename, processor)
+            if content_key is not None:
+                duplicates.put(content_key, result, processor.get_copy_writer())
+    except Exception as error:
+        if not keep_going or isinstance(error, TimeBudgetExceededError):
+            raise
+        return _record_error(source.filename, error)
+    finally:
+        # also when the file took a fast path, was a copy, or failed
+        if source_buffer is not None:
+            source_buffer.close()
+
+    if cache is not None and source.cache_key:
+        cache.put(source.cache_key, result)
+    return result
+
+
+def process_file(
+    filename: str,
+    get_docstring_processor: Callable[..., DocstringVisitor],
+    get_sources: Callable[[str], Iterable[SourceFile]] = iter_sources,
+    keep_going: bool = False,
+    time_limit_seconds: float | None = None,
+    size_limit: int | None = None,
+    cache: ResultCache | None = None,
+    triage: Triage | None = None,
+    deadline: float | None = None,
+    hooks: HookDispatcher | None = None,
+    duplicates: DuplicateIndex | None = None,
+) -> Iterator[FileResult | FileError]:
+    """
+    Process all the sources in a file provided on the command line.
+
+    Parameters
+    ----------
+    filename : str
+        A Python file or an archive (see :func:`.is_archive`).
+    get_docstring_processor : Callable[..., DocstringVisitor]
+        Callable creating the visitor (or transformer) for the file from its name,
+        along with the ``source_code``, ``module_name``, and ``source_buffer``
+        keyword arguments.
+    get_sources : Callable[[str], Iterable[SourceFile]], default=iter_sources
+        Callable providing the sources in the file.
+    keep_going : bool, default=False
+        Whether to record errors (including errors reading the file) as a
+        :class:`.FileError` instead of raising them.
+    time_limit_seconds : float | None, default=None
+        The maximum number of seconds that parsing and traversing each source may take.
+    size_limit : int | None, default=None
+        The maximum size of each source in bytes.
+    cache : ResultCache | None, default=None
+        The cache to look up and store the results in.
+    triage : Triage | None, default=None
+        The fast paths to check each source with before parsing it.
+    deadline : float | None, default=None
+        The time (per :func:`time.monotonic`) at which the time budget of the run is
+        exhausted.
+    hooks : HookDispatcher | None, default=None
+        The hooks to notify when each source starts and finishes processing.
+    duplicates : DuplicateIndex | None, default=None
+        The results of the distinct contents processed so far in the run, to reuse
+        for the sources with the same contents.
+
+    Yields
+    ------
+    FileResult | FileError
+        The result (or error) for each source in the file.
+    """
+    on_file_start = hooks.on_file_start if hooks else None
+    on_file_done = hooks.on_file_done if hooks else None
+    try:
+        for source in get_sources(filename):
+            if on_file_start is not None:
+                on_file_start(source.filename)
+            result = process_source(
+                source,
+                get_docstring_processor,
+                keep_going=keep_going,
+                time_limit_seconds=time_limit_seconds,
+                size_limit=size_limit,
+                cache=cache,
+                triage=triage,
+                deadline=deadline,
+                duplicates=duplicates,
+            )
+            if on_file_done is not None:
+                on_file_done(result)
+            yield result
+    except Exception as error:
+        if not keep_going or isinstance(error, TimeBudgetExceededError):
+            raise
+        file_error = _record_error(filename, error)
+        if on_file_done is not None:
+            on_file_done(file_error)
+        yield file_error
+
+
+def report_errors(errors: list[FileError]) -> None:
+    """
+    Summarize the files that couldn't be processed.
+
+    Parameters
+    ----------
+    errors : list[FileError]
+        The errors that occurred.
+    """
+    if errors:
+        print(f'Failed to process {len(errors)} file(s):', file=sys.stderr)
+        for error in errors:
+            print(f'  {error}', file=sys.stderr)
@@ -0,0 +1,85 @@
+"""Cache of results across runs."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from . import __version__
+from .results import RESULT_FORMAT_VERSION, FileResult
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+
+class ResultCache:
+    """
+    Cache of the results of processing files, keyed by the contents of the files.
+
+    The cache is invalidated entirely, if the settings affecting the results change.
+
+    Parameters
+    ----------
+    path : str | PathLike
+        The file to store the cache in.
+    settings : str
+        A description of all the settings affecting the results.
+    """
+
+    def __init__(self, path: str | PathLike, settings: str) -> None:
+        self.path = Path(path)
+        self.settings = f'{__version__}:{RESULT_FORMAT_VERSION}:{settings}'
+        self.hits = 0
+        self._entries: dict[str, dict] = {}
+
+        try:
+            cache = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            cache = {}
+
+        if cache.get('settings') == self.settings:
+            self._entries = cache.get('entries', {})
+
+    def get(self, key: str, filename: str) -> FileResult | None:
+        """
+        Look up a cached result.
+
+        Parameters
+        ----------
+        key : str
+            The cache key for the contents of the file.
+        filename : str
+            The name of the file to attach to the result.
+
+        Returns
+        -------
+        FileResult | None
+            The result, if it was cached.
+        """
+        if (entry := self._entries.get(key)) is None:
+            return None
+        self.hits += 1
+        return FileResult.from_dict({**entry, 'filename': filename})
+
+    def put(self, key: str, result: FileResult) -> None:
+        """
+        Add a result to the cache.
+
+        Parameters
+        ----------
+        key : str
+            The cache key for the contents of the file.
+        result : FileResult
+            The result of processing the file.
+        """
+        entry = result.to_dict()
+        del entry['filename']
+        self._entries[key] = entry
+
+    def save(self) -> None:
+        """Write the cache to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(
+            json.dumps({'settings': self.settings, 'entries': self._entries})
+        )
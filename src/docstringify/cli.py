@@ -3,53 +3,599 @@
 from __future__ import annotations
 
 import argparse
+import json
+import re
 import sys
+import time
+from collections import defaultdict
+from contextlib import ExitStack, redirect_stdout
 from functools import partial
-from typing import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, NamedTuple, Sequence
 
 from . import __doc__ as pkg_description
 from . import __version__
-from .converters import GoogleDocstringConverter, NumpydocDocstringConverter
+from .archives import is_archive
+from .baseline import Baseline
+from .batch import iter_sources, process_file, report_errors
+from .cache import ResultCache
+from .converters import (
+    GoogleDocstringConverter,
+    NumpydocDocstringConverter,
+    load_template_converter,
+)
+from .duplicates import DuplicateIndex
+from .exceptions import (
+    GitError,
+    InvalidConfidenceError,
+    InvalidNamePatternError,
+    InvalidSampleSizeError,
+    InvalidStyleError,
+    TimeBudgetExceededError,
+)
+from .exports import ExportIndex
+from .filters import SYMBOL_KINDS, SymbolFilter
+from .git import GitBlobReader, list_revision_blobs, list_staged_blobs
+from .hooks import HookDispatcher, load_hook
+from .project_index import ProjectIndex
+from .results import FileError, summarize_results
+from .sampling import estimate_missing_percentage, sample_files
+from .scheduling import RunHistory, file_fingerprint
+from .sharding import (
+    GIT_SOURCE,
+    STAGED_SOURCE,
+    Shard,
+    read_partials,
+    write_partial,
+)
+from .sources import STDIN
+from .thresholds import PathThreshold, bucket_results, load_pyproject_thresholds
 from .traversal import DocstringTransformer, DocstringVisitor
+from .triage import GENERATED, NO_DEFINITIONS, Triage
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from .converters import DocstringConverter
+    from .results import FileResult
+    from .sampling import CoverageEstimate, Stratum
+    from .sources import SourceFile
 
 PROG = __package__
 STYLES = {'google': GoogleDocstringConverter, 'numpydoc': NumpydocDocstringConverter}
-CLI_DEFAULTS = {'threshold': 1.0}
+CLI_DEFAULTS = {'threshold': 1.0, 'seed': 0, 'confidence': 0.95}
+FILE_ERRORS_EXIT_CODE = 3
+CACHE_SENSITIVE_OPTIONS = (
+    'ignore_name',
+    'ignore_private',
+    'ignore_dunder',
+    'ignore_decorator',
+    'ignore_kind',
+    'max_depth',
+    'validate_docstrings',
+    'triage',
+    'public_only',
+)
 
 
-def main(argv: Sequence[str] | None = None) -> int:
+def _parse_sample_size(value: str) -> float | int:
+    try:
+        size = float(value)
+    except ValueError:
+        size = 0
+
+    if 0 < size < 1:
+        return size
+    if size >= 1 and size.is_integer():
+        return int(size)
+    raise InvalidSampleSizeError(value)
+
+
+def _parse_confidence(value: str) -> float:
+    try:
+        confidence = float(value)
+    except ValueError:
+        confidence = 0
+
+    if 0 < confidence < 1:
+        return confidence
+    raise InvalidConfidenceError(value)
+
+
+def _parse_name_pattern(value: str) -> str:
+    # patterns are combined into a single expression, each in its own group
+    try:
+        re.compile(f'(?:{value})')
+    except re.error as error:
+        raise InvalidNamePatternError(value, error) from None
+    return value
+
+
+def _parse_style(value: str) -> str:
+    if value in STYLES or Path(value).expanduser().is_file():
+        return value
+    raise InvalidStyleError(value)
+
+
+def _get_converter(
+    parser: argparse.ArgumentParser, style: str | None
+) -> type[DocstringConverter] | None:
+    if style is None or style in STYLES:
+        return STYLES.get(style)
+    try:
+        return load_template_converter(Path(style).expanduser())
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+
+
+def _parse_shard(value: str) -> Shard:
+    try:
+        return Shard.from_string(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error)) from None
+
+
+def check_threshold(
+    docstrings_processed: int, missing_docstrings: int, threshold: float
+) -> int:
     """
-    Flag missing docstrings and, optionally, generate them from signatures and
-    type annotations.
+    Check whether the percentage of missing docstrings is within the threshold.
 
     Parameters
     ----------
-    argv : Sequence[str] | None, default=None
-        The arguments passed on the command line.
+    docstrings_processed : int
+        The number of docstrings inspected.
+    missing_docstrings : int
+        The number of docstrings that were missing.
+    threshold : float
+        The percentage of docstrings that must be present to pass.
+
+    Returns
+    -------
+    int
+        Exit code for the process, where ``1`` indicates that more than the allowed
+        percentage of docstrings were missing.
+    """
+    if (
+        docstrings_processed
+        and (missing_percentage := (missing_docstrings / docstrings_processed))
+        > 1 - threshold
+    ):
+        print(f'Missing {missing_percentage:.0%} of docstrings', file=sys.stderr)
+        print(
+            f'Your settings require {threshold:.0%} of docstrings to be present',
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+def check_path_thresholds(
+    results: Mapping[str, Iterable[FileResult]],
+    rules: list[PathThreshold],
+    threshold: float,
+) -> int:
+    """
+    Check the files matching each path threshold rule against its own threshold.
+
+    Parameters
+    ----------
+    results : Mapping[str, Iterable[FileResult]]
+        The results, keyed by the path to match the rules against.
+    rules : list[PathThreshold]
+        The rules, in order of precedence; each file only counts towards the first
+        rule it matches.
+    threshold : float
+        The threshold for the files not matching any rule.
+
+    Returns
+    -------
+    int
+        Exit code for the process, where ``1`` indicates that more than the allowed
+        percentage of docstrings were missing for at least one rule.
+    """
+    exit_code = 0
+    for bucket in bucket_results(results, rules):
+        if not bucket.filenames:
+            continue
+        name, bucket_threshold = bucket.rule or ('other files', threshold)
+        print(
+            f'{name}: {bucket.missing_docstrings} of {bucket.docstrings_inspected} '
+            f'docstrings missing in {len(bucket.filenames)} file(s) '
+            f'(requires {bucket_threshold:.0%})'
+        )
+        exit_code |= check_threshold(
+            bucket.docstrings_inspected, bucket.missing_docstrings, bucket_threshold
+        )
+    return exit_code
+
+
+def _load_path_thresholds(
+    parser: argparse.ArgumentParser, rules: list[PathThreshold]
+) -> list[PathThreshold]:
+    # rules on the command line take precedence over those in pyproject.toml
+    try:
+        return [*rules, *load_pyproject_thresholds()]
+    except (OSError, ValueError, argparse.ArgumentTypeError) as error:
+        parser.error(f'pyproject.toml: {error}')
+
+
+def check_estimated_threshold(estimate: CoverageEstimate, threshold: float) -> int:
+    """
+    Check whether the estimated percentage of missing docstrings is within the
+    threshold, failing only if the entire confidence interval exceeds it.
+
+    Parameters
+    ----------
+    estimate : CoverageEstimate
+        The estimated percentage of missing docstrings and its confidence interval.
+    threshold : float
+        The percentage of docstrings that must be present to pass.
+
+    Returns
+    -------
+    int
+        Exit code for the process, where ``1`` indicates that more than the allowed
+        percentage of docstrings were missing.
+    """
+    print(
+        f'Estimated {estimate.missing_percentage:.1%} of docstrings missing '
+        f'({estimate.confidence:.0%} confidence interval: '
+        f'{estimate.lower_bound:.1%} to {estimate.upper_bound:.1%}) '
+        f'from a sample of {estimate.files_sampled} of {estimate.files_total} files'
+    )
+    if estimate.lower_bound > 1 - threshold:
+        print(
+            f'Missing at least {estimate.lower_bound:.0%} of docstrings '
+            f'(with {estimate.confidence:.0%} confidence)',
+            file=sys.stderr,
+        )
+        print(
+            f'Your settings require {threshold:.0%} of docstrings to be present',
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+def check_stale_docstrings(stale_docstrings: int) -> int:
+    """
+    Check whether any stale docstrings were found.
+
+    Parameters
+    ----------
+    stale_docstrings : int
+        The number of stale docstrings found.
+
+    Returns
+    -------
+    int
+        Exit code for the process, where ``1`` indicates that stale docstrings were
+        found.
+    """
+    if stale_docstrings:
+        print(f'Found {stale_docstrings} stale docstring(s)', file=sys.stderr)
+        return 1
+    return 0
+
+
+def check_errors(errors: list[FileError]) -> int:
+    """
+    Check whether any files couldn't be processed, summarizing the failures.
+
+    Parameters
+    ----------
+    errors : list[FileError]
+        The errors for the files that couldn't be processed.
+
+    Returns
+    -------
+    int
+        Exit code for the process, where ``3`` indicates that some files couldn't be
+        processed.
+    """
+    if errors:
+        report_errors(errors)
+        return FILE_ERRORS_EXIT_CODE
+    return 0
+
+
+def check_uncovered_files(uncovered_files: list[str]) -> int:
+    """
+    Check whether the partial results cover all the files, listing any that weren't
+    checked because a time budget was exhausted.
+
+    Parameters
+    ----------
+    uncovered_files : list[str]
+        The files that weren't checked.
+
+    Returns
+    -------
+    int
+        Exit code for the process, where ``1`` indicates that some files weren't
+        checked, so the merged results can't pass for a complete run.
+    """
+    if uncovered_files:
+        print(
+            f'{len(uncovered_files)} file(s) were not checked, since the time budget '
+            'of their shard was exhausted:',
+            file=sys.stderr,
+        )
+        for file in uncovered_files:
+            print(f'  {file}', file=sys.stderr)
+        return 1
+    return 0
+
+
+def _read_baseline(
+    path: str | None, get_path: Callable[[str], str] | None = None
+) -> Baseline | None:
+    if path is None:
+        return None
+    try:
+        return Baseline.load(path, get_path=get_path)
+    except FileNotFoundError:
+        return None
+
+
+def apply_baseline(
+    path: str,
+    baseline: Baseline | None,
+    results: list[FileResult],
+    update: bool = False,
+    signatures: bool = False,
+    complete: bool = True,
+    get_path: Callable[[str], str] | None = None,
+) -> Baseline:
+    """
+    Record or shrink the baseline, reporting the missing docstrings that aren't in it.
+
+    Parameters
+    ----------
+    path : str
+        The baseline file.
+    baseline : Baseline | None
+        The baseline read from ``path``, or ``None`` if it doesn't exist yet, in which
+        case all the missing docstrings are recorded in it.
+    results : list[FileResult]
+        The results of processing the files.
+    update : bool, default=False
+        Whether to drop the entries for docstrings that are no longer missing.
+    signatures : bool, default=False
+        Whether to record the hash of the signature of each symbol, when recording the
+        baseline.
+    complete : bool, default=True
+        Whether all the files were processed; otherwise, the baseline is only written
+        when updating an existing one, which only affects the files processed.
+    get_path : Callable[[str], str] | None, default=None
+        Callable providing the path to record for the name a file was reported under,
+        if they differ.
+
+    Returns
+    -------
+    Baseline
+        The baseline to filter the results with.
+    """
+    if baseline is None:
+        if not complete:
+            print(
+                f'Not recording the baseline in {path}, since not all files were '
+                'processed',
+                file=sys.stderr,
+            )
+            return Baseline(signatures=signatures)
+        baseline = Baseline.from_results(
+            results, signatures=signatures, get_path=get_path
+        )
+        baseline.save(path)
+        print(f'Recorded {len(baseline)} missing docstring(s) in the baseline {path}')
+    elif update:
+        shrunk_baseline = baseline.shrink(results)
+        if removed := len(baseline) - len(shrunk_baseline):
+            shrunk_baseline.save(path)
+            print(f'Removed {removed} documented symbol(s) from the baseline {path}')
+
+    new_missing_docstrings = [
+        missing.name
+        for result in results
+        for missing in result.missing_docstrings
+        if not baseline.tolerates(result.filename, missing)
+    ]
+    for name in new_missing_docstrings:
+        print(
+            f'{name} is missing a docstring and is not in the baseline', file=sys.stderr
+        )
+    print(
+        f'Found {len(new_missing_docstrings)} missing docstring(s) not in the baseline'
+    )
+    return baseline
+
+
+def _add_gate_options(parser: argparse.ArgumentParser) -> None:
+    # the options deciding whether the run passes, shared by the main command and merge
+    threshold_group = parser.add_argument_group(
+        'Threshold options', 'Decide how many missing docstrings are acceptable'
+    )
+    threshold_group.add_argument(
+        '--threshold',
+        type=float,
+        default=CLI_DEFAULTS['threshold'],
+        help='The percentage of docstrings that must be present to pass',
+    )
+    threshold_group.add_argument(
+        '--path-threshold',
+        action='append',
+        default=[],
+        type=PathThreshold.from_string,
+        metavar='PATTERN=THRESHOLD',
+        help=(
+            'The threshold for the files matching a glob pattern or inside a '
+            'directory, checked separately (can be repeated, and also set in the '
+            '[tool.docstringify.path-thresholds] table of pyproject.toml); each file '
+            'counts towards the first matching rule, and --threshold applies to the '
+            'rest'
+        ),
+    )
+
+    baseline_group = parser.add_argument_group(
+        'Baseline options', 'Only fail on missing docstrings that are new'
+    )
+    baseline_group.add_argument(
+        '--baseline',
+        metavar='PATH',
+        help=(
+            'File of missing docstrings to tolerate, which is recorded if it does not '
+            'exist; the threshold then only counts the missing docstrings not in it'
+        ),
+    )
+    baseline_group.add_argument(
+        '--update-baseline',
+        action='store_true',
+        help=(
+            'Whether to drop the entries for docstrings that are no longer missing in '
+            'the files processed'
+        ),
+    )
+    baseline_group.add_argument(
+        '--baseline-signatures',
+        action='store_true',
+        help=(
+            'Whether to record the hash of each signature when recording the '
+            'baseline, so that symbols whose signatures change are no longer tolerated'
+        ),
+    )
+
+
+def _validate_gate_options(
+    parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> list[PathThreshold]:
+    if (args.update_baseline or args.baseline_signatures) and not args.baseline:
+        parser.error('--update-baseline and --baseline-signatures require --baseline')
+    return _load_path_thresholds(parser, args.path_threshold)
+
+
+def _check_gate(
+    results: Mapping[str, list[FileResult]],
+    path_thresholds: list[PathThreshold],
+    threshold: float,
+) -> int:
+    if path_thresholds:
+        return check_path_thresholds(results, path_thresholds, threshold)
+    docstrings_processed, missing_docstrings, _ = summarize_results(
+        [result for file_results in results.values() for result in file_results]
+    )
+    return check_threshold(docstrings_processed, missing_docstrings, threshold)
+
+
+def merge(argv: Sequence[str]) -> int:
+    """
+    Combine the partial results of sharded runs and check them against the threshold,
+    exactly as a single run over all the files would.
+
+    Parameters
+    ----------
+    argv : Sequence[str]
+        The arguments passed on the command line after ``merge``.
 
     Returns
     -------
     int
         Exit code for the process, where non-zero values indicate errors, and ``1``
-        indicates that more than the allowed percentage of docstrings were missing.
+        indicates that more than the allowed percentage of docstrings were missing or
+        that stale docstrings were found, and ``3`` indicates that some files couldn't
+        be processed.
     """
+    parser = argparse.ArgumentParser(
+        prog=f'{PROG} merge',
+        description='Combine the partial results written with --emit-partial.',
+    )
+    parser.add_argument('partials', nargs='+', help='Files with partial results')
+    _add_gate_options(parser)
+    args = parser.parse_args(argv)
+
+    path_thresholds = _validate_gate_options(parser, args)
+
+    try:
+        results, errors, uncovered_files, source = read_partials(args.partials)
+        get_path = _get_repo_path(source)
+        baseline = _read_baseline(args.baseline, get_path=get_path)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+
+    if args.baseline:
+        results = apply_baseline(
+            args.baseline,
+            baseline,
+            results,
+            update=args.update_baseline,
+            signatures=args.baseline_signatures,
+            complete=not (errors or uncovered_files or source == STAGED_SOURCE),
+            get_path=get_path,
+        ).filter(results)
 
-    parser = argparse.ArgumentParser(prog=PROG, description=pkg_description)
-    parser.add_argument('filenames', nargs='*', help='Filenames to process')
+    docstrings_processed, missing_docstrings, stale_docstrings = summarize_results(
+        results
+    )
+    print(
+        f'Merged results for {len(results)} files from {len(args.partials)} partial '
+        f'result(s): {missing_docstrings} of {docstrings_processed} docstrings missing'
+    )
+    results_by_file = defaultdict(list)
+    for result in results:
+        results_by_file[
+            get_path(result.filename) if get_path else result.filename
+        ].append(result)
+    exit_code = _check_gate(results_by_file, path_thresholds, args.threshold)
+    exit_code |= check_stale_docstrings(stale_docstrings)
+    exit_code |= check_uncovered_files(uncovered_files)
+    return check_errors(errors) or exit_code
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog=PROG,
+        description=pkg_description,
+        epilog=(
+            f'Run "{PROG} merge PARTIALS..." to combine the partial results of '
+            'sharded runs.'
+        ),
+    )
+    parser.add_argument(
+        'filenames',
+        nargs='*',
+        help=(
+            'Filenames to process, including wheels, zip archives, and .tar.gz '
+            'sdists, or - to read from standard input'
+        ),
+    )
+    parser.add_argument(
+        '--stdin-filename',
+        metavar='NAME',
+        help=(
+            'The name to report the code from standard input under, which also '
+            'determines its module name'
+        ),
+    )
     parser.add_argument(
         '--version', action='version', version=f'%(prog)s {__version__}'
     )
 
-    run_group = parser.add_argument_group('Run options')
+    run_group = parser.add_argument_group(
+        'Run options',
+        'Each STYLE is google, numpydoc, or the path to a template file.',
+    )
     handle_missing_docstring = run_group.add_mutually_exclusive_group(required=False)
     handle_missing_docstring.add_argument(
         '--make-changes',
-        choices=STYLES.keys(),
+        type=_parse_style,
+        metavar='STYLE',
         help='Whether to insert docstring templates for items missing docstrings',
     )
     handle_missing_docstring.add_argument(
         '--make-changes-inplace',
-        choices=STYLES.keys(),
+        type=_parse_style,
+        metavar='STYLE',
         help=(
             'Whether to insert docstring templates for items missing docstrings, '
             'overwriting the original file'
@@ -57,53 +603,697 @@ def main(argv: Sequence[str] | None = None) -> int:
     )
     handle_missing_docstring.add_argument(
         '--suggest-changes',
-        choices=STYLES.keys(),
+        type=_parse_style,
+        metavar='STYLE',
         help='Whether to print out docstring templates for items missing docstrings',
     )
     run_group.add_argument(
-        '--threshold',
+        '--validate-docstrings',
+        type=_parse_style,
+        metavar='STYLE',
+        help=(
+            'Whether to also flag function docstrings in this style whose parameters '
+            'and returns sections no longer match the signature'
+        ),
+    )
+
+    filter_group = parser.add_argument_group(
+        'Filtering options',
+        'Skip symbols, along with everything nested inside them',
+    )
+    filter_group.add_argument(
+        '--ignore-name',
+        action='append',
+        default=[],
+        type=_parse_name_pattern,
+        metavar='REGEX',
+        help='Regular expression for names of modules, classes, and functions to skip',
+    )
+    filter_group.add_argument(
+        '--ignore-private',
+        action='store_true',
+        help='Whether to skip classes and functions with names starting with "_"',
+    )
+    filter_group.add_argument(
+        '--ignore-dunder',
+        action='store_true',
+        help='Whether to skip classes and functions with dunder names, like __repr__',
+    )
+    filter_group.add_argument(
+        '--ignore-decorator',
+        action='append',
+        default=[],
+        metavar='NAME',
+        help='Name of a decorator whose classes and functions should be skipped',
+    )
+    filter_group.add_argument(
+        '--ignore-kind',
+        action='append',
+        default=[],
+        choices=SYMBOL_KINDS,
+        help=(
+            'Kind of symbol to skip; for modules, only the module docstring is '
+            'skipped, not the classes and functions in them'
+        ),
+    )
+    filter_group.add_argument(
+        '--public-only',
+        action='store_true',
+        help=(
+            'Whether to only inspect the public API: the classes and functions in '
+            "modules' __all__ (or without a leading underscore) or re-exported by "
+            'packages, along with their public methods'
+        ),
+    )
+    filter_group.add_argument(
+        '--max-depth',
+        type=int,
+        help=(
+            'The maximum nesting depth of symbols to inspect, where top-level classes '
+            'and functions are at a depth of 1'
+        ),
+    )
+
+    sampling_group = parser.add_argument_group(
+        'Sampling options',
+        'Estimate the percentage of missing docstrings from a random subset of files',
+    )
+    sampling_group.add_argument(
+        '--sample',
+        type=_parse_sample_size,
+        metavar='FRACTION|N',
+        help=(
+            'The fraction of files (between 0 and 1) or the number of files to '
+            'process; when provided, the threshold only fails if the whole confidence '
+            'interval of the estimate is below it'
+        ),
+    )
+    sampling_group.add_argument(
+        '--seed',
+        type=int,
+        default=CLI_DEFAULTS['seed'],
+        help='Seed for the random selection of files to sample',
+    )
+    sampling_group.add_argument(
+        '--stratify',
+        action='store_true',
+        help='Whether to sample each directory proportionally to its number of files',
+    )
+    sampling_group.add_argument(
+        '--confidence',
+        type=_parse_confidence,
+        default=CLI_DEFAULTS['confidence'],
+        help='The confidence level of the interval around the estimate',
+    )
+
+    batch_group = parser.add_argument_group(
+        'Batch options', 'Isolate failures to the files causing them'
+    )
+    batch_group.add_argument(
+        '--keep-going',
+        action='store_true',
+        help=(
+            'Whether to record errors processing a file and continue with the rest, '
+            'summarizing the failures at the end (and exiting with code '
+            f'{FILE_ERRORS_EXIT_CODE})'
+        ),
+    )
+    batch_group.add_argument(
+        '--file-timeout',
         type=float,
-        default=CLI_DEFAULTS['threshold'],
-        help='The percentage of docstrings that must be present to pass',
+        metavar='SECONDS',
+        help=(
+            'The maximum time parsing and traversing a single file may take '
+            '(only enforced where SIGALRM is available)'
+        ),
+    )
+    batch_group.add_argument(
+        '--max-file-size',
+        type=int,
+        metavar='BYTES',
+        help='The maximum size of a single file',
+    )
+
+    run_group.add_argument(
+        '--cache',
+        metavar='PATH',
+        help=(
+            'File to cache the results in across runs, so that unchanged files '
+            '(including archive members and git blobs) are skipped; not used when '
+            'suggesting or making changes'
+        ),
+    )
+
+    run_group.add_argument(
+        '--triage',
+        action='store_true',
+        help=(
+            'Whether to only check the module docstring of generated files (marked by '
+            'an "@generated" comment in their header, or a "# Generated by ..." or '
+            '"DO NOT EDIT" comment before the first statement) and of files '
+            'without any classes or functions, without parsing them in full; not used '
+            'when suggesting or making changes'
+        ),
     )
-    args = parser.parse_args(argv)
 
-    if style := (
-        args.make_changes or args.make_changes_inplace or args.suggest_changes
+    run_group.add_argument(
+        '--deduplicate',
+        action='store_true',
+        help=(
+            'Whether to process files with the same contents (e.g., vendored or '
+            'generated copies) only once, reusing the result for each copy and '
+            'writing any changes to all of them'
+        ),
+    )
+
+    run_group.add_argument(
+        '--project-index',
+        metavar='PATH',
+        help=(
+            'File to store an index of the classes across all the files in, so that '
+            'methods overriding a documented method in a base class are not required '
+            'to have a docstring; only the files that changed are indexed again'
+        ),
+    )
+
+    run_group.add_argument(
+        '--hook',
+        action='append',
+        default=[],
+        metavar='SPEC',
+        help=(
+            'Hook to notify of the events while processing the files, given as the '
+            'name of an entry point in the docstringify.hooks group or as a module '
+            'path, optionally followed by a colon and the name of an object in the '
+            'module (can be repeated)'
+        ),
+    )
+
+    git_group = parser.add_argument_group(
+        'Git options',
+        'Read the files from the git object database instead of the working tree, '
+        'treating any filenames as pathspecs to limit them',
+    )
+    git_source = git_group.add_mutually_exclusive_group()
+    git_source.add_argument(
+        '--git-rev',
+        metavar='REV',
+        help='Check the Python files in this revision (e.g., a commit or branch)',
+    )
+    git_source.add_argument(
+        '--staged',
+        action='store_true',
+        help='Check the staged version of the Python files changed in the index',
+    )
+
+    sharding_group = parser.add_argument_group(
+        'Sharding options', 'Split the files across multiple machines'
+    )
+    sharding_group.add_argument(
+        '--shard',
+        type=_parse_shard,
+        metavar='i/n',
+        help='Only process the files in shard i (1-based) out of n shards',
+    )
+    sharding_group.add_argument(
+        '--emit-partial',
+        metavar='PATH',
+        help=(
+            f'Write the raw results to PATH for combining with "{PROG} merge" '
+            "(the threshold is then only checked for this run's files)"
+        ),
+    )
+
+    budget_group = parser.add_argument_group(
+        'Time budget options', 'Stop cleanly when the time available runs out'
+    )
+    budget_group.add_argument(
+        '--time-budget',
+        type=float,
+        metavar='SECONDS',
+        help=(
+            'The maximum time the run may take, after which the remaining files are '
+            'skipped and the threshold is checked for the files covered; the files '
+            'changed since the last run come first, followed by those missing the most '
+            'docstrings (see --run-history)'
+        ),
+    )
+    budget_group.add_argument(
+        '--run-history',
+        metavar='PATH',
+        help=(
+            'File to record the state of each file in and the number of docstrings it '
+            'was missing, to prioritize the files in time-budgeted runs'
+        ),
+    )
+
+    _add_gate_options(parser)
+    return parser
+
+
+def _validate_args(
+    parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> list[PathThreshold]:
+    if args.sample and args.emit_partial:
+        parser.error('--sample cannot be combined with --emit-partial')
+
+    if (args.make_changes or args.make_changes_inplace) and any(
+        is_archive(file) for file in args.filenames
+    ):
+        parser.error('changes cannot be made to files inside archives')
+
+    if (args.make_changes or args.make_changes_inplace) and (
+        args.git_rev or args.staged
     ):
-        converter = STYLES[style]
-    else:
-        converter = None
+        parser.error('changes cannot be made with --git-rev or --staged')
+
+    if STDIN in args.filenames and (args.git_rev or args.staged):
+        parser.error('- cannot be combined with --git-rev or --staged')
+
+    if _is_streaming(args) and args.filenames != [STDIN]:
+        parser.error('- must be the only filename when making changes')
+
+    if args.project_index and (args.git_rev or args.staged):
+        parser.error('--project-index cannot be combined with --git-rev or --staged')
+
+    path_thresholds = _validate_gate_options(parser, args)
+    if path_thresholds and args.sample:
+        parser.error('path thresholds cannot be combined with --sample')
+
+    if args.time_budget is not None and args.time_budget <= 0:
+        parser.error('--time-budget must be positive')
+
+    if args.time_budget and args.sample:
+        parser.error('--time-budget cannot be combined with --sample')
+
+    return path_thresholds
 
-    get_docstring_processor = (
-        partial(
-            DocstringTransformer,
-            converter=converter,
-            **{'overwrite': bool(args.make_changes_inplace)},
+
+def _get_source(args: argparse.Namespace) -> str | None:
+    # where the files are read from, if not from disk (recorded in partial results)
+    if args.staged:
+        return STAGED_SOURCE
+    if args.git_rev:
+        return GIT_SOURCE
+    return None
+
+
+def _get_repo_path(source: str | None) -> Callable[[str], str] | None:
+    # files from git are matched by their path in the repository, without the revision
+    if source is not None:
+        return lambda filename: filename.partition(':')[2]
+    return None
+
+
+def _is_streaming(args: argparse.Namespace) -> bool:
+    # the edited code from standard input goes to standard output, like formatters
+    return bool(args.make_changes or args.make_changes_inplace) and (
+        STDIN in args.filenames
+    )
+
+
+class _FileSources(NamedTuple):
+    filenames: list[str]
+    get_sources: Callable[[str], Iterable[SourceFile]]
+    get_fingerprint: Callable[[str], str | None]
+
+
+def _get_file_sources(
+    parser: argparse.ArgumentParser, args: argparse.Namespace, resources: ExitStack
+) -> _FileSources:
+    if not (args.git_rev or args.staged):
+        return _FileSources(
+            args.filenames,
+            partial(iter_sources, stdin_filename=args.stdin_filename),
+            file_fingerprint,
+        )
+
+    try:
+        blobs = (
+            list_revision_blobs(args.git_rev, args.filenames)
+            if args.git_rev
+            else list_staged_blobs(args.filenames)
         )
-        if args.make_changes or args.make_changes_inplace
-        else partial(DocstringVisitor, converter=converter)
+    except GitError as error:
+        parser.error(str(error))
+
+    prefix = f'{args.git_rev}:' if args.git_rev else ':'
+    blobs_by_name = {f'{prefix}{blob.path}': blob for blob in blobs}
+    blob_reader = resources.enter_context(GitBlobReader())
+
+    def get_sources(filename: str) -> list[SourceFile]:
+        return [blob_reader.get_source(blobs_by_name[filename], prefix)]
+
+    def get_fingerprint(filename: str) -> str:
+        return blobs_by_name[filename].sha
+
+    return _FileSources(list(blobs_by_name), get_sources, get_fingerprint)
+
+
+def _build_project_index(path: str, filenames: list[str]) -> ProjectIndex:
+    project_index = ProjectIndex(path)
+    project_index.build(filenames)
+    project_index.save()
+    print(
+        f'Project index: indexed {project_index.files_indexed} file(s) and reused '
+        f'{project_index.files_reused}'
     )
+    return project_index
 
-    docstrings_processed = missing_docstrings = 0
-    for file in args.filenames:
-        processor = get_docstring_processor(file)
-        processor.process_file()
-        missing_docstrings += len(processor.missing_docstrings)
-        docstrings_processed += processor.docstrings_inspected
 
-    if (
-        docstrings_processed
-        and (missing_percentage := (missing_docstrings / docstrings_processed))
-        > 1 - args.threshold
-    ):
-        print(f'Missing {missing_percentage:.0%} of docstrings', file=sys.stderr)
+def _get_cache_settings(
+    args: argparse.Namespace,
+    project_index: ProjectIndex | None,
+    export_index: ExportIndex | None,
+    validator: type[DocstringConverter] | None,
+) -> str:
+    return json.dumps(
+        {
+            **{option: getattr(args, option) for option in CACHE_SENSITIVE_OPTIONS},
+            # results depend on the documented methods in other files
+            'project_index': project_index and project_index.fingerprint,
+            'export_index': export_index and export_index.fingerprint,
+            # named after the hash of the templates, if any
+            'validator': validator and validator.__name__,
+        },
+        sort_keys=True,
+    )
+
+
+class _RunOutcome(NamedTuple):
+    results: dict[str, list[FileResult]]
+    errors: list[FileError]
+    uncovered_files: list[str]
+
+
+def _process_files(
+    files: list[str],
+    get_docstring_processor: Callable[..., DocstringVisitor],
+    args: argparse.Namespace,
+    file_sources: _FileSources,
+    cache: ResultCache | None,
+    triage: Triage | None,
+    hooks: HookDispatcher | None,
+    duplicates: DuplicateIndex | None,
+) -> _RunOutcome:
+    run_history = RunHistory(args.run_history)
+    fingerprints = (
+        {file: file_sources.get_fingerprint(file) for file in files}
+        if args.time_budget or args.run_history
+        else {}
+    )
+    if args.time_budget:
+        files = run_history.prioritize(files, fingerprints)
+    deadline = time.monotonic() + args.time_budget if args.time_budget else None
+
+    results, errors, uncovered_files = defaultdict(list), [], []
+    for index, file in enumerate(files):
+        # a file interrupted by the time budget isn't counted at all
+        file_results, file_errors = [], []
+        try:
+            for result in process_file(
+                file,
+                get_docstring_processor,
+                get_sources=file_sources.get_sources,
+                keep_going=args.keep_going,
+                time_limit_seconds=args.file_timeout,
+                size_limit=args.max_file_size,
+                cache=cache,
+                triage=triage,
+                deadline=deadline,
+                hooks=hooks,
+                duplicates=duplicates,
+            ):
+                if isinstance(result, FileError):
+                    file_errors.append(result)
+                else:
+                    file_results.append(result)
+        except TimeBudgetExceededError:
+            uncovered_files = files[index:]
+            break
+
+        errors.extend(file_errors)
+        if file_results:
+            results[file] = file_results
+        if not file_errors:
+            run_history.record(file, fingerprints.get(file), file_results)
+
+    run_history.save()
+    return _RunOutcome(results, errors, uncovered_files)
+
+
+def _report_run(
+    outcome: _RunOutcome,
+    files_total: int,
+    time_budget: float | None,
+    triage: Triage | None,
+    duplicates: DuplicateIndex | None,
+) -> None:
+    if triage is not None and triage.counts:
         print(
-            f'Your settings require {args.threshold:.0%} of docstrings to be present',
+            f'Triage: {triage.counts[GENERATED]} generated file(s) and '
+            f'{triage.counts[NO_DEFINITIONS]} file(s) without definitions only had '
+            'their module docstring checked'
+        )
+
+    if duplicates is not None and duplicates.duplicates:
+        print(
+            f'Deduplicated {duplicates.duplicates} file(s) with the same contents '
+            'as a file processed earlier'
+        )
+
+    if uncovered_files := outcome.uncovered_files:
+        print(
+            f'Time budget of {time_budget} seconds exhausted: covered '
+            f'{files_total - len(uncovered_files)} of {files_total} file(s), so the '
+            f'results are partial; the remaining {len(uncovered_files)} file(s) '
+            'were not checked:',
             file=sys.stderr,
         )
-        return 1
-    return 0
+        for file in uncovered_files:
+            print(f'  {file}', file=sys.stderr)
+
+
+def _check_results(
+    args: argparse.Namespace,
+    results: Mapping[str, list[FileResult]],
+    strata: list[Stratum] | None,
+    path_thresholds: list[PathThreshold],
+) -> int:
+    if strata is not None:
+        estimate = estimate_missing_percentage(
+            [
+                (
+                    stratum.population_size,
+                    [
+                        summarize_results(results[file])[:2]
+                        for file in stratum.filenames
+                        if file in results
+                    ],
+                )
+                for stratum in strata
+            ],
+            confidence=args.confidence,
+        )
+        return check_estimated_threshold(estimate, args.threshold)
+
+    get_path = _get_repo_path(_get_source(args))
+    return _check_gate(
+        {
+            get_path(file) if get_path else file: file_results
+            for file, file_results in results.items()
+        },
+        path_thresholds,
+        args.threshold,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Flag missing docstrings and, optionally, generate them from signatures and
+    type annotations.
+
+    Parameters
+    ----------
+    argv : Sequence[str] | None, default=None
+        The arguments passed on the command line.
+
+    Returns
+    -------
+    int
+        Exit code for the process, where non-zero values indicate errors, and ``1``
+        indicates that more than the allowed percentage of docstrings were missing or
+        that stale docstrings were found, and ``3`` indicates that some files couldn't
+        be processed (see ``--keep-going``).
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == 'merge':
+        return merge(argv[1:])
+
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    path_thresholds = _validate_args(parser, args)
+
+    try:
+        baseline = _read_baseline(
+            args.baseline, get_path=_get_repo_path(_get_source(args))
+        )
+        hooks = HookDispatcher(map(load_hook, args.hook)) if args.hook else None
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+
+    # when streaming the edited code, standard output is reserved for it
+    resources = ExitStack()
+    output_stream = None
+    if _is_streaming(args):
+        output_stream = sys.stdout.buffer
+        resources.enter_context(redirect_stdout(sys.stderr))
+
+    with resources:
+        file_sources = _get_file_sources(parser, args, resources)
+        filenames = file_sources.filenames
+        if args.shard:
+            filenames = args.shard.select(filenames)
+
+        if style := (
+            args.make_changes or args.make_changes_inplace or args.suggest_changes
+        ):
+            converter = _get_converter(parser, style)
+        else:
+            converter = None
+        validator = _get_converter(parser, args.validate_docstrings)
+
+        symbol_filter = SymbolFilter(
+            names=args.ignore_name,
+            private=args.ignore_private,
+            dunder=args.ignore_dunder,
+            max_depth=args.max_depth,
+            decorators=args.ignore_decorator,
+            kinds=args.ignore_kind,
+        )
+
+        # the index covers all the files, even those in other shards or not sampled
+        project_index = (
+            _build_project_index(args.project_index, args.filenames)
+            if args.project_index
+            else None
+        )
+
+        # resolved once for all the files, so that cached results stay valid
+        export_index = None
+        if args.public_only:
+            export_index = ExportIndex()
+            export_index.build(filenames)
+
+        processor_options = {
+            'converter': converter,
+            'symbol_filter': symbol_filter,
+            'validator': validator,
+            'project_index': project_index,
+            'export_index': export_index,
+            'hooks': hooks,
+        }
+        get_docstring_processor = (
+            partial(
+                DocstringTransformer,
+                **processor_options,
+                **{
+                    'overwrite': bool(args.make_changes_inplace),
+                    'output_stream': output_stream,
+                },
+            )
+            if args.make_changes or args.make_changes_inplace
+            else partial(DocstringVisitor, **processor_options)
+        )
+
+        strata = (
+            sample_files(filenames, args.sample, seed=args.seed, stratify=args.stratify)
+            if args.sample
+            else None
+        )
+        files = (
+            [file for stratum in strata for file in stratum.filenames]
+            if strata is not None
+            else filenames
+        )
+
+        cache = (
+            ResultCache(
+                args.cache,
+                settings=_get_cache_settings(
+                    args, project_index, export_index, validator
+                ),
+            )
+            if args.cache and not converter
+            else None
+        )
+        triage = (
+            Triage(symbol_filter, export_index)
+            if args.triage and not converter
+            else None
+        )
+        # the result depends on the package only when indexing the whole project
+        duplicates = (
+            DuplicateIndex(package_sensitive=bool(project_index or export_index))
+            if args.deduplicate
+            else None
+        )
+
+        outcome = _process_files(
+            files,
+            get_docstring_processor,
+            args,
+            file_sources,
+            cache=cache,
+            triage=triage,
+            hooks=hooks,
+            duplicates=duplicates,
+        )
+        if cache is not None:
+            cache.save()
+        _report_run(outcome, len(files), args.time_budget, triage, duplicates)
+
+        results, errors = outcome.results, outcome.errors
+        all_results = [
+            result for file_results in results.values() for result in file_results
+        ]
+
+        if hooks and hooks.on_run_done is not None:
+            hooks.on_run_done(all_results, errors)
+
+        if args.emit_partial:
+            write_partial(
+                args.emit_partial,
+                all_results,
+                errors=errors,
+                shard=args.shard,
+                uncovered_files=outcome.uncovered_files,
+                source=_get_source(args),
+            )
+
+        if args.baseline:
+            baseline = apply_baseline(
+                args.baseline,
+                baseline,
+                all_results,
+                update=args.update_baseline,
+                signatures=args.baseline_signatures,
+                complete=not (
+                    args.sample
+                    or args.shard
+                    or args.staged
+                    or errors
+                    or outcome.uncovered_files
+                ),
+                get_path=_get_repo_path(_get_source(args)),
+            )
+            results = {file: baseline.filter(results[file]) for file in results}
+            all_results = baseline.filter(all_results)
+
+        exit_code = _check_results(args, results, strata, path_thresholds)
+        exit_code |= check_stale_docstrings(summarize_results(all_results)[2])
+        return check_errors(errors) or exit_code
 
 
 if __name__ == '__main__':
@@ -20,3 +20,34 @@ class Parameter(NamedTuple):
 class Function(NamedTuple):
     parameters: tuple[Parameter, ...]
     return_type: str | None
+
+
+class DocumentedSections(NamedTuple):
+    parameters: tuple[str, ...]
+    has_parameters_section: bool
+    has_returns_section: bool
+
+
+class DocstringMismatch(NamedTuple):
+    name: str
+    added: tuple[str, ...]
+    removed: tuple[str, ...]
+    renamed: tuple[tuple[str, str], ...]
+    missing_returns: bool
+
+    def __str__(self) -> str:
+        problems = [
+            f'{description}: {", ".join(names)}'
+            for description, names in [
+                ('undocumented parameters', self.added),
+                ('documented parameters not in the signature', self.removed),
+                (
+                    'renamed parameters',
+                    [f'{old} -> {new}' for old, new in self.renamed],
+                ),
+            ]
+            if names
+        ]
+        if self.missing_returns:
+            problems.append('missing returns section')
+        return f'{self.name} has a stale docstring ({"; ".join(problems)})'
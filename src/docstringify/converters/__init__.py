@@ -3,9 +3,12 @@
 from .base import DocstringConverter
 from .google import GoogleDocstringConverter
 from .numpydoc import NumpydocDocstringConverter
+from .template import TemplateDocstringConverter, load_template_converter
 
 __all__ = [
     'DocstringConverter',
     'GoogleDocstringConverter',
     'NumpydocDocstringConverter',
+    'TemplateDocstringConverter',
+    'load_template_converter',
 ]
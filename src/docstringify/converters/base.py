@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import ast
+import re
 import textwrap
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from ..components import DocstringMismatch, DocumentedSections
 from ..exceptions import InvalidDocstringError
 
 if TYPE_CHECKING:
@@ -14,6 +16,26 @@ if TYPE_CHECKING:
     from ..nodes.base import DocstringNode
     from ..nodes.function import FunctionDocstringNode
 
+UNDERLINE = re.compile(r'-{3,}|={3,}')
+
+
+def normalize_parameter_name(name: str) -> str:
+    """
+    Normalize a parameter name for comparisons, since star arguments may or may not be
+    documented with their (possibly escaped) stars.
+
+    Parameters
+    ----------
+    name : str
+        The parameter name, e.g., ``*args``, ``\\*args``, or ``args``.
+
+    Returns
+    -------
+    str
+        The parameter name without any stars or backslashes.
+    """
+    return name.lstrip('\\*')
+
 
 class DocstringConverter(ABC):
     r"""
@@ -41,6 +63,14 @@ class DocstringConverter(ABC):
         self._returns_section_template = returns_section_template
         self._quote = quote
 
+        self._section_headers = {
+            section: tuple(template.split(f'{{{section}}}')[0].rstrip().splitlines())
+            for section, template in [
+                ('parameters', parameters_section_template),
+                ('returns', returns_section_template),
+            ]
+        }
+
     @abstractmethod
     def to_class_docstring(self, docstring_node: DocstringNode, indent: int) -> str:
         """
@@ -121,6 +151,25 @@ class DocstringConverter(ABC):
         """
         pass
 
+    @abstractmethod
+    def parse_parameter_entry(self, entry: str) -> list[str]:
+        """
+        An abstract method defining how to extract the parameter names from the first
+        line of an entry in the parameters section of an existing docstring, i.e., the
+        inverse of :meth:`format_parameter`.
+
+        Parameters
+        ----------
+        entry : str
+            The first line of the entry, without leading whitespace.
+
+        Returns
+        -------
+        list[str]
+            The names of the parameters documented by the entry.
+        """
+        pass
+
     def create_parameters_section(self, parameters: tuple[Parameter, ...]) -> str:
         """
         Given the parameters of a function, create the parameters section of the docstring.
@@ -184,6 +233,147 @@ class DocstringConverter(ABC):
             return self._returns_section_template.format(returns=return_text)
         return ''
 
+    def _match_section_header(self, lines: list[str], line_number: int) -> str | None:
+        for section, header in self._section_headers.items():
+            if header and all(
+                line_number + offset < len(lines)
+                and lines[line_number + offset].strip() == header_line.strip()
+                for offset, header_line in enumerate(header)
+            ):
+                return section
+        return None
+
+    def parse_docstring(self, docstring: str) -> DocumentedSections:
+        """
+        Extract the documented parameters and returns from an existing docstring.
+
+        This makes a single pass over the lines of the docstring, recognizing the
+        parameters and returns sections by the headers of the section templates this
+        converter was initialized with. A section ends at the next header (of any
+        section) or when the indentation drops below that of its entries.
+
+        Parameters
+        ----------
+        docstring : str
+            The (cleaned) docstring, as returned by :func:`ast.get_docstring`.
+
+        Returns
+        -------
+        DocumentedSections
+            The names of the documented parameters, and which sections are present.
+        """
+        lines = docstring.expandtabs().splitlines()
+        parameters = []
+        found_sections = set()
+        section = entry_indent = None
+
+        line_number = 0
+        while line_number < len(lines):
+            if matched_section := self._match_section_header(lines, line_number):
+                found_sections.add(matched_section)
+                section, entry_indent = matched_section, None
+                line_number += len(self._section_headers[matched_section])
+                continue
+
+            line = lines[line_number]
+            line_number += 1
+
+            if section is None or not (entry := line.strip()):
+                continue
+
+            if line_number < len(lines) and UNDERLINE.fullmatch(
+                lines[line_number].strip()
+            ):
+                # the start of a section we don't parse
+                section = None
+                continue
+
+            indent = len(line) - len(line.lstrip())
+            if entry_indent is None:
+                entry_indent = indent
+            if indent < entry_indent:
+                section = None
+            elif indent == entry_indent and section == 'parameters':
+                parameters.extend(self.parse_parameter_entry(entry))
+
+        return DocumentedSections(
+            parameters=tuple(parameters),
+            has_parameters_section='parameters' in found_sections,
+            has_returns_section='returns' in found_sections,
+        )
+
+    def validate_docstring(
+        self, docstring_node: FunctionDocstringNode
+    ) -> DocstringMismatch | None:
+        """
+        Compare the parameters and returns sections of an existing function docstring
+        against the function's signature.
+
+        Only docstrings with a parameters or a returns section are validated.
+
+        Parameters
+        ----------
+        docstring_node : FunctionDocstringNode
+            An instance of :class:`.FunctionDocstringNode`, which wraps an instance of
+            :class:`ast.FunctionDef` or :class:`ast.AsyncFunctionDef`, adding additional
+            context relevant for Docstringify. Its return statements (and whether it
+            is a generator) must have been collected already.
+
+        Returns
+        -------
+        DocstringMismatch | None
+            The differences between the docstring and the signature, if there are any.
+        """
+        if not docstring_node.docstring:
+            return None
+
+        sections = self.parse_docstring(docstring_node.docstring)
+        if not (sections.has_parameters_section or sections.has_returns_section):
+            return None
+
+        function = docstring_node.to_function()
+        actual = [normalize_parameter_name(p.name) for p in function.parameters]
+        documented = [normalize_parameter_name(name) for name in sections.parameters]
+
+        renamed = tuple(
+            (old_name, new_name)
+            for new_name, old_name in zip(actual, documented)
+            if new_name != old_name
+            and new_name not in documented
+            and old_name not in actual
+        )
+        renamed_from = {old_name for old_name, _ in renamed}
+        renamed_to = {new_name for _, new_name in renamed}
+
+        mismatch = DocstringMismatch(
+            name=docstring_node.fully_qualified_name,
+            added=tuple(
+                name
+                for name in actual
+                if name not in documented and name not in renamed_to
+            ),
+            removed=tuple(
+                name
+                for name in documented
+                if name not in actual and name not in renamed_from
+            ),
+            renamed=renamed,
+            # generators document what they yield instead
+            missing_returns=(
+                function.return_type is not None
+                and not sections.has_returns_section
+                and not docstring_node.is_generator
+            ),
+        )
+        if (
+            mismatch.added
+            or mismatch.removed
+            or mismatch.renamed
+            or mismatch.missing_returns
+        ):
+            return mismatch
+        return None
+
     def format_docstring(self, docstring: str | list[str], indent: int) -> str:
         """
         Format the docstring with the requested level of indentation and surrounding
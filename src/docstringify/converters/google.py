@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING
 
 from ..components import DESCRIPTION_PLACEHOLDER, NO_DEFAULT, Parameter
@@ -84,6 +85,24 @@ class GoogleDocstringConverter(DocstringConverter):
             f'{f" Defaults to {parameter.default}." if parameter.default != NO_DEFAULT else ""}'
         )
 
+    def parse_parameter_entry(self, entry: str) -> list[str]:
+        """
+        Extract the parameter names from the first line of an entry in the parameters
+        section of an existing docstring.
+
+        Parameters
+        ----------
+        entry : str
+            The first line of the entry, without leading whitespace.
+
+        Returns
+        -------
+        list[str]
+            The names of the parameters documented by the entry.
+        """
+        name, *_ = re.split(r'\s*[(:]', entry, maxsplit=1)
+        return [name]
+
     def format_return(self, return_type: str | None) -> str:
         """
         Convert a return type into an entry in the returns section of the docstring.
@@ -85,6 +85,24 @@ class NumpydocDocstringConverter(DocstringConverter):
             f'\n    {DESCRIPTION_PLACEHOLDER}'
         )
 
+    def parse_parameter_entry(self, entry: str) -> list[str]:
+        """
+        Extract the parameter names from the first line of an entry in the parameters
+        section of an existing docstring.
+
+        Parameters
+        ----------
+        entry : str
+            The first line of the entry, without leading whitespace.
+
+        Returns
+        -------
+        list[str]
+            The names of the parameters documented by the entry.
+        """
+        names, *_ = entry.split(' :', maxsplit=1)
+        return [name.strip() for name in names.split(',') if name.strip()]
+
     def format_return(self, return_type: str | None) -> str:
         """
         Convert a return type into an entry in the returns section of the docstring.
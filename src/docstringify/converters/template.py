@@ -0,0 +1,448 @@
+"""Docstring converter driven by user-defined templates."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import string
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, NamedTuple
+
+from ..components import DESCRIPTION_PLACEHOLDER, NO_DEFAULT, Parameter
+from ..exceptions import InvalidTemplateError
+from .base import DocstringConverter
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from ..nodes.base import DocstringNode
+    from ..nodes.function import FunctionDocstringNode
+
+# the fields each template can use, in the order the render functions take them
+TEMPLATE_FIELDS = {
+    'module': ('name', 'description'),
+    'class': ('name', 'description'),
+    'function': ('name', 'description', 'parameters', 'returns'),
+    'parameters_section': ('parameters',),
+    'returns_section': ('returns',),
+    'parameter': ('name', 'type', 'category', 'default', 'description'),
+    'category': ('category',),
+    'default': ('default',),
+    'return': ('type', 'description'),
+}
+
+# templates that aren't provided default to the numpydoc style
+DEFAULT_TEMPLATES = {
+    'module': '{description}',
+    'class': '{description}',
+    'function': '{description}\n\n{parameters}\n\n{returns}',
+    'parameters_section': 'Parameters\n----------\n{parameters}',
+    'returns_section': 'Returns\n-------\n{returns}',
+    'parameter': '{name} : {type}{category}{default}\n    {description}',
+    'category': ', {category}',
+    'default': ', default={default}',
+    'return': '{type}\n    {description}',
+}
+
+TEMPLATE_HEADER = re.compile(rf'\[({"|".join(TEMPLATE_FIELDS)})\]')
+
+
+def parse_templates(text: str) -> dict[str, str]:
+    """
+    Split the contents of a template file into its templates.
+
+    Each template starts with a line containing only its name in square brackets,
+    e.g., ``[parameter]``, and continues until the next one; trailing blank lines are
+    ignored, and any lines before the first template are treated as comments.
+
+    Parameters
+    ----------
+    text : str
+        The contents of the template file.
+
+    Returns
+    -------
+    dict[str, str]
+        The templates by name, including the defaults for any that weren't provided.
+
+    Raises
+    ------
+    InvalidTemplateError
+        If the file doesn't define any templates, which likely means it isn't a
+        template file at all.
+    """
+    templates = dict(DEFAULT_TEMPLATES)
+    name, lines = None, []
+    for line in text.splitlines():
+        if header := TEMPLATE_HEADER.fullmatch(line.strip()):
+            if name is not None:
+                templates[name] = '\n'.join(lines).rstrip('\n')
+            name, lines = header.group(1), []
+        else:
+            lines.append(line)
+
+    if name is None:
+        raise InvalidTemplateError(
+            None,
+            'no templates found; each starts with a line like '
+            f'{", ".join(f"[{name}]" for name in TEMPLATE_FIELDS)}',
+        )
+    templates[name] = '\n'.join(lines).rstrip('\n')
+    return templates
+
+
+def compile_template(name: str, template: str) -> Callable[..., str]:
+    """
+    Compile a template into a function rendering it, so that the template is only
+    parsed and validated once.
+
+    Parameters
+    ----------
+    name : str
+        The name of the template, which determines the fields it can use (see
+        ``TEMPLATE_FIELDS``).
+    template : str
+        The template, with fields in braces, e.g., ``{name} : {type}``, and literal
+        braces doubled.
+
+    Returns
+    -------
+    Callable[..., str]
+        A function taking the fields as positional arguments and returning the
+        rendered template.
+    """
+    fields = TEMPLATE_FIELDS[name]
+    try:
+        parsed = list(string.Formatter().parse(template))
+    except ValueError:
+        raise InvalidTemplateError(name, 'unbalanced braces') from None
+
+    # the template is rewritten with positional fields, e.g., {0} : {1}
+    parts = []
+    for literal, field, format_spec, conversion in parsed:
+        parts.append(literal.replace('{', '{{').replace('}', '}}'))
+        if field is None:
+            continue
+        if field not in fields or format_spec or conversion:
+            raise InvalidTemplateError(name, f'unsupported field {{{field}}}')
+        parts.append(f'{{{fields.index(field)}}}')
+    return ''.join(parts).format
+
+
+def _drop_section_line(template: str, section: str) -> str:
+    # a line with only an empty section is dropped, along with the blank line before it
+    return re.sub(rf'(\n[ \t]*)?\n[ \t]*\{{{section}\}}[ \t]*(?=\n|$)', '', template)
+
+
+class CompiledTemplates(NamedTuple):
+    source: dict[str, str]
+    module: Callable[..., str]
+    class_: Callable[..., str]
+    functions: dict[tuple[bool, bool], Callable[..., str]]
+    parameters_section: Callable[..., str]
+    returns_section: Callable[..., str]
+    parameter: Callable[..., str]
+    category: Callable[..., str]
+    default: Callable[..., str]
+    return_: Callable[..., str]
+    parameter_separator: str
+
+    @classmethod
+    def from_templates(cls, templates: dict[str, str]) -> CompiledTemplates:
+        """
+        Compile the templates into render functions.
+
+        Parameters
+        ----------
+        templates : dict[str, str]
+            The templates by name (see :func:`parse_templates`).
+
+        Returns
+        -------
+        CompiledTemplates
+            The render functions, including one for each combination of the
+            parameters and returns sections being present in function docstrings.
+        """
+        for name, field in [
+            ('parameters_section', 'parameters'),
+            ('returns_section', 'returns'),
+        ]:
+            if f'{{{field}}}' not in templates[name]:
+                raise InvalidTemplateError(name, f'missing the {{{field}}} field')
+
+        functions = {}
+        for has_parameters in (True, False):
+            for has_returns in (True, False):
+                template = templates['function']
+                if not has_parameters:
+                    template = _drop_section_line(template, 'parameters')
+                if not has_returns:
+                    template = _drop_section_line(template, 'returns')
+                functions[has_parameters, has_returns] = compile_template(
+                    'function', template
+                )
+
+        # the text after the name in a parameter entry, to parse existing entries
+        _, _, after_name = templates['parameter'].partition('{name}')
+        separator = re.split(r'[{\n]', after_name, maxsplit=1)[0].strip()
+
+        return cls(
+            source=templates,
+            module=compile_template('module', templates['module']),
+            class_=compile_template('class', templates['class']),
+            functions=functions,
+            parameters_section=compile_template(
+                'parameters_section', templates['parameters_section']
+            ),
+            returns_section=compile_template(
+                'returns_section', templates['returns_section']
+            ),
+            parameter=compile_template('parameter', templates['parameter']),
+            category=compile_template('category', templates['category']),
+            default=compile_template('default', templates['default']),
+            return_=compile_template('return', templates['return']),
+            parameter_separator=separator,
+        )
+
+
+class TemplateDocstringConverter(DocstringConverter):
+    """
+    Class defining the DocstringConverter API for docstrings following user-defined
+    templates, which are compiled once (see :func:`load_template_converter`) and then
+    shared by all instances.
+
+    Parameters
+    ----------
+    quote : bool
+        Whether to surround the generated docstrings in triple quotes.
+    """
+
+    templates: CompiledTemplates = CompiledTemplates.from_templates(DEFAULT_TEMPLATES)
+
+    def __init__(self, quote: bool) -> None:
+        super().__init__(
+            parameters_section_template=self.templates.source['parameters_section'],
+            returns_section_template=self.templates.source['returns_section'],
+            quote=quote,
+        )
+
+    def _format_lines(self, docstring: str, indent: int) -> str:
+        lines = docstring.split('\n')
+        return self.format_docstring(
+            lines if len(lines) > 1 else docstring, indent=indent
+        )
+
+    def to_function_docstring(
+        self, docstring_node: FunctionDocstringNode, indent: int
+    ) -> str:
+        """
+        Convert an AST node into a function docstring.
+
+        Parameters
+        ----------
+        docstring_node : FunctionDocstringNode
+            An instance of :class:`.FunctionDocstringNode`, which wraps an instance of
+            :class:`ast.FunctionDef` or :class:`ast.AsyncFunctionDef`, adding additional
+            context relevant for Docstringify.
+        indent : int
+            The number of spaces by which to indent the docstring.
+
+        Returns
+        -------
+        str
+            The function docstring.
+        """
+        function = docstring_node.to_function()
+        parameters_section = self.create_parameters_section(function.parameters)
+        returns_section = self.create_returns_section(function.return_type)
+        render = self.templates.functions[
+            bool(parameters_section), bool(returns_section)
+        ]
+        return self._format_lines(
+            render(
+                docstring_node.name,
+                DESCRIPTION_PLACEHOLDER,
+                parameters_section,
+                returns_section,
+            ),
+            indent=indent,
+        )
+
+    def create_parameters_section(self, parameters: tuple[Parameter, ...]) -> str:
+        """
+        Given the parameters of a function, create the parameters section of the docstring.
+
+        Parameters
+        ----------
+        parameters : tuple[Parameter, ...]
+            Tuple of :class:`.Parameter` instances, which each provide information on
+            individual function parameters, including their names, types, and default
+            values (if present).
+
+        Returns
+        -------
+        str
+            The parameters section of the docstring.
+        """
+        if parameters:
+            return self.templates.parameters_section(
+                '\n'.join(self.format_parameter(parameter) for parameter in parameters)
+            )
+        return ''
+
+    def format_parameter(self, parameter: Parameter) -> str:
+        """
+        Convert a :class:`.Parameter` instance into an entry in the parameters section
+        of the docstring.
+
+        Parameters
+        ----------
+        parameter : Parameter
+            Information on the function parameter, including its name, type, and default
+            value (if it has one).
+
+        Returns
+        -------
+        str
+            An entry for the parameter for use in the parameters section of the docstring.
+        """
+        templates = self.templates
+        return templates.parameter(
+            parameter.name,
+            parameter.type_,
+            templates.category(parameter.category) if parameter.category else '',
+            templates.default(parameter.default)
+            if parameter.default != NO_DEFAULT
+            else '',
+            DESCRIPTION_PLACEHOLDER,
+        )
+
+    def parse_parameter_entry(self, entry: str) -> list[str]:
+        """
+        Extract the parameter names from the first line of an entry in the parameters
+        section of an existing docstring.
+
+        Parameters
+        ----------
+        entry : str
+            The first line of the entry, without leading whitespace.
+
+        Returns
+        -------
+        list[str]
+            The names of the parameters documented by the entry, which end where the
+            text following the name in the parameter template starts.
+        """
+        names = (
+            entry.split(self.templates.parameter_separator, maxsplit=1)[0]
+            if self.templates.parameter_separator
+            else entry.split(maxsplit=1)[0]
+        )
+        return [name.strip() for name in names.split(',') if name.strip()]
+
+    def create_returns_section(self, return_type: str | None) -> str:
+        """
+        Given a return type name or the lack of a return (``None``), create the returns
+        section of the docstring.
+
+        Parameters
+        ----------
+        return_type : str | None
+            The return type name for the function. This will be either a string for the
+            name (e.g., ``list[str]``) or ``None``, if ``None`` is returned.
+
+        Returns
+        -------
+        str
+            The returns section part of the docstring.
+        """
+        if return_text := self.format_return(return_type):
+            return self.templates.returns_section(return_text)
+        return ''
+
+    def format_return(self, return_type: str | None) -> str:
+        """
+        Convert a return type into an entry in the returns section of the docstring.
+
+        Parameters
+        ----------
+        return_type : str | None
+            The return type name for the function. This will be either a string for the
+            name (e.g., ``list[str]``) or ``None``, if ``None`` is returned.
+
+        Returns
+        -------
+        str
+            The return type entry for use in the returns section of the docstring.
+        """
+        if return_type:
+            return self.templates.return_(return_type, DESCRIPTION_PLACEHOLDER)
+        return ''
+
+    def to_module_docstring(self, docstring_node: DocstringNode) -> str:
+        """
+        Convert an AST node into a module docstring.
+
+        Parameters
+        ----------
+        docstring_node : DocstringNode
+            An instance of :class:`.DocstringNode`, which wraps an instance of
+            :class:`ast.Module`, adding additional context relevant for Docstringify.
+
+        Returns
+        -------
+        str
+            The module docstring.
+        """
+        return self._format_lines(
+            self.templates.module(docstring_node.name, DESCRIPTION_PLACEHOLDER),
+            indent=0,
+        )
+
+    def to_class_docstring(self, docstring_node: DocstringNode, indent: int) -> str:
+        """
+        Convert an AST node into a class docstring.
+
+        Parameters
+        ----------
+        docstring_node : DocstringNode
+            An instance of :class:`.DocstringNode`, which wraps an instance of
+            :class:`ast.ClassDef`, adding additional context relevant for Docstringify.
+        indent : int
+            The number of spaces by which to indent the docstring.
+
+        Returns
+        -------
+        str
+            The class docstring.
+        """
+        return self._format_lines(
+            self.templates.class_(docstring_node.name, DESCRIPTION_PLACEHOLDER),
+            indent=indent,
+        )
+
+
+def load_template_converter(
+    path: str | PathLike,
+) -> type[TemplateDocstringConverter]:
+    """
+    Compile the templates in a file into a docstring converter.
+
+    Parameters
+    ----------
+    path : str | PathLike
+        The template file (see :func:`parse_templates`).
+
+    Returns
+    -------
+    type[TemplateDocstringConverter]
+        A subclass of :class:`TemplateDocstringConverter` using the compiled
+        templates, which can be used wherever the built-in converters can.
+    """
+    text = Path(path).read_text()
+    digest = hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+    return type(
+        f'TemplateDocstringConverter_{digest}',
+        (TemplateDocstringConverter,),
+        {'templates': CompiledTemplates.from_templates(parse_templates(text))},
+    )
@@ -0,0 +1,107 @@
+"""Processing files with the same contents once, e.g., vendored or generated copies."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, NamedTuple
+
+if TYPE_CHECKING:
+    import mmap
+
+    from .results import FileResult
+    from .sources import SourceFile
+
+
+class DuplicateEntry(NamedTuple):
+    result: FileResult
+    write_copy: Callable[[str], None] | None = None
+
+
+class DuplicateIndex:
+    """
+    The results of the distinct contents processed in a run, so that the files with
+    the same contents as a file processed earlier reuse its result.
+
+    Parameters
+    ----------
+    package_sensitive : bool, default=False
+        Whether the results also depend on the package containing each file on disk
+        (e.g., with the project or export index), in which case only the copies in the
+        same package are deduplicated.
+    """
+
+    def __init__(self, package_sensitive: bool = False) -> None:
+        self.package_sensitive = package_sensitive
+        self.duplicates = 0
+        self._entries: dict[str, DuplicateEntry] = {}
+
+    def get_key(self, source: SourceFile, data: bytes | mmap.mmap) -> str:
+        """
+        Identify what the result of processing a source file depends on.
+
+        Parameters
+        ----------
+        source : SourceFile
+            The source file.
+        data : bytes | mmap.mmap
+            The contents of the file.
+
+        Returns
+        -------
+        str
+            The key, combining the hash of the contents with the name of the module,
+            which is part of the fully-qualified names in the result.
+        """
+        path = Path(source.filename).expanduser()
+        key = (
+            f'{hashlib.blake2b(data, digest_size=16).hexdigest()}:'
+            f'{source.module_name or path.stem}'
+        )
+        if self.package_sensitive and source.load is None:
+            package = path.resolve().parent
+            if (package / '__init__.py').is_file():
+                key += f':{package}'
+        return key
+
+    def get(self, key: str, filename: str) -> DuplicateEntry | None:
+        """
+        Look up the result of processing the same contents earlier in the run.
+
+        Parameters
+        ----------
+        key : str
+            The key for the file, per :meth:`get_key`.
+        filename : str
+            The name of the file to attach to the result.
+
+        Returns
+        -------
+        DuplicateEntry | None
+            The result, along with the callable writing any changes to the copy
+            (taking its filename), if the contents were already processed.
+        """
+        if (entry := self._entries.get(key)) is None:
+            return None
+        self.duplicates += 1
+        return entry._replace(result=entry.result._replace(filename=filename))
+
+    def put(
+        self,
+        key: str,
+        result: FileResult,
+        write_copy: Callable[[str], None] | None = None,
+    ) -> None:
+        """
+        Add the result of processing a file.
+
+        Parameters
+        ----------
+        key : str
+            The key for the file, per :meth:`get_key`.
+        result : FileResult
+            The result of processing the file.
+        write_copy : Callable[[str], None] | None, default=None
+            Callable writing the changes made to the file to a copy of it, if any.
+        """
+        self._entries[key] = DuplicateEntry(result, write_copy)
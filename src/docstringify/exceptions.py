@@ -1,6 +1,156 @@
 """Docstringify exceptions."""
 
+from __future__ import annotations
+
+from argparse import ArgumentTypeError
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 
 class InvalidDocstringError(ValueError):
     def __init__(self, docstring_class: str) -> None:
         super().__init__(f'Expected str or list[str] docstring, got {docstring_class}')
+
+
+class InvalidSampleSizeError(ArgumentTypeError):
+    def __init__(self, value: str) -> None:
+        super().__init__(
+            'expected a fraction between 0 and 1 or a positive number of files, '
+            f'got {value!r}'
+        )
+
+
+class InvalidConfidenceError(ArgumentTypeError):
+    def __init__(self, value: str) -> None:
+        super().__init__(
+            f'expected a confidence level strictly between 0 and 1, got {value!r}'
+        )
+
+
+class InvalidNamePatternError(ArgumentTypeError):
+    def __init__(self, value: str, error: Exception) -> None:
+        super().__init__(f'invalid regular expression {value!r}: {error}')
+
+
+class InvalidSymbolKindError(ValueError):
+    def __init__(self, kinds: Iterable[str]) -> None:
+        super().__init__(f'Invalid symbol kinds: {", ".join(sorted(kinds))}')
+
+
+class InvalidShardError(ValueError):
+    def __init__(self, shard: str) -> None:
+        super().__init__(
+            f'Expected a shard of the form i/n with 1 <= i <= n, got {shard}'
+        )
+
+
+class PartialResultsFormatError(ValueError):
+    def __init__(self, path: str) -> None:
+        super().__init__(f'Unsupported format for partial results in {path}')
+
+
+class MismatchedShardCountsError(ValueError):
+    def __init__(self, counts: Iterable[int]) -> None:
+        super().__init__(
+            'Partial results come from different numbers of shards: '
+            f'{", ".join(map(str, sorted(counts)))}'
+        )
+
+
+class DuplicateShardError(ValueError):
+    def __init__(self, shard: str, paths: Iterable[str]) -> None:
+        super().__init__(
+            f'Partial results for shard {shard} provided more than once: '
+            f'{", ".join(paths)}'
+        )
+
+
+class MixedPartialsError(ValueError):
+    def __init__(self, unsharded_paths: Iterable[str]) -> None:
+        super().__init__(
+            'Partial results from sharded and unsharded runs cannot be combined; '
+            f'unsharded: {", ".join(unsharded_paths)}'
+        )
+
+
+class MixedPartialSourcesError(ValueError):
+    def __init__(self, paths: Iterable[str]) -> None:
+        super().__init__(
+            'Partial results for files read from disk, a git revision, and the git '
+            f'index cannot be combined: {", ".join(paths)}'
+        )
+
+
+class IncompleteShardsError(ValueError):
+    def __init__(self, shards: Iterable[str]) -> None:
+        super().__init__(f'Missing partial results for shards {", ".join(shards)}')
+
+
+class FileTooLargeError(ValueError):
+    def __init__(self, size: int, size_limit: int) -> None:
+        super().__init__(f'File size of {size} bytes exceeds the limit of {size_limit}')
+
+
+class FileTimeoutError(TimeoutError):
+    def __init__(self, time_limit: float) -> None:
+        super().__init__(f'Processing took longer than {time_limit} seconds')
+
+
+class TimeBudgetExceededError(TimeoutError):
+    def __init__(self) -> None:
+        super().__init__('The time budget for the run was exhausted')
+
+
+class GitError(RuntimeError):
+    def __init__(self, message: str) -> None:
+        super().__init__(f'Unable to read from git: {message}')
+
+
+class GitNotFoundError(GitError):
+    def __init__(self) -> None:
+        super().__init__('git executable not found')
+
+
+class GitObjectNotFoundError(GitError):
+    def __init__(self, sha: str) -> None:
+        super().__init__(f'object {sha} not found')
+
+
+class BaselineFormatError(ValueError):
+    def __init__(self, path: str) -> None:
+        super().__init__(f'Unsupported format for the baseline in {path}')
+
+
+class InvalidPathThresholdError(ArgumentTypeError):
+    def __init__(self, value: str) -> None:
+        super().__init__(
+            f'expected PATTERN=THRESHOLD with a threshold between 0 and 1, got {value!r}'
+        )
+
+
+class TomlUnavailableError(ValueError):
+    def __init__(self) -> None:
+        super().__init__(
+            'reading the [tool.docstringify] settings requires Python 3.11+ or the '
+            'tomli package'
+        )
+
+
+class InvalidTemplateError(ValueError):
+    def __init__(self, template_name: str | None, problem: str) -> None:
+        subject = f'{template_name} template' if template_name else 'template file'
+        super().__init__(f'Invalid {subject}: {problem}')
+
+
+class InvalidStyleError(ArgumentTypeError):
+    def __init__(self, value: str) -> None:
+        super().__init__(
+            f'expected google, numpydoc, or the path to a template file, got {value!r}'
+        )
+
+
+class HookLoadError(ValueError):
+    def __init__(self, spec: str, problem: object) -> None:
+        super().__init__(f'Unable to load the hook {spec!r}: {problem}')
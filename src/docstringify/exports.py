@@ -0,0 +1,255 @@
+"""Index of the names each module exports, for checking only the public API."""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from .archives import is_archive
+from .filters import PRIVATE_PATTERN
+from .project_index import get_module_name, resolve_name
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_PRIVATE_NAME = re.compile(PRIVATE_PATTERN)
+STAR = '*'
+
+
+def _is_private(name: str) -> bool:
+    return _PRIVATE_NAME.search(name) is not None
+
+
+def get_dunder_all(tree: ast.Module) -> frozenset[str] | None:
+    """
+    Read the literal ``__all__`` of a module.
+
+    Parameters
+    ----------
+    tree : ast.Module
+        The AST of the module.
+
+    Returns
+    -------
+    frozenset[str] | None
+        The names in ``__all__`` (including any added with ``+=``), or ``None`` if it
+        isn't defined (with or without an annotation) as a list or tuple of strings at
+        the top level of the module.
+    """
+    names = None
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and any(
+                isinstance(target, ast.Name) and target.id == '__all__'
+                for target in node.targets
+            )
+        ) or (
+            isinstance(node, ast.AnnAssign)
+            and isinstance(node.target, ast.Name)
+            and node.target.id == '__all__'
+            and node.value is not None
+        ):
+            names = set()
+        elif not (
+            isinstance(node, ast.AugAssign)
+            and isinstance(node.target, ast.Name)
+            and node.target.id == '__all__'
+            and names is not None
+        ):
+            continue
+
+        if not isinstance(node.value, (ast.List, ast.Tuple)) or not all(
+            isinstance(element, ast.Constant) and isinstance(element.value, str)
+            for element in node.value.elts
+        ):
+            return None
+        names.update(element.value for element in node.value.elts)
+    return None if names is None else frozenset(names)
+
+
+def _get_reexports(init_file: Path) -> dict[str, frozenset[str]]:
+    try:
+        tree = ast.parse(init_file.read_bytes())
+    except (OSError, SyntaxError, ValueError):
+        return {}
+
+    package = get_module_name(init_file)
+    dunder_all = get_dunder_all(tree)
+    reexports: dict[str, set[str]] = {}
+    for node in tree.body:
+        if not isinstance(node, ast.ImportFrom):
+            continue
+        module = resolve_name(
+            '.' * node.level + (node.module or ''), package, is_package=True
+        )
+        for alias in node.names:
+            if (
+                alias.name == STAR
+                or dunder_all is None
+                or (alias.asname or alias.name) in dunder_all
+            ):
+                reexports.setdefault(module, set()).add(alias.name)
+    return {module: frozenset(names) for module, names in reexports.items()}
+
+
+class ModuleExports(NamedTuple):
+    public: bool
+    dunder_all: frozenset[str] | None = None
+    reexported: frozenset[str] = frozenset()
+
+    def exports(self, name: str) -> bool:
+        """
+        Check whether a top-level class or function is part of the public API.
+
+        Parameters
+        ----------
+        name : str
+            The name of the class or function.
+
+        Returns
+        -------
+        bool
+            Whether a package re-exports it or, if the module is public (or all of it
+            is re-exported), whether it is in ``__all__`` or, without ``__all__``,
+            whether its name doesn't start with an underscore.
+        """
+        if name in self.reexported:
+            return True
+        if not (self.public or STAR in self.reexported):
+            return False
+        if self.dunder_all is not None:
+            return name in self.dunder_all
+        return not _is_private(name)
+
+    def includes(
+        self,
+        node: ast.AsyncFunctionDef | ast.ClassDef | ast.FunctionDef | ast.Module,
+        parent_node: ast.AST | None,
+    ) -> bool:
+        """
+        Check whether a symbol (and, therefore, its subtree) is part of the public
+        API, assuming its parent is.
+
+        Parameters
+        ----------
+        node : ast.AsyncFunctionDef | ast.ClassDef | ast.FunctionDef | ast.Module
+            The AST node defining the symbol.
+        parent_node : ast.AST | None
+            The AST node of the enclosing symbol, if there is one.
+
+        Returns
+        -------
+        bool
+            Whether the symbol is exported by its module or, for members of classes,
+            whether its name doesn't start with an underscore (dunder names are
+            public). Modules are always included, so that their contents are
+            traversed, and closures are never included.
+        """
+        if isinstance(node, ast.Module):
+            return True
+        if isinstance(parent_node, ast.Module):
+            return self.exports(node.name)
+        if isinstance(parent_node, ast.ClassDef):
+            return not _is_private(node.name)
+        return False
+
+
+class ExportIndex:
+    """
+    Index of the names that packages re-export from their modules, resolved once
+    per run from the ``__init__.py`` file of each package.
+    """
+
+    def __init__(self) -> None:
+        self._reexports: dict[Path, dict[str, frozenset[str]]] = {}
+
+    def _get_package_reexports(self, directory: Path) -> dict[str, frozenset[str]]:
+        if directory not in self._reexports:
+            self._reexports[directory] = _get_reexports(directory / '__init__.py')
+        return self._reexports[directory]
+
+    def _iter_packages(self, path: Path) -> Iterable[Path]:
+        directory = path.parent
+        while (directory / '__init__.py').is_file():
+            yield directory
+            directory = directory.parent
+
+    def build(self, filenames: Iterable[str]) -> None:
+        """
+        Index the re-exports of the packages containing the Python files on disk.
+
+        Parameters
+        ----------
+        filenames : Iterable[str]
+            The files whose packages should be indexed; archives are skipped.
+        """
+        for filename in filenames:
+            if not is_archive(filename):
+                for directory in self._iter_packages(
+                    Path(filename).expanduser().resolve()
+                ):
+                    self._get_package_reexports(directory)
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Hash of the indexed re-exports, which changes whenever the public API of
+        modules might.
+
+        Returns
+        -------
+        str
+            The hash.
+        """
+        return hashlib.blake2b(
+            json.dumps(
+                sorted(
+                    (str(directory), module, sorted(names))
+                    for directory, reexports in self._reexports.items()
+                    for module, names in reexports.items()
+                )
+            ).encode(),
+            digest_size=16,
+        ).hexdigest()
+
+    def get_exports(
+        self, module_name: str, tree: ast.Module, path: Path | None = None
+    ) -> ModuleExports:
+        """
+        Determine which of a module's top-level names are part of the public API.
+
+        Parameters
+        ----------
+        module_name : str
+            The name of the module, which is used if it isn't on disk.
+        tree : ast.Module
+            The AST of the module.
+        path : Path | None, default=None
+            The resolved path to the module, if it is on disk, in which case the
+            packages containing it determine its name and its re-exports.
+
+        Returns
+        -------
+        ModuleExports
+            Whether the module is public (i.e., none of the parts of its name start
+            with an underscore), along with its ``__all__`` and the names that the
+            packages containing it re-export.
+        """
+        reexported: set[str] = set()
+        if path is not None:
+            module_name = get_module_name(path)
+            for directory in self._iter_packages(path):
+                reexported.update(
+                    self._get_package_reexports(directory).get(module_name, ())
+                )
+
+        return ModuleExports(
+            public=not any(_is_private(part) for part in module_name.split('.')),
+            dunder_all=get_dunder_all(tree),
+            reexported=frozenset(reexported),
+        )
@@ -0,0 +1,191 @@
+"""Symbol filters for pruning subtrees that don't need docstrings."""
+
+from __future__ import annotations
+
+import ast
+import re
+from typing import TYPE_CHECKING
+
+from .exceptions import InvalidSymbolKindError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+SYMBOL_KINDS = ('module', 'class', 'method', 'function', 'closure')
+PRIVATE_PATTERN = r'^_(?!_.*__$)'
+DUNDER_PATTERN = r'^__.+__$'
+
+
+def get_symbol_kind(
+    node: ast.AsyncFunctionDef | ast.ClassDef | ast.FunctionDef | ast.Module,
+    parent_node: ast.AST | None,
+) -> str:
+    """
+    Determine the kind of symbol an AST node defines.
+
+    Parameters
+    ----------
+    node : ast.AsyncFunctionDef | ast.ClassDef | ast.FunctionDef | ast.Module
+        The AST node defining the symbol.
+    parent_node : ast.AST | None
+        The AST node of the enclosing symbol, if there is one.
+
+    Returns
+    -------
+    str
+        One of ``module``, ``class``, ``method``, ``function``, or ``closure``.
+    """
+    if isinstance(node, ast.Module):
+        return 'module'
+    if isinstance(node, ast.ClassDef):
+        return 'class'
+    if isinstance(parent_node, ast.ClassDef):
+        return 'method'
+    if isinstance(parent_node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return 'closure'
+    return 'function'
+
+
+def get_decorator_name(decorator: ast.expr) -> str | None:
+    """
+    Get the name of a decorator, ignoring any module prefix and call arguments.
+
+    Parameters
+    ----------
+    decorator : ast.expr
+        An entry in the ``decorator_list`` of an AST node.
+
+    Returns
+    -------
+    str | None
+        The name of the decorator (e.g., ``fixture`` for ``@pytest.fixture(scope='module')``)
+        or ``None`` if it isn't a (possibly dotted) name.
+    """
+    if isinstance(decorator, ast.Call):
+        decorator = decorator.func
+    if isinstance(decorator, ast.Name):
+        return decorator.id
+    if isinstance(decorator, ast.Attribute):
+        return decorator.attr
+    return None
+
+
+class SymbolFilter:
+    """
+    Matcher for symbols that should be skipped, along with everything they contain.
+
+    All rules are compiled once, when the filter is created, so that checking a symbol
+    only involves set lookups and (at most) two regular expression searches.
+
+    Parameters
+    ----------
+    names : Iterable[str], default=()
+        Regular expressions for names of symbols to skip. Module names are the
+        filename without the extension.
+    private : bool, default=False
+        Whether to skip private classes and functions, i.e., those whose names start
+        with an underscore, but aren't dunder names.
+    dunder : bool, default=False
+        Whether to skip dunder classes and functions, like ``__repr__``.
+    max_depth : int | None, default=None
+        The maximum nesting depth of symbols to inspect, where the module is at a depth
+        of ``0``, and top-level classes and functions are at a depth of ``1``.
+    decorators : Iterable[str], default=()
+        Names of decorators (without any module prefix) whose symbols should be skipped.
+    kinds : Iterable[str], default=()
+        Kinds of symbols to skip: ``module``, ``class``, ``method``, ``function``, or
+        ``closure``. For modules, only the module docstring is skipped, not the
+        classes and functions in them.
+    """
+
+    def __init__(
+        self,
+        names: Iterable[str] = (),
+        private: bool = False,
+        dunder: bool = False,
+        max_depth: int | None = None,
+        decorators: Iterable[str] = (),
+        kinds: Iterable[str] = (),
+    ) -> None:
+        self._name_pattern: re.Pattern | None = (
+            re.compile('|'.join(f'(?:{pattern})' for pattern in names))
+            if names
+            else None
+        )
+        self._visibility_pattern: re.Pattern | None = (
+            re.compile(
+                '|'.join(
+                    pattern
+                    for pattern, enabled in [
+                        (PRIVATE_PATTERN, private),
+                        (DUNDER_PATTERN, dunder),
+                    ]
+                    if enabled
+                )
+            )
+            if private or dunder
+            else None
+        )
+        self._max_depth = max_depth
+        self._decorators = frozenset(decorators)
+
+        if invalid_kinds := set(kinds).difference(SYMBOL_KINDS):
+            raise InvalidSymbolKindError(invalid_kinds)
+        self._kinds = frozenset(kinds).difference({'module'})
+        self.ignores_module_docstring: bool = 'module' in kinds
+
+    def __bool__(self) -> bool:
+        return bool(
+            self._name_pattern
+            or self._visibility_pattern
+            or self._max_depth is not None
+            or self._decorators
+            or self._kinds
+            or self.ignores_module_docstring
+        )
+
+    def excludes(
+        self,
+        node: ast.AsyncFunctionDef | ast.ClassDef | ast.FunctionDef | ast.Module,
+        parent_node: ast.AST | None,
+        depth: int,
+        name: str,
+    ) -> bool:
+        """
+        Check whether a symbol (and, therefore, its entire subtree) should be skipped.
+
+        Parameters
+        ----------
+        node : ast.AsyncFunctionDef | ast.ClassDef | ast.FunctionDef | ast.Module
+            The AST node defining the symbol.
+        parent_node : ast.AST | None
+            The AST node of the enclosing symbol, if there is one.
+        depth : int
+            The nesting depth of the symbol.
+        name : str
+            The name of the symbol.
+
+        Returns
+        -------
+        bool
+            Whether the symbol should be skipped.
+        """
+        if self._max_depth is not None and depth > self._max_depth:
+            return True
+
+        if self._kinds and get_symbol_kind(node, parent_node) in self._kinds:
+            return True
+
+        if self._name_pattern and self._name_pattern.search(name):
+            return True
+
+        if isinstance(node, ast.Module):
+            return False
+
+        if self._visibility_pattern and self._visibility_pattern.search(name):
+            return True
+
+        return bool(self._decorators) and any(
+            get_decorator_name(decorator) in self._decorators
+            for decorator in node.decorator_list
+        )
@@ -0,0 +1,189 @@
+"""Reading Python files straight from the git object database."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING, NamedTuple
+
+from .exceptions import GitError, GitNotFoundError, GitObjectNotFoundError
+from .sources import SourceFile, decode_source
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from types import TracebackType
+
+EMPTY_BLOB = '0' * 40
+SYMLINK_MODE = '120000'
+
+
+class GitBlob(NamedTuple):
+    path: str
+    sha: str
+    size: int | None = None
+
+
+def _run_git(*args: str) -> bytes:
+    try:
+        return subprocess.run(['git', *args], capture_output=True, check=True).stdout
+    except FileNotFoundError:
+        raise GitNotFoundError from None
+    except subprocess.CalledProcessError as error:
+        raise GitError(error.stderr.decode().strip()) from None
+
+
+def list_revision_blobs(revision: str, pathspecs: Sequence[str] = ()) -> list[GitBlob]:
+    """
+    List the Python files in a commit (or any other tree-ish).
+
+    Parameters
+    ----------
+    revision : str
+        The revision, e.g., ``HEAD~1`` or a branch name.
+    pathspecs : Sequence[str], default=()
+        Limit the files to those matching these paths.
+
+    Returns
+    -------
+    list[GitBlob]
+        The path (relative to the root of the repository), SHA, and size of each
+        Python file.
+    """
+    output = _run_git(
+        'ls-tree', '-r', '-l', '-z', '--full-name', revision, '--', *pathspecs
+    )
+    blobs = []
+    for entry in output.decode().split('\0'):
+        if not entry:
+            continue
+        info, _, path = entry.partition('\t')
+        mode, object_type, sha, size = info.split()
+        if object_type == 'blob' and mode != SYMLINK_MODE and path.endswith('.py'):
+            blobs.append(GitBlob(path, sha, int(size)))
+    return blobs
+
+
+def list_staged_blobs(pathspecs: Sequence[str] = ()) -> list[GitBlob]:
+    """
+    List the Python files that are added, copied, modified, or renamed in the index.
+
+    Parameters
+    ----------
+    pathspecs : Sequence[str], default=()
+        Limit the files to those matching these paths.
+
+    Returns
+    -------
+    list[GitBlob]
+        The path (relative to the root of the repository) and the SHA of the staged
+        version of each Python file.
+    """
+    output = _run_git(
+        'diff',
+        '--cached',
+        '--raw',
+        '-z',
+        '--no-abbrev',
+        '--diff-filter=ACMR',
+        '--',
+        *pathspecs,
+    )
+    # entries look like ":<old mode> <new mode> <old sha> <new sha> <status>\0<path>\0"
+    # where copies and renames have an additional path (the new one comes last)
+    fields = output.decode().split('\0')
+    blobs = []
+    index = 0
+    while index < len(fields) and fields[index]:
+        _, mode, _, sha, status = fields[index].split()
+        path_count = 2 if status[0] in 'CR' else 1
+        path = fields[index + path_count]
+        index += path_count + 1
+        if path.endswith('.py') and mode != SYMLINK_MODE and sha != EMPTY_BLOB:
+            blobs.append(GitBlob(path, sha))
+    return blobs
+
+
+class GitBlobReader:
+    """
+    Reader for blob contents, which streams them all through a single long-lived
+    ``git cat-file --batch`` process.
+    """
+
+    def __init__(self) -> None:
+        try:
+            self._process = subprocess.Popen(
+                ['git', 'cat-file', '--batch'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            raise GitNotFoundError from None
+
+    def __enter__(self) -> GitBlobReader:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def read(self, sha: str) -> bytes:
+        """
+        Read the contents of a blob.
+
+        Parameters
+        ----------
+        sha : str
+            The SHA of the blob.
+
+        Returns
+        -------
+        bytes
+            The contents of the blob.
+        """
+        self._process.stdin.write(f'{sha}\n'.encode())
+        self._process.stdin.flush()
+
+        # the header is "<sha> <type> <size>\n" or "<sha> missing\n"
+        header = self._process.stdout.readline().split()
+        if len(header) != 3:
+            raise GitObjectNotFoundError(sha)
+
+        contents = self._process.stdout.read(int(header[2]))
+        self._process.stdout.read(1)  # the trailing newline
+        return contents
+
+    def close(self) -> None:
+        """Stop the ``git cat-file --batch`` process."""
+        self._process.stdin.close()
+        self._process.wait()
+        self._process.stdout.close()
+
+    def get_source(self, blob: GitBlob, display_prefix: str = '') -> SourceFile:
+        """
+        Describe a blob as a source file, which is only read if its result isn't
+        cached.
+
+        Parameters
+        ----------
+        blob : GitBlob
+            The blob.
+        display_prefix : str, default=''
+            Prefix for the name of the file when reporting, e.g., ``HEAD:``.
+
+        Returns
+        -------
+        SourceFile
+            The source, using the blob's SHA as the cache key.
+        """
+        module_name = PurePosixPath(blob.path).stem
+        return SourceFile(
+            filename=f'{display_prefix}{blob.path}',
+            load=lambda: decode_source(self.read(blob.sha)),
+            module_name=module_name,
+            cache_key=f'git:{blob.sha}:{module_name}',
+            size=blob.size,
+        )
@@ -0,0 +1,211 @@
+"""Hooks for observing the processing of files, e.g., to collect telemetry."""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+import sys
+from importlib.metadata import entry_points
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+from .exceptions import HookLoadError
+
+if TYPE_CHECKING:
+    import ast
+    from collections.abc import Iterable
+
+    from .nodes.base import DocstringNode
+    from .results import FileError, FileResult
+
+HOOK_ENTRY_POINT_GROUP = 'docstringify.hooks'
+HOOK_EVENTS = (
+    'on_file_start',
+    'on_parsed',
+    'on_node',
+    'on_missing',
+    'on_file_done',
+    'on_run_done',
+)
+
+
+class Hook:
+    """
+    Base class for hooks, which only need to override the events they handle.
+
+    Hooks don't need to inherit from this class: any object (including a module)
+    with methods (or functions) named after some of the events can be registered.
+    """
+
+    def on_file_start(self, filename: str) -> None:
+        """
+        Handle the start of processing a file.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file.
+        """
+
+    def on_parsed(self, filename: str, tree: ast.Module) -> None:
+        """
+        Handle the AST of a file, before it is traversed.
+
+        This isn't called for files whose results are cached, that take one of the
+        fast paths of the triage, or that are copies of a file processed earlier.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file.
+        tree : ast.Module
+            The AST of the file.
+        """
+
+    def on_node(self, docstring_node: DocstringNode) -> None:
+        """
+        Handle a module, class, or function whose docstring is inspected.
+
+        Parameters
+        ----------
+        docstring_node : DocstringNode
+            The node being inspected.
+        """
+
+    def on_missing(self, docstring_node: DocstringNode) -> None:
+        """
+        Handle a module, class, or function missing a docstring.
+
+        Parameters
+        ----------
+        docstring_node : DocstringNode
+            The node missing a docstring.
+        """
+
+    def on_file_done(self, result: FileResult | FileError) -> None:
+        """
+        Handle the result of processing a file.
+
+        Parameters
+        ----------
+        result : FileResult | FileError
+            The result or, with ``--keep-going``, the error that occurred.
+        """
+
+    def on_run_done(self, results: list[FileResult], errors: list[FileError]) -> None:
+        """
+        Handle the end of the run.
+
+        Parameters
+        ----------
+        results : list[FileResult]
+            The results for all the files processed, before applying any baseline.
+        errors : list[FileError]
+            The errors that occurred.
+        """
+
+
+def _get_handler(hook: object, event: str) -> Callable[..., None] | None:
+    handler = getattr(hook, event, None)
+    if not callable(handler):
+        return None
+    # the no-op methods of the base class are never dispatched to
+    if getattr(type(hook), event, None) is getattr(Hook, event):
+        return None
+    return handler
+
+
+def _fan_out(handlers: list[Callable[..., None]]) -> Callable[..., None]:
+    def dispatch(*args: object) -> None:
+        for handler in handlers:
+            handler(*args)
+
+    return dispatch
+
+
+class HookDispatcher:
+    """
+    Dispatcher of the events to the registered hooks.
+
+    Each event is resolved once, when the dispatcher is created, into ``None`` if no
+    hook handles it, the handler itself if only one hook does, or a function calling
+    each of the handlers. Callers check for ``None`` before dispatching, so events
+    without handlers cost a single comparison.
+
+    Parameters
+    ----------
+    hooks : Iterable[object], default=()
+        The hooks to dispatch the events to, in order.
+    """
+
+    on_file_start: Callable[[str], None] | None
+    on_parsed: Callable[[str, ast.Module], None] | None
+    on_node: Callable[[DocstringNode], None] | None
+    on_missing: Callable[[DocstringNode], None] | None
+    on_file_done: Callable[[FileResult | FileError], None] | None
+    on_run_done: Callable[[list[FileResult], list[FileError]], None] | None
+
+    def __init__(self, hooks: Iterable[object] = ()) -> None:
+        self.hooks = list(hooks)
+        for event in HOOK_EVENTS:
+            handlers = [
+                handler
+                for hook in self.hooks
+                if (handler := _get_handler(hook, event)) is not None
+            ]
+            setattr(
+                self,
+                event,
+                (handlers[0] if len(handlers) == 1 else _fan_out(handlers))
+                if handlers
+                else None,
+            )
+
+    def __bool__(self) -> bool:
+        return bool(self.hooks)
+
+
+def _get_entry_points() -> dict[str, object]:
+    try:
+        hook_entry_points = entry_points(group=HOOK_ENTRY_POINT_GROUP)
+    except TypeError:  # Python 3.9
+        hook_entry_points = entry_points().get(HOOK_ENTRY_POINT_GROUP, [])
+    return {entry_point.name: entry_point for entry_point in hook_entry_points}
+
+
+def load_hook(spec: str) -> object:
+    """
+    Load a hook from the name of an entry point or a module path.
+
+    Parameters
+    ----------
+    spec : str
+        The name of an entry point in the ``docstringify.hooks`` group, or a module
+        path (importable from the current working directory), optionally followed by
+        a colon and the name of an object in the module, e.g.,
+        ``telemetry.hooks:TimingHook``.
+
+    Returns
+    -------
+    object
+        The hook. Classes are instantiated without any arguments, and modules are
+        used as is, with their functions handling the events.
+    """
+    try:
+        if (entry_point := _get_entry_points().get(spec)) is not None:
+            hook = entry_point.load()
+        else:
+            module_name, _, attribute = spec.partition(':')
+            # like python -m, so modules next to the project can be used as hooks
+            if (cwd := str(Path.cwd())) not in sys.path:
+                sys.path.insert(0, cwd)
+            hook = importlib.import_module(module_name)
+            for name in filter(None, attribute.split('.')):
+                hook = getattr(hook, name)
+    except (ImportError, AttributeError) as error:
+        raise HookLoadError(spec, error) from None
+
+    hook = hook() if inspect.isclass(hook) else hook
+    if not any(_get_handler(hook, event) for event in HOOK_EVENTS):
+        raise HookLoadError(spec, f'expected a handler for one of {HOOK_EVENTS}')
+    return hook
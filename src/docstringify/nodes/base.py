@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import ast
+import hashlib
 from functools import partial
 from typing import Callable, overload
 
+from ..sources import SourceBuffer
+
 
 class DocstringNode:
     @overload
@@ -11,7 +14,7 @@ class DocstringNode:
         self,
         node: ast.Module,
         module_name: str,
-        source_code: str,
+        source_code: str | SourceBuffer,
         parent: None = None,
     ) -> None: ...
 
@@ -20,7 +23,7 @@ class DocstringNode:
         self,
         node: ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef,
         module_name: str,
-        source_code: str,
+        source_code: str | SourceBuffer,
         parent: DocstringNode,
     ) -> None: ...
 
@@ -28,7 +31,7 @@ class DocstringNode:
         self,
         node: ast.Module | ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef,
         module_name: str,
-        source_code: str,
+        source_code: str | SourceBuffer,
         parent: DocstringNode | None = None,
     ) -> None:
         self.module_name: str = module_name
@@ -43,8 +46,10 @@ class DocstringNode:
         docstring = ast.get_docstring(node)
         self.docstring = docstring if docstring is None else docstring.strip()
 
-        self.get_source_segment: Callable[[ast.AST], str] = partial(
-            ast.get_source_segment, source_code
+        self.get_source_segment: Callable[[ast.AST], str] = (
+            source_code.get_source_segment
+            if isinstance(source_code, SourceBuffer)
+            else partial(ast.get_source_segment, source_code)
         )
 
     @property
@@ -55,6 +60,17 @@ class DocstringNode:
             else self.name
         )
 
+    @property
+    def signature_hash(self) -> str:
+        signature = '\n'.join(ast.dump(part) for part in self._signature_parts())
+        return hashlib.blake2b(signature.encode(), digest_size=8).hexdigest()
+
+    def _signature_parts(self) -> list[ast.AST]:
+        return [
+            *getattr(self.ast_node, 'bases', ()),
+            *getattr(self.ast_node, 'keywords', ()),
+        ]
+
     @property
     def docstring_required(self) -> bool:
         if self._has_decorator('overload'):
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import ast
 import itertools
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from ..components import (
     NO_DEFAULT,
@@ -13,13 +13,16 @@ from ..components import (
 )
 from .base import DocstringNode
 
+if TYPE_CHECKING:
+    from ..sources import SourceBuffer
+
 
 class FunctionDocstringNode(DocstringNode):
     def __init__(
         self,
         node: ast.FunctionDef | ast.AsyncFunctionDef,
         module_name: str,
-        source_code: str,
+        source_code: str | SourceBuffer,
         parent: DocstringNode,
     ) -> None:
         super().__init__(node, module_name, source_code, parent)
@@ -47,9 +50,14 @@ class FunctionDocstringNode(DocstringNode):
             self.is_method and self.name == '__init__' and self.parent.docstring
         )
 
+        # set by the visitor from the project index, if there is one
+        self.overrides_documented_method: bool = False
+
         self.arguments: ast.arguments | None = getattr(node, 'args', None)
         self.return_annotation: str | None = self._extract_return_annotation()
+        # collected by the visitor, along with whether the function yields
         self.return_statements: list[ast.Return] = []
+        self.is_generator: bool = False
 
     def _extract_default_values(
         self, default: ast.Constant | None | Literal[NO_DEFAULT], is_keyword_only: bool
@@ -144,6 +152,15 @@ class FunctionDocstringNode(DocstringNode):
             return params[1:]
         return params
 
+    @DocstringNode.docstring_required.getter
+    def docstring_required(self) -> bool:
+        if self.overrides_documented_method:
+            return False
+        return DocstringNode.docstring_required.fget(self)
+
+    def _signature_parts(self) -> list[ast.AST]:
+        return [self.ast_node.args, *filter(None, [self.ast_node.returns])]
+
     def _extract_return_annotation(self) -> str | None:
         if return_annotation_node := self.ast_node.returns:
             if isinstance(return_annotation_node, ast.Constant):
@@ -0,0 +1,246 @@
+"""Reading the code cells of Jupyter notebooks as a single module."""
+
+from __future__ import annotations
+
+import json
+import re
+from bisect import bisect_right
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from os import PathLike
+
+NOTEBOOK_SUFFIX = '.ipynb'
+CELL_MAGIC = '%%'
+
+# line magics, shell commands (also when assigned), and help requests (e.g., len?)
+MAGIC_LINE = re.compile(r'^\s*(?:[%!]|\w+\s*=\s*[%!]|[\w.]+\?{1,2}\s*$)')
+OPENING_BRACKETS = '([{'
+CLOSING_BRACKETS = ')]}'
+
+
+def is_notebook(filename: str) -> bool:
+    """
+    Check whether a file is a Jupyter notebook.
+
+    Parameters
+    ----------
+    filename : str
+        The file.
+
+    Returns
+    -------
+    bool
+        Whether the file has the ``.ipynb`` extension.
+    """
+    return filename.lower().endswith(NOTEBOOK_SUFFIX)
+
+
+def _mask_magics(lines: list[str]) -> list[str]:
+    # cell magics make the whole cell something other than Python (e.g., %%bash)
+    if lines and lines[0].lstrip().startswith(CELL_MAGIC):
+        return [''] * len(lines)
+
+    # each line is kept, so the line numbers still match the cell; only the lines
+    # starting a new logical line can be magics (e.g., not `    % b)` inside brackets)
+    masked_lines, state = [], _LineState()
+    for line in lines:
+        if state.starts_logical_line and MAGIC_LINE.match(line):
+            masked_lines.append(f'{line[: len(line) - len(line.lstrip())]}pass')
+        else:
+            masked_lines.append(line)
+            state = _scan_line(line, state)
+    return masked_lines
+
+
+class _LineState(NamedTuple):
+    depth: int = 0
+    open_quotes: str | None = None
+    continued: bool = False
+
+    @property
+    def starts_logical_line(self) -> bool:
+        return not (self.depth or self.open_quotes or self.continued)
+
+
+def _scan_line(line: str, state: _LineState) -> _LineState:
+    depth, open_quotes = state.depth, state.open_quotes
+    i = 0
+    while i < len(line):
+        if open_quotes is not None:
+            if line[i] == '\\':
+                i += 2
+            elif line.startswith(open_quotes, i):
+                i += len(open_quotes)
+                open_quotes = None
+            else:
+                i += 1
+            continue
+
+        char = line[i]
+        if char == '#':
+            return _LineState(depth)
+        if char in '\'"':
+            open_quotes = char * 3 if line.startswith(char * 3, i) else char
+            i += len(open_quotes)
+            continue
+        if char in OPENING_BRACKETS:
+            depth += 1
+        elif char in CLOSING_BRACKETS:
+            depth = max(depth - 1, 0)
+        i += 1
+
+    continued = line.endswith('\\')
+    # single-quoted strings can only span lines with a trailing backslash
+    if open_quotes is not None and len(open_quotes) == 1 and not continued:
+        open_quotes = None
+    return _LineState(depth, open_quotes, continued)
+
+
+class CodeCell(NamedTuple):
+    index: int
+    start_line: int
+    lines: list[str]
+
+
+class NotebookEdit(NamedTuple):
+    start_line: int
+    start_col: int
+    end_line: int
+    end_col: int
+    text: str
+
+
+class Notebook:
+    """
+    The code cells of a notebook, joined into a single module that is parsed at once,
+    along with the map from the lines of the module back to the cells.
+
+    Magics and shell commands are replaced with ``pass`` statements (and cells
+    starting with a cell magic, with blank lines), so every line of the module
+    corresponds to the same line of a cell.
+
+    Parameters
+    ----------
+    content : dict
+        The notebook, as loaded from its JSON file.
+    """
+
+    def __init__(self, content: dict) -> None:
+        self.content = content
+        self.code_cells: list[CodeCell] = []
+
+        module_lines = []
+        for index, cell in enumerate(content.get('cells', [])):
+            if cell.get('cell_type') != 'code':
+                continue
+            source = cell.get('source', '')
+            lines = (source if isinstance(source, str) else ''.join(source)).split('\n')
+            self.code_cells.append(CodeCell(index, len(module_lines) + 1, lines))
+            module_lines.extend(_mask_magics(lines))
+
+        self.source_code: str = '\n'.join(module_lines)
+        self._start_lines = [cell.start_line for cell in self.code_cells]
+
+    @classmethod
+    def read(cls, path: str | PathLike) -> Notebook:
+        """
+        Read a notebook from disk.
+
+        Parameters
+        ----------
+        path : str | PathLike
+            The notebook file.
+
+        Returns
+        -------
+        Notebook
+            The notebook.
+        """
+        with Path(path).open(encoding='utf-8') as file:
+            return cls(json.load(file))
+
+    def _find_cell(self, line_number: int) -> tuple[CodeCell, int]:
+        cell = self.code_cells[max(bisect_right(self._start_lines, line_number) - 1, 0)]
+        return cell, line_number - cell.start_line
+
+    def locate(self, line_number: int) -> str:
+        """
+        Describe where a line of the module is in the notebook.
+
+        Parameters
+        ----------
+        line_number : int
+            The line number in the module (1-based).
+
+        Returns
+        -------
+        str
+            The location, e.g., ``cell 3:line 2``, where cells are numbered by their
+            position in the notebook (including the markdown cells) and lines by their
+            position in the cell, both starting from 1, or an empty string if the
+            notebook has no code cells.
+        """
+        if not self.code_cells:
+            return ''
+        cell, line_offset = self._find_cell(line_number)
+        return f'cell {cell.index + 1}:line {line_offset + 1}'
+
+    def get_line(self, line_number: int) -> str:
+        """
+        Get a line of the module, as it appears in its cell.
+
+        Parameters
+        ----------
+        line_number : int
+            The line number in the module (1-based).
+
+        Returns
+        -------
+        str
+            The line, including any magic.
+        """
+        cell, line_offset = self._find_cell(line_number)
+        return cell.lines[line_offset]
+
+    def apply_edits(self, edits: Iterable[NotebookEdit]) -> None:
+        """
+        Edit the code cells, replacing ranges of the module with new text.
+
+        Parameters
+        ----------
+        edits : Iterable[NotebookEdit]
+            The edits, with positions in the module, like those of the AST (lines are
+            1-based and columns are UTF-8 byte offsets). Each edit must start and end
+            in the same cell, and edits must not overlap.
+        """
+        if not self.code_cells:
+            return
+
+        cells = self.content['cells']
+        for edit in sorted(edits, reverse=True):
+            cell, start = self._find_cell(edit.start_line)
+            end = edit.end_line - cell.start_line
+            start_line, end_line = cell.lines[start], cell.lines[end]
+            start_col = len(start_line.encode()[: edit.start_col].decode())
+            end_col = len(end_line.encode()[: edit.end_col].decode())
+            cell.lines[start : end + 1] = (
+                start_line[:start_col] + edit.text + end_line[end_col:]
+            ).split('\n')
+            # notebooks store the source as a list of lines
+            cells[cell.index]['source'] = '\n'.join(cell.lines).splitlines(
+                keepends=True
+            )
+
+    def dumps(self) -> str:
+        """
+        Serialize the notebook like Jupyter does.
+
+        Returns
+        -------
+        str
+            The notebook as JSON.
+        """
+        return json.dumps(self.content, indent=1, ensure_ascii=False) + '\n'
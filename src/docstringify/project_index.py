@@ -0,0 +1,293 @@
+"""Project-wide index of classes, for requirements that depend on other files."""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from .archives import is_archive
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from os import PathLike
+
+INDEX_FORMAT_VERSION = 1
+
+# below this number of files to index, starting worker processes isn't worth it
+MIN_PARALLEL_FILES = 32
+
+
+class ClassInfo(NamedTuple):
+    bases: tuple[str, ...]
+    documented_methods: frozenset[str]
+
+
+def _get_dotted_name(node: ast.expr) -> str | None:
+    if isinstance(node, ast.Subscript):  # e.g., Generic[T]
+        node = node.value
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute) and (value := _get_dotted_name(node.value)):
+        return f'{value}.{node.attr}'
+    return None
+
+
+def _index_classes(body: list[ast.stmt], prefix: str, classes: dict[str, dict]) -> None:
+    for node in body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        qualname = f'{prefix}{node.name}'
+        classes[qualname] = {
+            'bases': [name for base in node.bases if (name := _get_dotted_name(base))],
+            'documented_methods': [
+                child.name
+                for child in node.body
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef))
+                and (ast.get_docstring(child) or '').strip()
+            ],
+        }
+        _index_classes(node.body, f'{qualname}.', classes)
+
+
+def _index_source(data: bytes) -> dict | None:
+    try:
+        tree = ast.parse(data)
+    except (SyntaxError, ValueError):
+        # the file is skipped here; processing it will report the error
+        return None
+
+    # relative imports keep their leading dots until the module name is known
+    imports = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    imports[alias.asname] = alias.name
+                else:
+                    top_level = alias.name.partition('.')[0]
+                    imports[top_level] = top_level
+        elif isinstance(node, ast.ImportFrom):
+            module = '.' * node.level + (node.module or '')
+            for alias in node.names:
+                separator = '' if module.endswith('.') else '.'
+                imports[alias.asname or alias.name] = f'{module}{separator}{alias.name}'
+
+    classes: dict[str, dict] = {}
+    _index_classes(tree.body, '', classes)
+    return {'imports': imports, 'classes': classes}
+
+
+@cache
+def _get_package(directory: Path) -> str | None:
+    if not (directory / '__init__.py').is_file():
+        return None
+    parent_package = _get_package(directory.parent)
+    return f'{parent_package}.{directory.name}' if parent_package else directory.name
+
+
+def get_module_name(path: Path) -> str:
+    """
+    Determine the dotted name of a module on disk from the packages containing it.
+
+    Parameters
+    ----------
+    path : Path
+        The resolved path to the Python file.
+
+    Returns
+    -------
+    str
+        The module name, e.g., ``pkg.sub.mod`` for ``pkg/sub/mod.py``, where ``pkg``
+        and ``pkg/sub`` contain an ``__init__.py`` file.
+    """
+    package = _get_package(path.parent)
+    if path.stem == '__init__' and package:
+        return package
+    return f'{package}.{path.stem}' if package else path.stem
+
+
+def resolve_name(name: str, module_name: str, is_package: bool) -> str:
+    """
+    Resolve a name imported relative to a module into an absolute one.
+
+    Parameters
+    ----------
+    name : str
+        The name, with one leading dot per level, e.g., ``..base.Base``.
+    module_name : str
+        The name of the module importing it.
+    is_package : bool
+        Whether the module is a package (i.e., an ``__init__.py`` file).
+
+    Returns
+    -------
+    str
+        The absolute name, e.g., ``pkg.base.Base`` for ``pkg.sub.mod``.
+    """
+    if not name.startswith('.'):
+        return name
+    level = len(name) - len(name.lstrip('.'))
+    package_parts = module_name.split('.')[: None if is_package else -1]
+    base = package_parts[: len(package_parts) - (level - 1)]
+    return '.'.join([*base, name.lstrip('.')]) if name.lstrip('.') else '.'.join(base)
+
+
+class ProjectIndex:
+    """
+    Index of the classes across the project, along with their bases and the methods
+    they document, so that overrides of documented methods don't need docstrings.
+
+    The index is stored keyed by the hash of each file's contents, so only the files
+    that changed since it was last saved are parsed again.
+
+    Parameters
+    ----------
+    path : str | PathLike | None, default=None
+        The file to store the index in, if any.
+    """
+
+    def __init__(self, path: str | PathLike | None = None) -> None:
+        self.path = Path(path) if path is not None else None
+        self.module_names: dict[str, str] = {}
+        self.classes: dict[str, ClassInfo] = {}
+        self.files_indexed = self.files_reused = 0
+        self._entries: dict[str, dict | None] = {}
+
+        if self.path is not None:
+            try:
+                index = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                index = {}
+            if index.get('version') == INDEX_FORMAT_VERSION:
+                self._entries = index.get('entries', {})
+
+    def build(self, filenames: Iterable[str], max_workers: int | None = None) -> None:
+        """
+        Index the Python files on disk, parsing the new and changed ones in parallel.
+
+        Parameters
+        ----------
+        filenames : Iterable[str]
+            The files to index; archives are skipped.
+        max_workers : int | None, default=None
+            The maximum number of processes to parse the files with (defaults to the
+            number of processors).
+        """
+        files, pending = {}, {}
+        for filename in filenames:
+            if is_archive(filename):
+                continue
+            path = Path(filename).expanduser().resolve()
+            try:
+                data = path.read_bytes()
+            except OSError:
+                continue
+            content_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
+            files[path] = content_hash
+            if content_hash not in self._entries:
+                pending[content_hash] = data
+
+        if len(pending) < MIN_PARALLEL_FILES:
+            indexed = map(_index_source, pending.values())
+            self._entries.update(zip(pending, indexed))
+        else:
+            with ProcessPoolExecutor(max_workers) as executor:
+                indexed = executor.map(_index_source, pending.values(), chunksize=16)
+                self._entries.update(zip(pending, indexed))
+
+        self.files_indexed = len(pending)
+        self.files_reused = len(files) - len(pending)
+
+        # drop the entries for contents that no longer exist
+        self._entries = {
+            content_hash: self._entries[content_hash] for content_hash in files.values()
+        }
+        for path, content_hash in files.items():
+            if (entry := self._entries[content_hash]) is not None:
+                self._add_module(path, entry)
+
+    def _add_module(self, path: Path, entry: dict) -> None:
+        module_name = get_module_name(path)
+        is_package = path.stem == '__init__'
+        self.module_names[str(path)] = module_name
+
+        imports = {
+            alias: resolve_name(target, module_name, is_package)
+            for alias, target in entry['imports'].items()
+        }
+        for qualname, info in entry['classes'].items():
+            bases = []
+            for base in info['bases']:
+                first, dot, rest = base.partition('.')
+                if first in imports:
+                    bases.append(f'{imports[first]}{dot}{rest}')
+                else:
+                    bases.append(f'{module_name}.{base}')
+            self.classes[f'{module_name}.{qualname}'] = ClassInfo(
+                tuple(bases), frozenset(info['documented_methods'])
+            )
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Hash of the indexed classes, which changes whenever the docstring
+        requirements it implies might.
+
+        Returns
+        -------
+        str
+            The hash.
+        """
+        return hashlib.blake2b(
+            json.dumps(
+                sorted(
+                    (name, info.bases, sorted(info.documented_methods))
+                    for name, info in self.classes.items()
+                )
+            ).encode(),
+            digest_size=16,
+        ).hexdigest()
+
+    def documents_method(self, class_name: str, method_name: str) -> bool:
+        """
+        Check whether any (direct or indirect) base of a class documents a method.
+
+        Parameters
+        ----------
+        class_name : str
+            The fully-qualified name of the class, e.g., ``pkg.mod.Class``.
+        method_name : str
+            The name of the method.
+
+        Returns
+        -------
+        bool
+            Whether the method overrides a documented method in the project.
+        """
+        seen = set()
+        bases = (
+            list(self.classes[class_name].bases) if class_name in self.classes else []
+        )
+        while bases:
+            base = bases.pop()
+            if base in seen or (info := self.classes.get(base)) is None:
+                continue
+            if method_name in info.documented_methods:
+                return True
+            seen.add(base)
+            bases.extend(info.bases)
+        return False
+
+    def save(self) -> None:
+        """Write the index to disk, if it has a path."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(
+            json.dumps({'version': INDEX_FORMAT_VERSION, 'entries': self._entries})
+        )
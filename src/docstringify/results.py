@@ -0,0 +1,180 @@
+"""Results of processing files."""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, NamedTuple
+
+from .components import DocstringMismatch
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .traversal import DocstringVisitor
+
+# bumped whenever the serialized form of the results changes
+RESULT_FORMAT_VERSION = 2
+
+
+class MissingDocstring(NamedTuple):
+    name: str
+    signature_hash: str = ''
+    location: str = ''
+
+
+class FileResult(NamedTuple):
+    filename: str
+    docstrings_inspected: int
+    missing_docstrings: tuple[MissingDocstring, ...]
+    stale_docstrings: tuple[DocstringMismatch, ...] = ()
+
+    @classmethod
+    def from_processor(cls, filename: str, processor: DocstringVisitor) -> FileResult:
+        """
+        Collect the result of processing a file.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file, as it was provided.
+        processor : DocstringVisitor
+            The visitor (or transformer) that processed the file.
+
+        Returns
+        -------
+        FileResult
+            The number of docstrings inspected, along with the fully-qualified names
+            (and signature hashes and, in notebooks, locations) of the symbols with
+            missing docstrings and any stale docstrings.
+        """
+        return cls(
+            filename=filename,
+            docstrings_inspected=processor.docstrings_inspected,
+            missing_docstrings=tuple(
+                MissingDocstring(
+                    docstring_node.fully_qualified_name,
+                    docstring_node.signature_hash,
+                    processor.locate(docstring_node),
+                )
+                for docstring_node in processor.missing_docstrings
+            ),
+            stale_docstrings=tuple(processor.stale_docstrings),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> FileResult:
+        """
+        Restore a result that was serialized with :meth:`to_dict`.
+
+        Parameters
+        ----------
+        data : dict
+            The serialized result.
+
+        Returns
+        -------
+        FileResult
+            The result.
+        """
+        return cls(
+            filename=data['filename'],
+            docstrings_inspected=data['docstrings_inspected'],
+            missing_docstrings=tuple(
+                MissingDocstring(*missing) for missing in data['missing_docstrings']
+            ),
+            stale_docstrings=tuple(
+                DocstringMismatch(
+                    name=mismatch['name'],
+                    added=tuple(mismatch['added']),
+                    removed=tuple(mismatch['removed']),
+                    renamed=tuple(tuple(names) for names in mismatch['renamed']),
+                    missing_returns=mismatch['missing_returns'],
+                )
+                for mismatch in data.get('stale_docstrings', ())
+            ),
+        )
+
+    def to_dict(self) -> dict:
+        """
+        Serialize the result into JSON-compatible types.
+
+        Returns
+        -------
+        dict
+            The serialized result.
+        """
+        return {
+            'filename': self.filename,
+            'docstrings_inspected': self.docstrings_inspected,
+            'missing_docstrings': list(self.missing_docstrings),
+            'stale_docstrings': [
+                mismatch._asdict() for mismatch in self.stale_docstrings
+            ],
+        }
+
+    def report(self) -> None:
+        """
+        Report the missing and stale docstrings, like the visitor that produced the
+        result did.
+        """
+        if not self.missing_docstrings:
+            print(f'No missing docstrings found in {self.filename}.')
+        for missing in self.missing_docstrings:
+            print(
+                f'{self.filename}:{missing.location}: ' if missing.location else '',
+                f'{missing.name} is missing a docstring',
+                sep='',
+                file=sys.stderr,
+            )
+        for mismatch in self.stale_docstrings:
+            print(mismatch, file=sys.stderr)
+
+
+class FileError(NamedTuple):
+    filename: str
+    error_type: str
+    message: str
+
+    def __str__(self) -> str:
+        return f'{self.filename}: {self.error_type}: {self.message}'
+
+    @classmethod
+    def from_exception(cls, filename: str, error: BaseException) -> FileError:
+        """
+        Record an error that occurred while processing a file.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file, as it was provided.
+        error : BaseException
+            The error that was raised.
+
+        Returns
+        -------
+        FileError
+            The name of the file, along with the type and message of the error.
+        """
+        return cls(filename, type(error).__name__, str(error) or repr(error))
+
+
+def summarize_results(results: Iterable[FileResult]) -> tuple[int, int, int]:
+    """
+    Add up the counts across the results of multiple files.
+
+    Parameters
+    ----------
+    results : Iterable[FileResult]
+        The results to summarize.
+
+    Returns
+    -------
+    tuple[int, int, int]
+        The number of docstrings inspected, missing docstrings, and stale docstrings.
+    """
+    docstrings_inspected = missing_docstrings = stale_docstrings = 0
+    for result in results:
+        docstrings_inspected += result.docstrings_inspected
+        missing_docstrings += len(result.missing_docstrings)
+        stale_docstrings += len(result.stale_docstrings)
+    return docstrings_inspected, missing_docstrings, stale_docstrings
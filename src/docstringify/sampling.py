@@ -0,0 +1,170 @@
+"""Statistical sampling of files for estimating docstring coverage."""
+
+from __future__ import annotations
+
+import math
+import random
+from collections import defaultdict
+from pathlib import Path
+from statistics import NormalDist
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class CoverageEstimate(NamedTuple):
+    missing_percentage: float
+    lower_bound: float
+    upper_bound: float
+    confidence: float
+    files_sampled: int
+    files_total: int
+
+
+class Stratum(NamedTuple):
+    population_size: int
+    filenames: list[str]
+
+
+def sample_files(
+    filenames: Sequence[str],
+    size: float | int,
+    seed: int | None = None,
+    stratify: bool = False,
+) -> list[Stratum]:
+    """
+    Select a random subset of the files to process.
+
+    Parameters
+    ----------
+    filenames : Sequence[str]
+        All the files that could be processed.
+    size : float | int
+        The fraction of files (``float``) or the number of files (``int``) to sample.
+    seed : int | None, default=None
+        Seed for the random number generator, which makes the sample reproducible.
+    stratify : bool, default=False
+        Whether to sample each directory separately, allocating the sample
+        proportionally to the number of files in the directory (by largest-remainder
+        rounding, so the sample has the requested size and small directories may not
+        be sampled at all).
+
+    Returns
+    -------
+    list[Stratum]
+        The strata that were sampled, which each provide the number of files in the
+        stratum and the files that were sampled from it.
+    """
+    rng = random.Random(seed)
+    if not (unique_filenames := sorted(set(filenames))):
+        return []
+
+    if stratify:
+        groups = defaultdict(list)
+        for filename in unique_filenames:
+            groups[str(Path(filename).parent)].append(filename)
+        populations = [groups[directory] for directory in sorted(groups)]
+    else:
+        populations = [unique_filenames]
+
+    total = len(unique_filenames)
+    requested = min(total, size if isinstance(size, int) else math.ceil(size * total))
+
+    # each stratum gets the whole part of its quota, and the files left over go to the
+    # strata with the largest fractional parts
+    quotas = [requested * len(population) / total for population in populations]
+    sample_sizes = [math.floor(quota) for quota in quotas]
+    for index in sorted(
+        range(len(quotas)), key=lambda index: sample_sizes[index] - quotas[index]
+    )[: requested - sum(sample_sizes)]:
+        sample_sizes[index] += 1
+
+    return [
+        Stratum(len(population), rng.sample(population, sample_size))
+        for population, sample_size in zip(populations, sample_sizes)
+    ]
+
+
+def estimate_missing_percentage(
+    strata_counts: Sequence[tuple[int, Sequence[tuple[int, int]]]],
+    confidence: float = 0.95,
+) -> CoverageEstimate:
+    """
+    Estimate the percentage of missing docstrings across all files from a sample.
+
+    Files are treated as clusters of docstrings, so the percentage is estimated with a
+    (stratified) ratio estimator, and its variance with the usual linearization,
+    including the finite population correction. The variance can't be estimated for
+    strata with fewer than two sampled files (unless all their files were sampled), in
+    which case the interval spans all possible percentages.
+
+    Parameters
+    ----------
+    strata_counts : Sequence[tuple[int, Sequence[tuple[int, int]]]]
+        For each stratum, the number of files in the stratum, along with a pair of
+        ``(docstrings_inspected, missing_docstrings)`` counts for each sampled file.
+    confidence : float, default=0.95
+        The confidence level for the interval around the estimate.
+
+    Returns
+    -------
+    CoverageEstimate
+        The estimated percentage of missing docstrings and its confidence interval.
+    """
+    estimated_inspected = estimated_missing = 0.0
+    for population_size, counts in strata_counts:
+        if counts:
+            estimated_inspected += (
+                population_size
+                * sum(inspected for inspected, _ in counts)
+                / len(counts)
+            )
+            estimated_missing += (
+                population_size * sum(missing for _, missing in counts) / len(counts)
+            )
+
+    files_sampled = sum(len(counts) for _, counts in strata_counts)
+    files_total = sum(population_size for population_size, _ in strata_counts)
+
+    undersampled = any(
+        len(counts) < min(2, population_size)
+        for population_size, counts in strata_counts
+    )
+    if not estimated_inspected or undersampled:
+        ratio = estimated_missing / estimated_inspected if estimated_inspected else 0.0
+        return CoverageEstimate(
+            ratio, 0.0, float(undersampled), confidence, files_sampled, files_total
+        )
+
+    ratio = estimated_missing / estimated_inspected
+
+    variance = 0.0
+    for population_size, counts in strata_counts:
+        if (sample_size := len(counts)) < 2:
+            continue
+        residuals = [missing - ratio * inspected for inspected, missing in counts]
+        mean_residual = sum(residuals) / sample_size
+        residual_variance = sum(
+            (residual - mean_residual) ** 2 for residual in residuals
+        ) / (sample_size - 1)
+        variance += (
+            population_size**2
+            * (1 - sample_size / population_size)
+            * residual_variance
+            / sample_size
+        )
+
+    margin = (
+        NormalDist().inv_cdf((1 + confidence) / 2)
+        * math.sqrt(variance)
+        / estimated_inspected
+    )
+    return CoverageEstimate(
+        missing_percentage=ratio,
+        lower_bound=max(0.0, ratio - margin),
+        upper_bound=min(1.0, ratio + margin),
+        confidence=confidence,
+        files_sampled=files_sampled,
+        files_total=files_total,
+    )
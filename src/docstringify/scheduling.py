@@ -0,0 +1,163 @@
+"""Ordering the files, so that a time-budgeted run covers the most relevant first."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from .results import summarize_results
+from .sources import STDIN
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from os import PathLike
+
+    from .results import FileResult
+
+HISTORY_FORMAT_VERSION = 1
+
+CHANGED, MISSING_DOCSTRINGS, OTHER = range(3)
+
+
+class FileRecord(NamedTuple):
+    fingerprint: str
+    missing_docstrings: int
+
+
+def file_fingerprint(filename: str) -> str | None:
+    """
+    Identify the state of a file on disk, without reading it.
+
+    Parameters
+    ----------
+    filename : str
+        The file (or archive).
+
+    Returns
+    -------
+    str | None
+        The fingerprint, derived from the file's size and modification time, or
+        ``None`` if the file can't be found or is standard input.
+    """
+    if filename == STDIN:
+        return None
+    try:
+        stat = Path(filename).expanduser().stat()
+    except OSError:
+        return None
+    return f'{stat.st_size}:{stat.st_mtime_ns}'
+
+
+class RunHistory:
+    """
+    Record of the state of each file in the previous runs, along with the number of
+    docstrings it was missing, to prioritize the files in the next run.
+
+    Parameters
+    ----------
+    path : str | PathLike | None, default=None
+        The file to store the history in, if any.
+    """
+
+    def __init__(self, path: str | PathLike | None = None) -> None:
+        self.path = Path(path) if path is not None else None
+        self.files: dict[str, FileRecord] = {}
+
+        if self.path is not None:
+            try:
+                history = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                history = {}
+            if history.get('version') == HISTORY_FORMAT_VERSION:
+                self.files = {
+                    filename: FileRecord(*record)
+                    for filename, record in history.get('files', {}).items()
+                }
+
+    def get_priority(self, filename: str, fingerprint: str | None) -> tuple[int, int]:
+        """
+        Determine how soon to process a file.
+
+        Parameters
+        ----------
+        filename : str
+            The file.
+        fingerprint : str | None
+            The current fingerprint of the file, if it has one.
+
+        Returns
+        -------
+        tuple[int, int]
+            The sort key of the file: the files that changed since they were recorded
+            (or were never recorded) come first, followed by those missing docstrings,
+            from the most to the fewest, and then all the others.
+        """
+        record = self.files.get(filename)
+        if fingerprint is None or record is None or record.fingerprint != fingerprint:
+            return CHANGED, 0
+        if record.missing_docstrings:
+            return MISSING_DOCSTRINGS, -record.missing_docstrings
+        return OTHER, 0
+
+    def prioritize(
+        self, filenames: Iterable[str], fingerprints: Mapping[str, str | None]
+    ) -> list[str]:
+        """
+        Order the files by priority, keeping the order they were provided in for the
+        files with the same priority.
+
+        Parameters
+        ----------
+        filenames : Iterable[str]
+            The files to process.
+        fingerprints : Mapping[str, str | None]
+            The current fingerprint of each file.
+
+        Returns
+        -------
+        list[str]
+            The files, ordered by :meth:`get_priority`.
+        """
+        return sorted(
+            filenames,
+            key=lambda filename: self.get_priority(filename, fingerprints[filename]),
+        )
+
+    def record(
+        self, filename: str, fingerprint: str | None, results: list[FileResult]
+    ) -> None:
+        """
+        Record the state of a file that was processed in full.
+
+        Parameters
+        ----------
+        filename : str
+            The file.
+        fingerprint : str | None
+            The fingerprint of the file when it was processed; files without one
+            aren't recorded.
+        results : list[FileResult]
+            The results for the sources in the file.
+        """
+        if fingerprint is not None:
+            self.files[filename] = FileRecord(
+                fingerprint, summarize_results(results)[1]
+            )
+
+    def save(self) -> None:
+        """Write the history to disk, if it has a path."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(
+            json.dumps(
+                {
+                    'version': HISTORY_FORMAT_VERSION,
+                    'files': {
+                        filename: list(record)
+                        for filename, record in sorted(self.files.items())
+                    },
+                }
+            )
+        )
@@ -0,0 +1,211 @@
+"""Partitioning files across machines and merging their partial results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from .exceptions import (
+    DuplicateShardError,
+    IncompleteShardsError,
+    InvalidShardError,
+    MismatchedShardCountsError,
+    MixedPartialsError,
+    MixedPartialSourcesError,
+    PartialResultsFormatError,
+)
+from .results import FileError, FileResult
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from os import PathLike
+
+PARTIAL_FORMAT_VERSION = 3
+
+# where the files were read from, when not from disk
+GIT_SOURCE = 'git'
+STAGED_SOURCE = 'staged'
+
+
+class Shard(NamedTuple):
+    index: int
+    count: int
+
+    def __str__(self) -> str:
+        return f'{self.index}/{self.count}'
+
+    @classmethod
+    def from_string(cls, value: str) -> Shard:
+        """
+        Parse a shard specification.
+
+        Parameters
+        ----------
+        value : str
+            The shard specification as ``i/n``, where ``1 <= i <= n``.
+
+        Returns
+        -------
+        Shard
+            The shard.
+        """
+        index, _, count = value.partition('/')
+        try:
+            shard = cls(int(index), int(count))
+        except ValueError:
+            raise InvalidShardError(value) from None
+        if not 1 <= shard.index <= shard.count:
+            raise InvalidShardError(value)
+        return shard
+
+    def contains(self, filename: str) -> bool:
+        """
+        Check whether a file belongs to this shard.
+
+        The assignment only depends on the path (as it was provided), so it is stable
+        across processes, machines, and Python versions.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file.
+
+        Returns
+        -------
+        bool
+            Whether the file belongs to this shard.
+        """
+        digest = hashlib.blake2b(
+            Path(filename).as_posix().encode(), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, 'big') % self.count == self.index - 1
+
+    def select(self, filenames: Iterable[str]) -> list[str]:
+        """
+        Select the files belonging to this shard.
+
+        Parameters
+        ----------
+        filenames : Iterable[str]
+            All the files to be processed across all shards.
+
+        Returns
+        -------
+        list[str]
+            The files to process in this shard.
+        """
+        return [filename for filename in filenames if self.contains(filename)]
+
+
+def write_partial(
+    path: str | PathLike,
+    results: Iterable[FileResult],
+    errors: Iterable[FileError] = (),
+    shard: Shard | None = None,
+    uncovered_files: Iterable[str] = (),
+    source: str | None = None,
+) -> None:
+    """
+    Write the raw results of a (sharded) run for combining them later.
+
+    Parameters
+    ----------
+    path : str | PathLike
+        The file to write the partial results to.
+    results : Iterable[FileResult]
+        The results for the files that were processed.
+    errors : Iterable[FileError], default=()
+        The errors for the files that couldn't be processed.
+    shard : Shard | None, default=None
+        The shard that was processed, if any.
+    uncovered_files : Iterable[str], default=()
+        The files that weren't checked, because the time budget was exhausted.
+    source : str | None, default=None
+        Where the files were read from, if not from disk: ``'git'`` for a revision
+        (``--git-rev``) or ``'staged'`` for the index (``--staged``), in which case
+        the files are reported as ``REV:PATH``.
+    """
+    Path(path).write_text(
+        json.dumps(
+            {
+                'version': PARTIAL_FORMAT_VERSION,
+                'shard': str(shard) if shard else None,
+                'source': source,
+                'files': [result.to_dict() for result in results],
+                'errors': [error._asdict() for error in errors],
+                'uncovered_files': list(uncovered_files),
+            },
+            indent=2,
+        )
+    )
+
+
+class MergedPartials(NamedTuple):
+    results: list[FileResult]
+    errors: list[FileError]
+    uncovered_files: list[str]
+    source: str | None
+
+
+def read_partials(paths: Sequence[str | PathLike]) -> MergedPartials:
+    """
+    Read and combine the partial results written by :func:`write_partial`.
+
+    Partials from sharded runs must cover each shard exactly once, and can't be
+    combined with partials from unsharded runs, so every file is counted once. All
+    the partials must also read the files from the same place (see
+    :func:`write_partial`).
+
+    Parameters
+    ----------
+    paths : Sequence[str | PathLike]
+        The files containing partial results.
+
+    Returns
+    -------
+    MergedPartials
+        The results for all files across the partials, along with the errors for the
+        files that couldn't be processed, the files that weren't checked within
+        the time budget, and where the files were read from.
+    """
+    results, errors, uncovered_files = [], [], []
+    sources: dict[str | None, str] = {}
+    shards: dict[Shard, str] = {}
+    unsharded_paths = []
+    for path in paths:
+        partial = json.loads(Path(path).read_text())
+        if partial.get('version') != PARTIAL_FORMAT_VERSION:
+            raise PartialResultsFormatError(path)
+        if partial['shard']:
+            shard = Shard.from_string(partial['shard'])
+            if shard in shards:
+                raise DuplicateShardError(str(shard), [shards[shard], str(path)])
+            shards[shard] = str(path)
+        else:
+            unsharded_paths.append(str(path))
+        results.extend(FileResult.from_dict(result) for result in partial['files'])
+        errors.extend(FileError(**error) for error in partial.get('errors', []))
+        uncovered_files.extend(partial.get('uncovered_files', []))
+        sources.setdefault(partial.get('source'), str(path))
+
+    if shards and unsharded_paths:
+        raise MixedPartialsError(unsharded_paths)
+
+    if len(sources) > 1:
+        raise MixedPartialSourcesError(sources.values())
+
+    if shards:
+        counts = {shard.count for shard in shards}
+        if len(counts) > 1:
+            raise MismatchedShardCountsError(counts)
+        count = counts.pop()
+        if missing_shards := [
+            str(Shard(index, count))
+            for index in range(1, count + 1)
+            if Shard(index, count) not in shards
+        ]:
+            raise IncompleteShardsError(missing_shards)
+
+    return MergedPartials(results, errors, uncovered_files, next(iter(sources), None))
@@ -0,0 +1,309 @@
+"""Sources of Python code to process."""
+
+from __future__ import annotations
+
+import codecs
+import io
+import mmap
+import re
+import sys
+import tokenize
+from functools import cache, cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, NamedTuple
+
+if TYPE_CHECKING:
+    import ast
+    from os import PathLike
+
+STDIN = '-'
+
+# files at least this large are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 1 << 20
+LINE_BREAK = re.compile(rb'\r\n|\r|\n')
+
+
+class SourceFile(NamedTuple):
+    filename: str
+    load: Callable[[], str] | None = None
+    module_name: str | None = None
+    cache_key: str | None = None
+    size: int | None = None
+    # the raw bytes, for sources passed through unchanged (e.g., standard input)
+    load_bytes: Callable[[], bytes] | None = None
+
+
+def decode_source(data: bytes) -> str:
+    """
+    Decode Python source code, respecting any BOM or encoding declaration.
+
+    Parameters
+    ----------
+    data : bytes
+        The raw source code.
+
+    Returns
+    -------
+    str
+        The decoded source code with universal newlines.
+    """
+    encoding, _ = tokenize.detect_encoding(io.BytesIO(data).readline)
+    return io.TextIOWrapper(io.BytesIO(data), encoding=encoding).read()
+
+
+def _make_readline(data: bytes | mmap.mmap) -> Callable[[], bytes]:
+    end = 0
+
+    def readline() -> bytes:
+        nonlocal end
+        start = end
+        newline = data.find(b'\n', start)
+        end = len(data) if newline == -1 else newline + 1
+        return data[start:end]
+
+    return readline
+
+
+class SourceBuffer:
+    """
+    The raw bytes of Python source code, which are parsed without decoding them
+    first, with lookups of the source segments of AST nodes by line offset.
+
+    Parameters
+    ----------
+    data : bytes | mmap.mmap
+        The source code, encoded as declared by its BOM or encoding declaration
+        (:pep:`263`), or in UTF-8 by default.
+    """
+
+    def __init__(self, data: bytes | mmap.mmap) -> None:
+        self.data = data
+        self.encoding, _ = tokenize.detect_encoding(_make_readline(data))
+
+        # the AST positions are offsets into the UTF-8 encoding of each line
+        self.is_utf8 = codecs.lookup(self.encoding).name in ('utf-8', 'utf-8-sig')
+        self.bom_size = len(codecs.BOM_UTF8) if data[:3] == codecs.BOM_UTF8 else 0
+
+    @classmethod
+    def from_text(cls, source_code: str) -> SourceBuffer:
+        """
+        Wrap source code that was already decoded.
+
+        Parameters
+        ----------
+        source_code : str
+            The source code.
+
+        Returns
+        -------
+        SourceBuffer
+            The buffer, holding the source code encoded in UTF-8.
+        """
+        buffer = cls(source_code.encode())
+        # any encoding declaration no longer applies to the re-encoded code
+        buffer.encoding, buffer.is_utf8 = 'utf-8', True
+        return buffer
+
+    @classmethod
+    def read(
+        cls, path: str | PathLike, mmap_threshold: int = MMAP_THRESHOLD
+    ) -> SourceBuffer:
+        """
+        Read a Python file from disk.
+
+        Parameters
+        ----------
+        path : str | PathLike
+            The file.
+        mmap_threshold : int, default=MMAP_THRESHOLD
+            The size in bytes from which the file is memory-mapped instead of read.
+
+        Returns
+        -------
+        SourceBuffer
+            The buffer.
+        """
+        with Path(path).open('rb') as file:
+            if Path(path).stat().st_size < mmap_threshold:
+                return cls(file.read())
+            # the mapping stays valid after the file is closed
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def decode(self, size: int | None = None) -> str:
+        """
+        Decode the source code, like :func:`decode_source`, without copying the buffer.
+
+        Parameters
+        ----------
+        size : int | None, default=None
+            The number of bytes to decode from the start of the buffer, or ``None`` to
+            decode all of it. Any character cut off at the end is left out.
+
+        Returns
+        -------
+        str
+            The decoded source code with universal newlines.
+        """
+        decoder = codecs.getincrementaldecoder(self.encoding)()
+        text = decoder.decode(self.data[self.bom_size : size], final=size is None)
+        return text.replace('\r\n', '\n').replace('\r', '\n')
+
+    def close(self) -> None:
+        """
+        Release the memory-mapping of the file, if any, so the file can be rewritten
+        (which fails on Windows while it is still mapped).
+
+        The buffer can't be used afterwards, if it was memory-mapped. Closing it more
+        than once has no effect.
+        """
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    @cached_property
+    def line_offsets(self) -> list[int]:
+        """
+        The offset of the start of each line in the buffer, after any BOM.
+
+        Returns
+        -------
+        list[int]
+            The offsets, where the offset of line ``n`` (1-based) is at index
+            ``n - 1``, followed by the size of the buffer.
+        """
+        return [
+            self.bom_size,
+            *(match.end() for match in LINE_BREAK.finditer(self.data)),
+            len(self.data),
+        ]
+
+    def get_line(self, line_number: int) -> str:
+        """
+        Get a line of the source code.
+
+        Parameters
+        ----------
+        line_number : int
+            The line number (1-based).
+
+        Returns
+        -------
+        str
+            The line, including its line break.
+        """
+        return self.data[
+            self.line_offsets[line_number - 1] : self.line_offsets[line_number]
+        ].decode(self.encoding)
+
+    def get_source_segment(self, node: ast.AST) -> str | None:
+        """
+        Get the source code of an AST node, like :func:`ast.get_source_segment`,
+        without splitting the entire source code into lines.
+
+        Parameters
+        ----------
+        node : ast.AST
+            The node.
+
+        Returns
+        -------
+        str | None
+            The source code of the node, with universal newlines, or ``None`` if the
+            node has no location information.
+        """
+        try:
+            start_line, end_line = node.lineno, node.end_lineno
+            start_col, end_col = node.col_offset, node.end_col_offset
+        except AttributeError:
+            return None
+        if end_line is None or end_col is None:
+            return None
+
+        if self.is_utf8:
+            # the columns are offsets into the buffer itself
+            start = self.line_offsets[start_line - 1] + start_col
+            end = self.line_offsets[end_line - 1] + end_col
+            segment = self.data[start:end].decode()
+        else:
+            lines = [
+                self.get_line(line_number).encode()
+                for line_number in range(start_line, end_line + 1)
+            ]
+            lines[-1] = lines[-1][:end_col]
+            lines[0] = lines[0][start_col:]
+            segment = b''.join(lines).decode()
+
+        if '\r' in segment:
+            segment = segment.replace('\r\n', '\n').replace('\r', '\n')
+        return segment
+
+
+def module_name_from_path(path: str) -> str:
+    """
+    Convert the relative path of a Python file into a dotted module name.
+
+    Parameters
+    ----------
+    path : str
+        The relative path, using forward slashes, e.g., ``pkg/sub/__init__.py``.
+
+    Returns
+    -------
+    str
+        The module name, e.g., ``pkg.sub``.
+    """
+    parts = path.removesuffix('.py').split('/')
+    if len(parts) > 1 and parts[-1] == '__init__':
+        parts.pop()
+    return '.'.join(parts)
+
+
+def disk_source(filename: str) -> SourceFile:
+    """
+    Describe a file on disk, which will be read by the visitor itself.
+
+    Parameters
+    ----------
+    filename : str
+        The file.
+
+    Returns
+    -------
+    SourceFile
+        The source, with a cache key derived from the file's path, size, and
+        modification time.
+    """
+    path = Path(filename).expanduser().resolve()
+    try:
+        stat = path.stat()
+    except OSError:
+        # let the visitor raise the error, when it tries to read the file
+        return SourceFile(filename)
+    return SourceFile(
+        filename,
+        cache_key=f'file:{path}:{stat.st_size}:{stat.st_mtime_ns}',
+        size=stat.st_size,
+    )
+
+
+def stdin_source(stdin_filename: str | None = None) -> SourceFile:
+    """
+    Describe the source code piped to standard input.
+
+    Parameters
+    ----------
+    stdin_filename : str | None, default=None
+        The name to report the code under, which also determines the module name.
+
+    Returns
+    -------
+    SourceFile
+        The source, which isn't cached, since it has no stable identity. Its raw bytes
+        are kept, so they can be written back unchanged.
+    """
+    read = cache(sys.stdin.buffer.read)
+    return SourceFile(
+        stdin_filename or '<stdin>',
+        load=lambda: decode_source(read()),
+        module_name=Path(stdin_filename).stem if stdin_filename else 'stdin',
+        load_bytes=read,
+    )
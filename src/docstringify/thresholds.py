@@ -0,0 +1,180 @@
+"""Thresholds for the files matching a path pattern, checked separately."""
+
+from __future__ import annotations
+
+import contextlib
+import fnmatch
+import re
+from pathlib import Path, PurePath
+from typing import TYPE_CHECKING, NamedTuple
+
+from .exceptions import InvalidPathThresholdError, TomlUnavailableError
+from .results import summarize_results
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from .results import FileResult
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ModuleNotFoundError:
+        tomllib = None
+
+PYPROJECT_TABLE = ('tool', 'docstringify', 'path-thresholds')
+# detects the settings when TOML can't be parsed, to avoid silently ignoring them
+PYPROJECT_TABLE_HEADER = re.compile(
+    r'^[ \t]*\[[ \t]*tool[ \t]*\.[ \t]*docstringify\b', re.MULTILINE
+)
+
+
+class PathThreshold(NamedTuple):
+    pattern: str
+    threshold: float
+
+    def __str__(self) -> str:
+        return f'{self.pattern}={self.threshold}'
+
+    @classmethod
+    def from_string(cls, value: str) -> PathThreshold:
+        """
+        Parse a path threshold rule.
+
+        Parameters
+        ----------
+        value : str
+            The rule as ``PATTERN=THRESHOLD``, e.g., ``src/internal/=0.8``.
+
+        Returns
+        -------
+        PathThreshold
+            The rule.
+        """
+        pattern, _, threshold = value.rpartition('=')
+        try:
+            rule = cls(pattern, float(threshold))
+        except ValueError:
+            raise InvalidPathThresholdError(value) from None
+        if not pattern or not 0 <= rule.threshold <= 1:
+            raise InvalidPathThresholdError(value)
+        return rule
+
+    def compile(self) -> re.Pattern:
+        """
+        Compile the pattern into a regular expression for matching paths.
+
+        Returns
+        -------
+        re.Pattern
+            A regular expression matching the paths that match the glob pattern
+            (where ``*`` also matches ``/``) or that are inside the directory it
+            names, e.g., ``scripts/`` or ``scripts`` for everything in ``scripts``.
+        """
+        directory = self.pattern.rstrip('/')
+        return re.compile(
+            f'{fnmatch.translate(self.pattern)}|{fnmatch.translate(directory + "/*")}'
+        )
+
+
+def load_pyproject_thresholds(path: str = 'pyproject.toml') -> list[PathThreshold]:
+    """
+    Read the path threshold rules from the ``[tool.docstringify.path-thresholds]``
+    table of a ``pyproject.toml`` file.
+
+    Parameters
+    ----------
+    path : str, default='pyproject.toml'
+        The ``pyproject.toml`` file.
+
+    Returns
+    -------
+    list[PathThreshold]
+        The rules, in the order they are defined, or no rules if the file or the
+        table doesn't exist.
+
+    Raises
+    ------
+    TomlUnavailableError
+        If the file has Docstringify settings, but TOML can't be parsed (Python < 3.11
+        without ``tomli``).
+    """
+    if not Path(path).is_file():
+        return []
+    if tomllib is None:
+        if PYPROJECT_TABLE_HEADER.search(Path(path).read_text(encoding='utf-8')):
+            raise TomlUnavailableError
+        return []
+
+    with Path(path).open('rb') as file:
+        table = tomllib.load(file)
+    for key in PYPROJECT_TABLE:
+        table = table.get(key, {})
+
+    return [
+        PathThreshold.from_string(f'{pattern}={threshold}')
+        for pattern, threshold in table.items()
+    ]
+
+
+def _to_match_path(filename: str) -> str:
+    path = PurePath(filename)
+    if path.is_absolute():
+        with contextlib.suppress(ValueError):
+            path = path.relative_to(Path.cwd())
+    return path.as_posix()
+
+
+class ThresholdBucket(NamedTuple):
+    rule: PathThreshold | None
+    filenames: list[str]
+    docstrings_inspected: int
+    missing_docstrings: int
+
+
+def bucket_results(
+    results: Mapping[str, Iterable[FileResult]], rules: Sequence[PathThreshold]
+) -> list[ThresholdBucket]:
+    """
+    Add up the counts of the files matching each rule, where each file only counts
+    towards the first rule it matches.
+
+    Parameters
+    ----------
+    results : Mapping[str, Iterable[FileResult]]
+        The results, keyed by the path to match the rules against.
+    rules : Sequence[PathThreshold]
+        The rules, in order of precedence.
+
+    Returns
+    -------
+    list[ThresholdBucket]
+        The bucket for each rule, in order, followed by the bucket for the files not
+        matching any rule (with a ``rule`` of ``None``).
+    """
+    patterns = [rule.compile() for rule in rules]
+    filenames: list[list[str]] = [[] for _ in range(len(rules) + 1)]
+    counts = [[0, 0] for _ in range(len(rules) + 1)]
+    for filename, file_results in results.items():
+        match_path = _to_match_path(filename)
+        index = next(
+            (
+                index
+                for index, pattern in enumerate(patterns)
+                if pattern.fullmatch(match_path)
+            ),
+            len(rules),
+        )
+        inspected, missing, _ = summarize_results(file_results)
+        filenames[index].append(filename)
+        counts[index][0] += inspected
+        counts[index][1] += missing
+
+    return [
+        ThresholdBucket(rule, bucket_filenames, *bucket_counts)
+        for rule, bucket_filenames, bucket_counts in zip(
+            [*rules, None], filenames, counts
+        )
+    ]
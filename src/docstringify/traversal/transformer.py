@@ -1,13 +1,33 @@
 from __future__ import annotations
 
 import ast
-from typing import TYPE_CHECKING
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Callable
 
+from ..notebooks import NotebookEdit
 from .visitor import DocstringVisitor
 
 if TYPE_CHECKING:
     from ..converters import DocstringConverter
+    from ..exports import ExportIndex
+    from ..filters import SymbolFilter
+    from ..hooks import HookDispatcher
     from ..nodes.base import DocstringNode
+    from ..project_index import ProjectIndex
+    from ..sources import SourceBuffer
+
+
+def _write_edited_code(filename: str | Path, edited_code: str, overwrite: bool) -> None:
+    source_file = Path(filename).expanduser().resolve()
+    output = (
+        source_file
+        if overwrite
+        else source_file.parent
+        / (source_file.stem + '_docstringify' + ''.join(source_file.suffixes))
+    )
+    output.write_text(edited_code, encoding='utf-8')
+    print(f'Docstring templates written to {output}')
 
 
 class DocstringTransformer(ast.NodeTransformer, DocstringVisitor):
@@ -16,27 +36,132 @@ class DocstringTransformer(ast.NodeTransformer, DocstringVisitor):
         filename: str,
         converter: type[DocstringConverter],
         overwrite: bool = False,
+        symbol_filter: SymbolFilter | None = None,
+        validator: type[DocstringConverter] | None = None,
+        source_code: str | None = None,
+        module_name: str | None = None,
+        project_index: ProjectIndex | None = None,
+        export_index: ExportIndex | None = None,
+        output_stream: BinaryIO | None = None,
+        hooks: HookDispatcher | None = None,
+        source_buffer: SourceBuffer | None = None,
     ) -> None:
-        super().__init__(filename, converter)
+        super().__init__(
+            filename,
+            converter,
+            symbol_filter=symbol_filter,
+            validator=validator,
+            source_code=source_code,
+            module_name=module_name,
+            project_index=project_index,
+            export_index=export_index,
+            hooks=hooks,
+            source_buffer=source_buffer,
+        )
         self.overwrite = overwrite
 
+        # when set, the code is always written here (even if unchanged) instead of disk
+        self.output_stream = output_stream
+
+        # notebooks are edited in place, since unparsing would lose the cells
+        self.notebook_edits: list[NotebookEdit] = []
+
+        # rendered once, so it can also be written to any copies of the file
+        self.edited_code: str | None = None
+
     def save(self) -> None:
-        if self.missing_docstrings:
-            output = (
-                self.source_file
-                if self.overwrite
-                else self.source_file.parent
-                / (
-                    self.source_file.stem
-                    + '_docstringify'
-                    + ''.join(self.source_file.suffixes)
-                )
+        if self.output_stream is not None:
+            # unchanged code passes through byte for byte, keeping its line breaks
+            self.output_stream.write(
+                self.encode(ast.unparse(self.tree) + '\n')
+                if self.missing_docstrings
+                else self.source_buffer.data
+            )
+        elif self.missing_docstrings:
+            if self.notebook is not None:
+                self.notebook.apply_edits(self.notebook_edits)
+                self.edited_code = self.notebook.dumps()
+            else:
+                self.edited_code = ast.unparse(self.tree)
+            _write_edited_code(self.source_file, self.edited_code, self.overwrite)
+
+    def encode(self, edited_code: str) -> bytes:
+        encoding = self.source_buffer.encoding
+        if not self.source_buffer.is_utf8:
+            # the encoding declaration is a comment, which unparsing drops
+            edited_code = f'# -*- coding: {encoding} -*-\n{edited_code}'
+        return edited_code.encode(encoding)
+
+    def get_copy_writer(self) -> Callable[[str], None] | None:
+        if self.edited_code is None:
+            return None
+        # only the edited code is kept alive, not the tree
+        return partial(
+            _write_edited_code, edited_code=self.edited_code, overwrite=self.overwrite
+        )
+
+    def quote_docstring(self, docstring: str) -> str:
+        if '"""' in docstring or docstring.endswith('"'):
+            return ast.unparse(ast.Constant(docstring))
+        prefix = 'r' if '\\' in docstring else ''
+        return f'{prefix}"""{docstring}"""'
+
+    def get_notebook_edit(self, docstring_node: DocstringNode) -> NotebookEdit:
+        node = docstring_node.ast_node
+        is_module = isinstance(node, ast.Module)
+        if not node.body:  # only possible for a module without any code
+            docstring = self.docstring_converter.suggest_docstring(docstring_node)
+            return NotebookEdit(1, 0, 1, 0, f'{self.quote_docstring(docstring)}\n')
+
+        first = node.body[0]
+        if docstring_node.docstring is not None:
+            # the empty docstring is replaced
+            docstring = self.docstring_converter.suggest_docstring(
+                docstring_node, indent=first.col_offset
+            )
+            return NotebookEdit(
+                first.lineno,
+                first.col_offset,
+                first.end_lineno,
+                first.end_col_offset,
+                self.quote_docstring(docstring),
             )
-            edited_code = ast.unparse(self.tree)
-            output.write_text(edited_code)
-            print(f'Docstring templates written to {output}')
+
+        # the docstring goes before the first statement, including its decorators
+        decorators = getattr(first, 'decorator_list', None)
+        line_number = decorators[0].lineno if decorators else first.lineno
+        prefix = self.notebook.get_line(line_number).encode()[: first.col_offset]
+        if prefix.strip():
+            # the body starts on the same line as the definition, e.g., def f(): pass
+            indent = ' ' * (node.col_offset + 4)
+            docstring = self.docstring_converter.suggest_docstring(
+                docstring_node, indent=len(indent)
+            )
+            return NotebookEdit(
+                line_number,
+                len(prefix.rstrip()),
+                line_number,
+                first.col_offset,
+                f'\n{indent}{self.quote_docstring(docstring)}\n{indent}',
+            )
+
+        indent = 0 if is_module else first.col_offset
+        docstring = self.docstring_converter.suggest_docstring(
+            docstring_node, indent=indent
+        )
+        return NotebookEdit(
+            line_number,
+            first.col_offset,
+            line_number,
+            first.col_offset,
+            f'{self.quote_docstring(docstring)}\n{" " * indent}',
+        )
 
     def handle_missing_docstring(self, docstring_node: DocstringNode) -> DocstringNode:
+        if self.notebook is not None:
+            self.notebook_edits.append(self.get_notebook_edit(docstring_node))
+            return docstring_node
+
         suggested_docstring = self.docstring_converter.suggest_docstring(
             docstring_node,
             indent=0
@@ -56,6 +181,7 @@ class DocstringTransformer(ast.NodeTransformer, DocstringVisitor):
 
         return docstring_node
 
-    def process_file(self) -> None:
-        super().process_file()
+    def finish(self) -> None:
+        # the file is released first, since it can't be rewritten while memory-mapped
+        super().finish()
         self.save()
@@ -3,46 +3,143 @@ from __future__ import annotations
 import ast
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 from ..nodes.base import DocstringNode
 from ..nodes.function import FunctionDocstringNode
+from ..notebooks import Notebook, is_notebook
+from ..sources import SourceBuffer
 
 if TYPE_CHECKING:
+    from ..components import DocstringMismatch
     from ..converters import DocstringConverter
+    from ..exports import ExportIndex, ModuleExports
+    from ..filters import SymbolFilter
+    from ..hooks import HookDispatcher
+    from ..project_index import ProjectIndex
 
 
 class DocstringVisitor(ast.NodeVisitor):
     def __init__(
-        self, filename: str, converter: type[DocstringConverter] | None = None
+        self,
+        filename: str,
+        converter: type[DocstringConverter] | None = None,
+        symbol_filter: SymbolFilter | None = None,
+        validator: type[DocstringConverter] | None = None,
+        source_code: str | None = None,
+        module_name: str | None = None,
+        project_index: ProjectIndex | None = None,
+        export_index: ExportIndex | None = None,
+        hooks: HookDispatcher | None = None,
+        source_buffer: SourceBuffer | None = None,
     ) -> None:
-        self.source_file: Path = Path(filename).expanduser().resolve()
-        self.source_code: str = self.source_file.read_text()
-        self.tree: ast.Module = ast.parse(self.source_code)
+        # the source code may have been read elsewhere (e.g., from an archive)
+        self.source_file: Path = (
+            Path(filename).expanduser().resolve()
+            if source_code is None
+            else Path(filename)
+        )
+        # notebooks are parsed as the module formed by joining their code cells
+        self.notebook: Notebook | None = (
+            Notebook.read(self.source_file)
+            if source_code is None and is_notebook(filename)
+            else None
+        )
+        if self.notebook is not None:
+            source_code = self.notebook.source_code
+            # the module is formed by the cells, not the raw JSON of the notebook
+            source_buffer = None
+
+        # files (and any raw bytes the source code was decoded from) are parsed from
+        # their bytes, so their encoding declaration applies
+        self._source_code: str | None = source_code
+        is_decoded = source_code is not None and source_buffer is None
+        self.source_buffer: SourceBuffer = (
+            SourceBuffer.from_text(source_code)
+            if is_decoded
+            else source_buffer
+            if source_buffer is not None
+            else SourceBuffer.read(self.source_file)
+        )
+        self.filename: str = filename
+        self.tree: ast.Module = ast.parse(
+            source_code if is_decoded else self.source_buffer.data
+        )
+
+        # resolved once, so events without handlers only cost a comparison per node
+        self.node_hook: Callable[[DocstringNode], None] | None = (
+            hooks.on_node if hooks else None
+        )
+        self.missing_hook: Callable[[DocstringNode], None] | None = (
+            hooks.on_missing if hooks else None
+        )
+        if hooks and hooks.on_parsed is not None:
+            hooks.on_parsed(filename, self.tree)
 
         self.docstrings_inspected: int = 0
         self.missing_docstrings: list[DocstringNode] = []
+        self.stale_docstrings: list[DocstringMismatch] = []
 
-        self.module_name: str = self.source_file.stem
+        self.module_name: str = module_name or self.source_file.stem
         self.stack: list[DocstringNode] = []
+        self.symbol_filter: SymbolFilter | None = symbol_filter or None
+
+        self.module_exports: ModuleExports | None = (
+            export_index.get_exports(
+                self.module_name,
+                self.tree,
+                path=self.source_file if source_code is None else None,
+            )
+            if export_index
+            else None
+        )
+
+        # only files on disk are in the project index
+        self.project_index: ProjectIndex | None = project_index
+        self.index_module_name: str | None = (
+            project_index.module_names.get(str(self.source_file))
+            if project_index
+            else None
+        )
 
         self.docstring_converter: DocstringConverter | None = (
             converter(quote=not issubclass(self.__class__, ast.NodeTransformer))
             if converter
             else None
         )
+        self.docstring_validator: DocstringConverter | None = (
+            validator(quote=False) if validator else None
+        )
 
     def report_missing_docstrings(self) -> None:
         if not self.missing_docstrings:
             print(f'No missing docstrings found in {self.source_file}.')
         else:
             for docstring_node in self.missing_docstrings:
+                location = self.locate(docstring_node)
                 print(
+                    f'{self.filename}:{location}: ' if location else '',
                     f'{docstring_node.fully_qualified_name} is missing a docstring',
+                    sep='',
                     file=sys.stderr,
                 )
                 self.handle_missing_docstring(docstring_node)
 
+    def locate(self, docstring_node: DocstringNode) -> str:
+        if self.notebook is None:
+            return ''
+        return self.notebook.locate(getattr(docstring_node.ast_node, 'lineno', 1))
+
+    def report_stale_docstrings(self) -> None:
+        for mismatch in self.stale_docstrings:
+            print(mismatch, file=sys.stderr)
+
+    def validate_docstring(self, docstring_node: DocstringNode) -> None:
+        if isinstance(docstring_node, FunctionDocstringNode) and (
+            mismatch := self.docstring_validator.validate_docstring(docstring_node)
+        ):
+            self.stale_docstrings.append(mismatch)
+
     def handle_missing_docstring(self, docstring_node: DocstringNode) -> DocstringNode:
         if self.docstring_converter:
             print(
@@ -55,6 +152,8 @@ class DocstringVisitor(ast.NodeVisitor):
     def process_docstring(self, docstring_node: DocstringNode) -> DocstringNode:
         if docstring_node.docstring_required and not docstring_node.docstring:
             self.missing_docstrings.append(docstring_node)
+            if self.missing_hook is not None:
+                self.missing_hook(docstring_node)
 
         self.docstrings_inspected += 1
         return docstring_node
@@ -64,17 +163,61 @@ class DocstringVisitor(ast.NodeVisitor):
         node: ast.AsyncFunctionDef | ast.ClassDef | ast.FunctionDef | ast.Module,
         docstring_class: type[DocstringNode],
     ) -> ast.AsyncFunctionDef | ast.ClassDef | ast.FunctionDef | ast.Module:
+        parent = self.stack[-1] if self.stack else None
+
+        # skip excluded symbols before descending, so their subtrees are never walked
+        if self.module_exports and not self.module_exports.includes(
+            node, parent.ast_node if parent else None
+        ):
+            return node
+
+        if self.symbol_filter and self.symbol_filter.excludes(
+            node,
+            parent.ast_node if parent else None,
+            depth=len(self.stack),
+            name=getattr(node, 'name', self.module_name),
+        ):
+            return node
+
         docstring_node = docstring_class(
             node,
             self.module_name,
-            self.source_code,
-            parent=self.stack[-1] if self.stack else None,
+            self.source_buffer,
+            parent=parent,
         )
 
+        if (
+            self.index_module_name
+            and isinstance(docstring_node, FunctionDocstringNode)
+            and docstring_node.is_method
+        ):
+            class_name = parent.fully_qualified_name.removeprefix(self.module_name)
+            docstring_node.overrides_documented_method = (
+                self.project_index.documents_method(
+                    f'{self.index_module_name}{class_name}', docstring_node.name
+                )
+            )
+
         self.stack.append(docstring_node)
 
-        docstring_node = self.process_docstring(docstring_node)
+        # private modules are still traversed for the names their packages re-export,
+        # and modules whose docstring is ignored, for their classes and functions
+        if not (
+            isinstance(node, ast.Module)
+            and (
+                (self.module_exports and not self.module_exports.public)
+                or (self.symbol_filter and self.symbol_filter.ignores_module_docstring)
+            )
+        ):
+            if self.node_hook is not None:
+                self.node_hook(docstring_node)
+            docstring_node = self.process_docstring(docstring_node)
         self.generic_visit(docstring_node.ast_node)
+
+        # validation needs the return statements, which are collected by generic_visit()
+        if self.docstring_validator:
+            self.validate_docstring(docstring_node)
+
         self.stack.pop()
         return docstring_node.ast_node
 
@@ -97,6 +240,32 @@ class DocstringVisitor(ast.NodeVisitor):
             self.stack[-1].return_statements.append(node)
         return node
 
+    def visit_Yield(self, node: ast.Yield) -> ast.Yield:  # noqa: N802
+        if isinstance(self.stack[-1], FunctionDocstringNode):
+            self.stack[-1].is_generator = True
+        self.generic_visit(node)
+        return node
+
+    def visit_YieldFrom(self, node: ast.YieldFrom) -> ast.YieldFrom:  # noqa: N802
+        return self.visit_Yield(node)
+
+    @property
+    def source_code(self) -> str:
+        # files are only decoded when needed, since they are parsed from their bytes
+        if self._source_code is None:
+            self._source_code = self.source_buffer.decode()
+        return self._source_code
+
+    def finish(self) -> None:
+        self.report_missing_docstrings()
+        self.report_stale_docstrings()
+        # release any memory-mapping of the file, e.g., so it can be rewritten
+        self.source_buffer.close()
+
+    def get_copy_writer(self) -> Callable[[str], None] | None:
+        # visitors don't write anything
+        return None
+
     def process_file(self) -> None:
         self.visit(self.tree)
-        self.report_missing_docstrings()
+        self.finish()
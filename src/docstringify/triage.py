@@ -0,0 +1,222 @@
+"""Cheap checks to skip parsing files that only need their module docstring checked."""
+
+from __future__ import annotations
+
+import ast
+import io
+import re
+import tokenize
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .nodes.base import DocstringNode
+from .notebooks import is_notebook
+from .results import FileResult, MissingDocstring
+
+if TYPE_CHECKING:
+    from .exports import ExportIndex
+    from .filters import SymbolFilter
+    from .sources import SourceBuffer, SourceFile
+
+HEAD_SIZE = 2048
+# the @generated tag marks generated files in any comment of the header
+GENERATED_TAG = re.compile(r'^[ \t]*#.*@generated\b', re.MULTILINE)
+# other markers only count in the comments before the first statement
+GENERATED_HEADER_COMMENT = re.compile(
+    r'#\s*(?:(?:auto-?)?generated\b|.*\bdo not edit\b)', re.IGNORECASE
+)
+DEFINITION_KEYWORD = re.compile(r'\b(?:def|class)\b')
+SKIPPED_TOKEN_TYPES = (
+    tokenize.ENCODING,
+    tokenize.COMMENT,
+    tokenize.NL,
+    tokenize.NEWLINE,
+    tokenize.INDENT,
+    tokenize.DEDENT,
+)
+GENERATED = 'generated'
+NO_DEFINITIONS = 'no definitions'
+
+
+def is_generated(head: str) -> bool:
+    """
+    Check whether the header of a file marks it as generated.
+
+    Parameters
+    ----------
+    head : str
+        The beginning of the file.
+
+    Returns
+    -------
+    bool
+        Whether a comment in the header contains ``@generated``, or a comment before
+        the first statement starts with ``generated`` or ``autogenerated`` (e.g.,
+        ``# Generated by the protocol buffer compiler.``) or says ``DO NOT EDIT``.
+    """
+    head = head[:HEAD_SIZE]
+    if GENERATED_TAG.search(head):
+        return True
+    for line in head.splitlines():
+        if not (line := line.strip()):
+            continue
+        if not line.startswith('#'):
+            return False
+        if GENERATED_HEADER_COMMENT.match(line):
+            return True
+    return False
+
+
+def has_definitions(source_code: str) -> bool:
+    """
+    Check whether a file defines any classes or functions.
+
+    A fast search for the ``def`` and ``class`` keywords rules out most files without
+    definitions; otherwise, the file is tokenized up to the first definition, so that
+    the keywords in strings and comments are ignored.
+
+    Parameters
+    ----------
+    source_code : str
+        The source code.
+
+    Returns
+    -------
+    bool
+        Whether the ``def`` or ``class`` keywords appear in the code.
+    """
+    if not DEFINITION_KEYWORD.search(source_code):
+        return False
+    return any(
+        token.type == tokenize.NAME and token.string in ('def', 'class')
+        for token in tokenize.generate_tokens(io.StringIO(source_code).readline)
+    )
+
+
+def _parse_first_statement(source_code: str) -> ast.Module:
+    tokens = tokenize.generate_tokens(io.StringIO(source_code).readline)
+    for token in tokens:
+        if token.type in SKIPPED_TOKEN_TYPES:
+            continue
+        if token.type != tokenize.STRING:
+            # anything else can't start a docstring
+            return ast.Module(body=[], type_ignores=[])
+        break
+
+    end_line = 0
+    for token in tokens:
+        end_line = token.end[0]
+        if token.type in (tokenize.NEWLINE, tokenize.ENDMARKER):
+            break
+    return ast.parse(''.join(source_code.splitlines(keepends=True)[:end_line]))
+
+
+class Triage:
+    """
+    Fast paths for files that only need their module docstring checked, which is
+    done without building the AST of the entire file.
+
+    Parameters
+    ----------
+    symbol_filter : SymbolFilter | None, default=None
+        The filter deciding whether the module docstring is inspected.
+    export_index : ExportIndex | None, default=None
+        The index deciding whether the module is public, when only the public API is
+        inspected.
+    """
+
+    def __init__(
+        self,
+        symbol_filter: SymbolFilter | None = None,
+        export_index: ExportIndex | None = None,
+    ) -> None:
+        self.symbol_filter = symbol_filter or None
+        self.export_index = export_index
+        self.counts: Counter[str] = Counter()
+
+    def check(
+        self,
+        source: SourceFile,
+        source_code: str | None = None,
+        source_buffer: SourceBuffer | None = None,
+    ) -> FileResult | None:
+        """
+        Check the module docstring of a file that is generated or doesn't define any
+        classes or functions.
+
+        Parameters
+        ----------
+        source : SourceFile
+            The source file.
+        source_code : str | None, default=None
+            The source code, if it was already loaded; otherwise, the file is read,
+            stopping after its head if it is generated.
+        source_buffer : SourceBuffer | None, default=None
+            The raw source code, if it was already read (e.g., to hash it), which is
+            decoded instead of reading the file again.
+
+        Returns
+        -------
+        FileResult | None
+            The result for the file, if it took one of the fast paths, or ``None`` if
+            it needs to be processed in full.
+        """
+        if is_notebook(source.filename):
+            return None
+
+        if source_code is None and source_buffer is not None:
+            head = source_buffer.decode(HEAD_SIZE)
+            source_code = head if is_generated(head) else source_buffer.decode()
+        elif source_code is None:
+            with tokenize.open(Path(source.filename).expanduser()) as file:
+                head = file.read(HEAD_SIZE)
+                # a module docstring cut off by the head falls back to the full parse
+                source_code = head if is_generated(head) else head + file.read()
+
+        try:
+            if is_generated(source_code):
+                fast_path = GENERATED
+            elif not has_definitions(source_code):
+                fast_path = NO_DEFINITIONS
+            else:
+                return None
+            module = _parse_first_statement(source_code)
+        except (SyntaxError, tokenize.TokenError):
+            # let the full parse report the error
+            return None
+
+        module_name = source.module_name or Path(source.filename).stem
+        self.counts[fast_path] += 1
+
+        if (
+            self.symbol_filter
+            and (
+                self.symbol_filter.ignores_module_docstring
+                or self.symbol_filter.excludes(module, None, depth=0, name=module_name)
+            )
+        ) or (
+            self.export_index
+            and not self.export_index.get_exports(
+                module_name,
+                module,
+                path=(
+                    Path(source.filename).expanduser().resolve()
+                    if source.load is None
+                    else None
+                ),
+            ).public
+        ):
+            return FileResult(source.filename, 0, ())
+
+        docstring_node = DocstringNode(module, module_name, source_code)
+        missing = docstring_node.docstring_required and not docstring_node.docstring
+        return FileResult(
+            source.filename,
+            docstrings_inspected=1,
+            missing_docstrings=(
+                (MissingDocstring(module_name, docstring_node.signature_hash),)
+                if missing
+                else ()
+            ),
+        )
@@ -0,0 +1,59 @@
+"""Shared fixtures for the tests."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+
+import pytest
+
+# files with one missing docstring each under src/, and none under lib/
+PROJECT_FILES = {
+    **{f'src/a{i}.py': '"""Module."""\n\n\ndef f():\n    pass\n' for i in range(3)},
+    **{f'lib/b{i}.py': '"""Module."""\n' for i in range(3)},
+}
+
+
+@pytest.fixture
+def write_files(tmp_path, monkeypatch):
+    """Work in an empty directory, returning a function writing files into it."""
+    monkeypatch.chdir(tmp_path)
+
+    def write(files: dict[str, str]) -> list[str]:
+        for name, contents in files.items():
+            path = tmp_path / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(contents)
+        return sorted(files)
+
+    return write
+
+
+@pytest.fixture
+def project(write_files):
+    """The filenames of a small project, written to the working directory."""
+    return write_files(PROJECT_FILES)
+
+
+@pytest.fixture
+def git_project(project):
+    """The filenames of a small project committed to a git repository."""
+    if shutil.which('git') is None:
+        pytest.skip('git is not installed')
+
+    def git(*args: str) -> None:
+        subprocess.run(['git', *args], check=True, capture_output=True)
+
+    git('init', '--quiet')
+    git('add', *project)
+    git(
+        '-c',
+        'user.name=Test',
+        '-c',
+        'user.email=test@example.com',
+        'commit',
+        '--quiet',
+        '--message',
+        'Add the project',
+    )
+    return project
@@ -0,0 +1,80 @@
+"""Test tolerating the missing docstrings recorded in a baseline."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from docstringify.baseline import Baseline
+from docstringify.cli import main
+from docstringify.exceptions import BaselineFormatError
+
+UNDOCUMENTED = '"""Module."""\n\n\ndef f(x):\n    pass\n'
+DOCUMENTED = '"""Module."""\n\n\ndef f(x):\n    """Function."""\n'
+
+
+def _entries(path: str) -> list[str]:
+    return Path(path).read_text().splitlines()[1:]
+
+
+def test_baseline_is_recorded(write_files, capsys):
+    """Test that the first run records all the missing docstrings and passes."""
+    files = write_files({'a/utils.py': UNDOCUMENTED, 'b/utils.py': UNDOCUMENTED})
+    assert main(['--baseline', 'baseline.txt', *files]) == 0
+    assert _entries('baseline.txt') == ['a/utils.py::utils.f', 'b/utils.py::utils.f']
+    assert 'Recorded 2 missing docstring(s)' in capsys.readouterr().out
+
+
+def test_baseline_tolerates_recorded_symbols_only(write_files, capsys):
+    """Test that only the missing docstrings not in the baseline fail the run."""
+    files = write_files({'a/utils.py': UNDOCUMENTED})
+    main(['--baseline', 'baseline.txt', *files])
+    capsys.readouterr()
+
+    # the same module name in another directory isn't tolerated
+    files += write_files({'b/utils.py': UNDOCUMENTED})
+    assert main(['--baseline', 'baseline.txt', *files]) == 1
+    assert (
+        'utils.f is missing a docstring and is not in the baseline'
+        in capsys.readouterr().err
+    )
+
+
+def test_update_baseline_only_shrinks_processed_files(write_files):
+    """Test that updating drops the documented symbols of the files processed."""
+    files = write_files(
+        {'a/utils.py': UNDOCUMENTED, 'b/utils.py': UNDOCUMENTED, 'c.py': UNDOCUMENTED}
+    )
+    main(['--baseline', 'baseline.txt', *files])
+
+    write_files({'b/utils.py': DOCUMENTED, 'c.py': DOCUMENTED})
+    assert main(['--baseline', 'baseline.txt', '--update-baseline', 'b/utils.py']) == 0
+    assert _entries('baseline.txt') == ['a/utils.py::utils.f', 'c.py::c.f']
+
+
+def test_baseline_signatures(write_files):
+    """Test that symbols whose signatures change are no longer tolerated."""
+    files = write_files({'example.py': UNDOCUMENTED})
+    main(['--baseline', 'baseline.txt', '--baseline-signatures', *files])
+    assert main(['--baseline', 'baseline.txt', *files]) == 0
+
+    write_files({'example.py': UNDOCUMENTED.replace('f(x)', 'f(x, y)')})
+    assert main(['--baseline', 'baseline.txt', *files]) == 1
+
+
+def test_baseline_unsupported_format(tmp_path):
+    """Test that baselines in another format are rejected."""
+    path = tmp_path / 'baseline.txt'
+    path.write_text('utils.f\n')
+    with pytest.raises(BaselineFormatError):
+        Baseline.load(path)
+
+
+def test_baseline_matches_git_files(git_project):
+    """Test that files read from git match the baseline by their repository path."""
+    assert main(['--baseline', 'baseline.txt', *git_project]) == 0
+    assert main(['--baseline', 'baseline.txt', '--git-rev', 'HEAD', *git_project]) == 0
+
+    main(['--git-rev', 'HEAD', '--emit-partial', 'partial.json', *git_project])
+    assert main(['merge', '--baseline', 'baseline.txt', 'partial.json']) == 0
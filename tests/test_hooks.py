@@ -0,0 +1,113 @@
+"""Test loading hooks and dispatching events to them."""
+
+from __future__ import annotations
+
+import sys
+import uuid
+
+import pytest
+
+from docstringify.cli import main
+from docstringify.exceptions import HookLoadError
+from docstringify.hooks import Hook, HookDispatcher, load_hook
+
+HOOK_MODULE = """\
+from docstringify.hooks import Hook
+
+EVENTS = []
+
+
+class RecordingHook(Hook):
+    def on_file_start(self, filename):
+        EVENTS.append(('on_file_start', filename))
+
+    def on_missing(self, docstring_node):
+        EVENTS.append(('on_missing', docstring_node.fully_qualified_name))
+
+    def on_run_done(self, results, errors):
+        EVENTS.append(('on_run_done', len(results)))
+
+
+def on_file_done(result):
+    EVENTS.append(('on_file_done', result.filename))
+"""
+
+
+class NodeHook(Hook):
+    def on_node(self, docstring_node):
+        pass
+
+
+@pytest.fixture
+def hook_module(write_files, monkeypatch):
+    """Write a hook module to the working directory, returning its name."""
+    name = f'hook_{uuid.uuid4().hex}'
+    write_files({f'{name}.py': HOOK_MODULE})
+    # undo adding the working directory to the path and importing the module
+    monkeypatch.setattr(sys, 'path', list(sys.path))
+    yield name
+    sys.modules.pop(name, None)
+
+
+def test_load_hook_class(hook_module):
+    """Test that classes are loaded from the working directory and instantiated."""
+    hook = load_hook(f'{hook_module}:RecordingHook')
+    assert type(hook).__name__ == 'RecordingHook'
+
+
+def test_load_hook_module(hook_module):
+    """Test that modules are used as hooks as is."""
+    hook = load_hook(hook_module)
+    assert hook is sys.modules[hook_module]
+
+
+@pytest.mark.parametrize(
+    ('spec', 'match'),
+    [
+        ('missing_hook_module', 'No module named'),
+        ('{module}:Missing', 'has no attribute'),
+        ('{module}:EVENTS', 'expected a handler'),
+    ],
+    ids=['missing module', 'missing attribute', 'no handlers'],
+)
+def test_load_hook_invalid(hook_module, spec, match):
+    """Test that specs not providing a hook are rejected."""
+    with pytest.raises(HookLoadError, match=match):
+        load_hook(spec.format(module=hook_module))
+
+
+def test_dispatcher_resolves_events():
+    """Test that each event is resolved once, depending on the hooks handling it."""
+    first, second = NodeHook(), NodeHook()
+
+    assert HookDispatcher([Hook()]).on_node is None
+    assert HookDispatcher([first]).on_node == first.on_node
+
+    calls = []
+    first.on_node = lambda node: calls.append(('first', node))
+    second.on_node = lambda node: calls.append(('second', node))
+    HookDispatcher([first, second]).on_node('node')
+    assert calls == [('first', 'node'), ('second', 'node')]
+
+
+def test_hooks_observe_run(hook_module, write_files):
+    """Test that the events of a run are dispatched to the hooks from the CLI."""
+    write_files({'example.py': '"""Module."""\n\n\ndef f():\n    pass\n'})
+    assert (
+        main(
+            [
+                '--hook',
+                f'{hook_module}:RecordingHook',
+                '--hook',
+                hook_module,
+                'example.py',
+            ]
+        )
+        == 1
+    )
+    assert sys.modules[hook_module].EVENTS == [
+        ('on_file_start', 'example.py'),
+        ('on_missing', 'example.f'),
+        ('on_file_done', 'example.py'),
+        ('on_run_done', 1),
+    ]
@@ -0,0 +1,102 @@
+"""Test processing the code cells of Jupyter notebooks."""
+
+from __future__ import annotations
+
+import ast
+import json
+from pathlib import Path
+
+import pytest
+
+from docstringify.cli import main
+from docstringify.notebooks import Notebook
+
+
+def _code_cell(source: str, outputs: list | None = None) -> dict:
+    return {
+        'cell_type': 'code',
+        'execution_count': None,
+        'metadata': {},
+        'outputs': outputs or [],
+        'source': source.splitlines(keepends=True),
+    }
+
+
+def _notebook(*cells: dict) -> dict:
+    return {'cells': list(cells), 'metadata': {}, 'nbformat': 4, 'nbformat_minor': 5}
+
+
+@pytest.mark.parametrize(
+    ('source', 'expected'),
+    [
+        ('%matplotlib inline\nx = 1', 'pass\nx = 1'),
+        ('!pip install numpy\nfiles = !ls', 'pass\npass'),
+        ('len?\nx = 1', 'pass\nx = 1'),
+        ('x = (a\n    % b)', 'x = (a\n    % b)'),
+        ('if (x\n        != y):\n    !ls', 'if (x\n        != y):\n    pass'),
+        ('x = 5 \\\n    % 2', 'x = 5 \\\n    % 2'),
+        ('s = """\n%not a magic\n"""\n%time f()', 's = """\n%not a magic\n"""\npass'),
+        ('d = {"(": 1}  # )\n%who', 'd = {"(": 1}  # )\npass'),
+        ('%%bash\necho hi', '\n'),
+    ],
+    ids=[
+        'line magic',
+        'shell commands',
+        'help',
+        'continuation in brackets',
+        'continuation in condition',
+        'backslash continuation',
+        'multi-line string',
+        'brackets in strings and comments',
+        'cell magic',
+    ],
+)
+def test_magics_are_masked(source, expected):
+    """Test that only the magics starting a logical line are replaced."""
+    notebook = Notebook(_notebook(_code_cell(source)))
+    assert notebook.source_code == expected
+    ast.parse(notebook.source_code)
+
+
+def test_missing_docstrings_are_located(write_files, capsys):
+    """Test that missing docstrings are reported with their cell and line."""
+    content = _notebook(
+        {'cell_type': 'markdown', 'metadata': {}, 'source': ['# Analysis']},
+        _code_cell('"""Analysis."""\n%matplotlib inline'),
+        _code_cell('x = 1\n\n\ndef clean(data):\n    return data\n'),
+    )
+    write_files({'analysis.ipynb': json.dumps(content)})
+
+    assert main(['analysis.ipynb']) == 1
+    assert (
+        'analysis.ipynb:cell 3:line 4: analysis.clean is missing a docstring'
+        in capsys.readouterr().err
+    )
+
+
+def test_notebook_edits(write_files):
+    """Test that docstrings are inserted into the right cells, keeping the rest."""
+    outputs = [{'name': 'stdout', 'output_type': 'stream', 'text': ['hi\n']}]
+    markdown = {'cell_type': 'markdown', 'metadata': {}, 'source': ['# Analysis']}
+    content = _notebook(
+        markdown,
+        _code_cell('%matplotlib inline\nimport math', outputs=outputs),
+        _code_cell('def area(radius: float) -> float:\n    return math.pi * radius**2'),
+    )
+    write_files({'analysis.ipynb': json.dumps(content)})
+
+    main(['--make-changes-inplace', 'numpydoc', 'analysis.ipynb'])
+    cells = json.loads(Path('analysis.ipynb').read_text(encoding='utf-8'))['cells']
+
+    assert cells[0] == markdown
+    assert cells[1]['outputs'] == outputs
+    module_source = ''.join(cells[1]['source'])
+    assert module_source.startswith('"""')
+    assert module_source.endswith('%matplotlib inline\nimport math')
+
+    function = ast.parse(''.join(cells[2]['source'])).body[0]
+    assert 'radius : float' in ast.get_docstring(function)
+    assert 'float' in ast.get_docstring(function).split('Returns')[1]
+
+    # the edited notebook has nothing missing anymore
+    assert main(['analysis.ipynb']) == 0
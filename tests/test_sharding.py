@@ -0,0 +1,165 @@
+"""Test sharding runs and merging their partial results."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from docstringify.cli import main
+from docstringify.exceptions import (
+    DuplicateShardError,
+    IncompleteShardsError,
+    InvalidShardError,
+    MismatchedShardCountsError,
+    MixedPartialsError,
+    MixedPartialSourcesError,
+    PartialResultsFormatError,
+)
+from docstringify.results import FileResult
+from docstringify.sharding import (
+    GIT_SOURCE,
+    Shard,
+    read_partials,
+    write_partial,
+)
+
+
+def _result(filename: str) -> FileResult:
+    return FileResult(filename, 1, (), ())
+
+
+def _gate_lines(capsys) -> list[str]:
+    # the lines reporting how the results compare to the thresholds
+    captured = capsys.readouterr()
+    return [
+        line
+        for line in (captured.out + captured.err).splitlines()
+        if 'require' in line or line.startswith('Missing ')
+    ]
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'), [('1/1', Shard(1, 1)), ('2/3', Shard(2, 3))]
+)
+def test_shard_from_string(value, expected):
+    """Test that shards are parsed from i/n."""
+    assert Shard.from_string(value) == expected
+
+
+@pytest.mark.parametrize('value', ['0/2', '3/2', '1', 'a/b', '1/0'])
+def test_shard_from_string_invalid(value):
+    """Test that invalid shards are rejected."""
+    with pytest.raises(InvalidShardError):
+        Shard.from_string(value)
+
+
+def test_shards_partition_files():
+    """Test that every file belongs to exactly one shard."""
+    filenames = [f'pkg/module_{i}.py' for i in range(50)]
+    selected = [
+        filename
+        for index in range(1, 4)
+        for filename in Shard(index, 3).select(filenames)
+    ]
+    assert sorted(selected) == sorted(filenames)
+
+
+def test_read_partials(tmp_path):
+    """Test that the partials of all shards are combined."""
+    paths = [tmp_path / 'shard-1.json', tmp_path / 'shard-2.json']
+    write_partial(paths[0], [_result('a.py')], shard=Shard(1, 2))
+    write_partial(
+        paths[1],
+        [_result('b.py')],
+        shard=Shard(2, 2),
+        uncovered_files=['c.py'],
+    )
+
+    merged = read_partials(paths)
+    assert [result.filename for result in merged.results] == ['a.py', 'b.py']
+    assert merged.errors == []
+    assert merged.uncovered_files == ['c.py']
+    assert merged.source is None
+
+
+@pytest.mark.parametrize(
+    ('shards', 'error'),
+    [
+        ([Shard(1, 2), Shard(1, 2)], DuplicateShardError),
+        ([Shard(1, 2), None], MixedPartialsError),
+        ([Shard(1, 3), Shard(2, 3)], IncompleteShardsError),
+        ([Shard(1, 2), Shard(2, 3)], MismatchedShardCountsError),
+    ],
+    ids=['duplicated', 'mixed', 'incomplete', 'mismatched'],
+)
+def test_read_partials_invalid_shards(tmp_path, shards, error):
+    """Test that the partials must cover each shard exactly once."""
+    paths = []
+    for index, shard in enumerate(shards):
+        paths.append(tmp_path / f'partial-{index}.json')
+        write_partial(paths[-1], [_result(f'file_{index}.py')], shard=shard)
+
+    with pytest.raises(error):
+        read_partials(paths)
+
+
+def test_read_partials_mixed_sources(tmp_path):
+    """Test that partials must read the files from the same place."""
+    paths = [tmp_path / 'disk.json', tmp_path / 'git.json']
+    write_partial(paths[0], [_result('a.py')])
+    write_partial(paths[1], [_result('HEAD:b.py')], source=GIT_SOURCE)
+
+    with pytest.raises(MixedPartialSourcesError):
+        read_partials(paths)
+
+
+def test_read_partials_unsupported_version(tmp_path):
+    """Test that partials in another format are rejected."""
+    path = tmp_path / 'partial.json'
+    path.write_text(json.dumps({'version': 1, 'shard': None, 'files': []}))
+
+    with pytest.raises(PartialResultsFormatError):
+        read_partials([path])
+
+
+@pytest.mark.parametrize('git', [False, True], ids=['disk', 'git'])
+@pytest.mark.parametrize(
+    'gate_options',
+    [[], ['--threshold', '0.5'], ['--path-threshold', 'src/=0']],
+    ids=['default', 'threshold', 'path-threshold'],
+)
+def test_merge_matches_single_run(request, capsys, git, gate_options):
+    """Test that merging the shards checks the results like a single run."""
+    files = request.getfixturevalue('git_project' if git else 'project')
+    source_options = ['--git-rev', 'HEAD'] if git else []
+
+    single_exit_code = main([*source_options, *gate_options, *files])
+    single_gate_lines = _gate_lines(capsys)
+
+    partials = []
+    for index in (1, 2):
+        partials.append(f'shard-{index}.json')
+        main(
+            [
+                *source_options,
+                '--shard',
+                f'{index}/2',
+                '--emit-partial',
+                partials[-1],
+                *files,
+            ]
+        )
+    capsys.readouterr()
+
+    assert main(['merge', *gate_options, *partials]) == single_exit_code
+    assert _gate_lines(capsys) == single_gate_lines
+
+
+def test_merge_fails_on_uncovered_files(project, tmp_path, capsys):
+    """Test that merge fails when a shard didn't check all its files."""
+    partial = tmp_path / 'partial.json'
+    write_partial(partial, [_result(project[0])], uncovered_files=project[1:])
+
+    assert main(['merge', '--threshold', '0', str(partial)]) == 1
+    assert f'{len(project) - 1} file(s) were not checked' in capsys.readouterr().err
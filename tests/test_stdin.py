@@ -0,0 +1,60 @@
+"""Test reading the code from standard input and streaming it back out."""
+
+from __future__ import annotations
+
+import ast
+import io
+import sys
+
+import pytest
+
+from docstringify.cli import main
+
+DOCUMENTED = '"""Module."""\r\n\r\n\r\ndef f():\r\n    """Function."""\r\n'
+
+
+@pytest.fixture
+def stdin(monkeypatch):
+    """Return a function piping bytes to standard input."""
+
+    def pipe(data: bytes) -> None:
+        monkeypatch.setattr(sys, 'stdin', io.TextIOWrapper(io.BytesIO(data)))
+
+    return pipe
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        DOCUMENTED.encode(),
+        '# -*- coding: latin-1 -*-\n"""Café."""\n'.encode('latin-1'),
+        b'\xef\xbb\xbf"""Module with a BOM."""\n',
+    ],
+    ids=['crlf', 'latin-1', 'bom'],
+)
+def test_unchanged_code_passes_through(stdin, capsysbinary, data):
+    """Test that the input is written back byte for byte if nothing is missing."""
+    stdin(data)
+    assert main(['--make-changes', 'numpydoc', '-']) == 0
+    assert capsysbinary.readouterr().out == data
+
+
+def test_edited_code_keeps_encoding(stdin, capsysbinary):
+    """Test that the edited code is written in the encoding of the input."""
+    stdin(
+        '# -*- coding: latin-1 -*-\n"""Café."""\n\n\ndef f():\n    pass\n'.encode(
+            'latin-1'
+        )
+    )
+    assert main(['--make-changes', 'numpydoc', '-']) == 1
+
+    tree = ast.parse(capsysbinary.readouterr().out)
+    assert ast.get_docstring(tree) == 'Café.'
+    assert ast.get_docstring(tree.body[1]) is not None
+
+
+def test_stdin_filename(stdin, capsys):
+    """Test that the code is reported under the name provided."""
+    stdin(b'def f():\n    pass\n')
+    assert main(['--stdin-filename', 'pkg/utils.py', '-']) == 1
+    assert 'utils.f is missing a docstring' in capsys.readouterr().err
@@ -0,0 +1,110 @@
+"""Test the docstring converter driven by user-defined templates."""
+
+from __future__ import annotations
+
+import ast
+
+import pytest
+
+from docstringify.converters import load_template_converter
+from docstringify.converters.template import (
+    CompiledTemplates,
+    compile_template,
+    parse_templates,
+)
+from docstringify.exceptions import InvalidTemplateError
+from docstringify.nodes.base import DocstringNode
+from docstringify.nodes.function import FunctionDocstringNode
+
+HOUSE_STYLE = """\
+Lines before the first template are comments.
+[function]
+{description}
+
+{parameters}
+
+{returns}
+[parameters_section]
+Args:
+{parameters}
+[parameter]
+    {name} ({type}{category}{default}): {description}
+[default]
+, defaults to {default}
+[returns_section]
+Returns:
+{returns}
+[return]
+    {type}: {description}
+"""
+
+
+def _function_node(source: str) -> FunctionDocstringNode:
+    module = ast.parse(source)
+    return FunctionDocstringNode(
+        module.body[0],
+        'example',
+        source,
+        parent=DocstringNode(module, 'example', source),
+    )
+
+
+def test_compile_template():
+    """Test that the fields are rendered, and doubled braces kept as literals."""
+    render = compile_template('parameter', '{name} : {type}{default} {{literal}}')
+    assert render('x', 'int', '', ', default=1', '') == 'x : int, default=1 {literal}'
+
+
+@pytest.mark.parametrize(
+    ('templates', 'match'),
+    [
+        ('[parameter]\n{name', 'unbalanced braces'),
+        ('[parameter]\n{unknown}', r'unsupported field \{unknown\}'),
+        ('[parameter]\n{name!r}', r'unsupported field \{name\}'),
+        ('[parameter]\n{name:>10}', r'unsupported field \{name\}'),
+        ('[module]\n{parameters}', r'unsupported field \{parameters\}'),
+        ('[parameters_section]\nArgs:', r'missing the \{parameters\} field'),
+        ('[returns_section]\nReturns:', r'missing the \{returns\} field'),
+        ('no templates here', 'no templates found'),
+    ],
+)
+def test_invalid_templates(templates, match):
+    """Test that invalid templates are rejected before anything is rendered."""
+    with pytest.raises(InvalidTemplateError, match=match):
+        CompiledTemplates.from_templates(parse_templates(templates))
+
+
+def test_parse_templates_defaults():
+    """Test that the templates that aren't provided follow the numpydoc style."""
+    templates = parse_templates('[module]\n{description}\n\n')
+    assert templates['module'] == '{description}'
+    assert templates['parameters_section'].startswith('Parameters\n----------')
+
+
+def test_template_converter(tmp_path):
+    """Test that function docstrings follow the templates."""
+    path = tmp_path / 'house_style.txt'
+    path.write_text(HOUSE_STYLE)
+    converter = load_template_converter(path)(quote=False)
+
+    docstring = converter.suggest_docstring(
+        _function_node('def f(x: int, y: str = "a") -> bool:\n    pass\n')
+    )
+    assert docstring == (
+        '\n__description__\n\n'
+        'Args:\n'
+        '    x (int): __description__\n'
+        '    y (str, defaults to "a"): __description__\n\n'
+        'Returns:\n'
+        '    bool: __description__\n'
+    )
+
+
+def test_template_converter_drops_empty_sections(tmp_path):
+    """Test that the lines of sections with nothing to document are dropped."""
+    path = tmp_path / 'house_style.txt'
+    path.write_text(HOUSE_STYLE)
+    converter = load_template_converter(path)(quote=False)
+
+    docstring = converter.suggest_docstring(_function_node('def f():\n    pass\n'))
+    assert docstring == '__description__'